@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('about', '0006_remove_teammember_email_remove_teammember_expertise_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['is_active', 'order'], name='about_service_act_ord_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(fields=['is_active', 'order'], name='about_team_act_ord_idx'),
+        ),
+    ]
@@ -106,6 +106,9 @@ class Service(AutoOrderMixin, SEOImageMixin, models.Model):
         verbose_name = "Hizmet"
         verbose_name_plural = "Hizmetler"
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['is_active', 'order'], name='about_service_act_ord_idx'),
+        ]
 
     def clean(self):
         super().clean()
@@ -172,6 +175,9 @@ class TeamMember(AutoOrderMixin, SEOImageMixin, models.Model):
         verbose_name = "Ekip Üyesi"
         verbose_name_plural = "Ekip Üyeleri"
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['is_active', 'order'], name='about_team_act_ord_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -4,13 +4,15 @@ from django.http import Http404
 from .models import About, Service, TeamMember
 from dashboard.models import MediaMention
 from django.core.paginator import Paginator
+from core import identity
+from core.singletons import get_about
 
 
 def about(request):
     """Ana hakkımızda sayfası - İlk About kaydını getirir"""
     
     try:
-        about = About.objects.first()
+        about = get_about()  # Worker içi kopya (core.singletons)
         if not about:
             # Varsayılan değerlerle oluştur
             about = About.objects.create(
@@ -91,7 +93,7 @@ def services(request):
 
 def service_detail(request, slug):
     """Belirli bir hizmet detayı"""
-    service = get_object_or_404(Service, slug=slug, is_active=True)
+    service = identity.get_object_or_404(request, Service, slug=slug, is_active=True)
     
     # İlgili diğer hizmetler
     related_services = Service.objects.filter(
@@ -123,7 +125,7 @@ def team(request):
 
 def team_detail(request, slug):
     """Belirli bir ekip üyesi detayı"""
-    team_member = get_object_or_404(TeamMember, slug=slug, is_active=True)
+    team_member = identity.get_object_or_404(request, TeamMember, slug=slug, is_active=True)
     
     # Diğer ekip üyeleri
     other_members = TeamMember.objects.filter(
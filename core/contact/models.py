@@ -21,6 +21,10 @@ class Contact(models.Model):
         verbose_name = "İletişim Mesajı"
         verbose_name_plural = "İletişim Mesajları"
         ordering = ['-created_at']
+        indexes = [
+            # Okunmamış mesajlar, dashboard mesaj listesi (is_read, -created_at)
+            models.Index(fields=['is_read', '-created_at'], name='contact_read_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.subject}"   
\ No newline at end of file
@@ -1,7 +1,7 @@
 # contact/signals.py
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.core.cache import cache
+from core import cachetags
 from .models import Contact
 import logging
 
@@ -35,9 +35,8 @@ def update_statistics_on_contact(sender, instance, created, **kwargs):
             completed_jobs=F('completed_jobs') + 1
         )
 
-        # Cache'i temizle
-        cache.delete('about_info')
-        cache.delete('site_settings')
+        # update() sinyal tetiklemez - About cache etiketleri elle yenilenir
+        cachetags.invalidate(About)
 
         logger.info(
             f"İstatistikler güncellendi (iletişim): "
@@ -67,9 +66,8 @@ def update_statistics_on_contact_delete(sender, instance, **kwargs):
             completed_jobs=F('completed_jobs') - 1
         )
 
-        # Cache'i temizle
-        cache.delete('about_info')
-        cache.delete('site_settings')
+        # update() sinyal tetiklemez - About cache etiketleri elle yenilenir
+        cachetags.invalidate(About)
 
         logger.info("İletişim mesajı silindi, istatistikler güncellendi")
 
@@ -1,20 +1,13 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django_ratelimit.decorators import ratelimit
+from core.client_ip import get_client_ip
+from core.ratelimit import ratelimit
 from .forms import ContactForm
 from reviews.forms import ReviewForm
 from reviews.models import Review
 from django.utils.translation import gettext as _
 
-def get_client_ip(request):
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
-
 @ratelimit(key='ip', rate='10/m', method='POST', block=True)
 def contact(request):
     reviews = Review.objects.filter(is_approved=True).order_by('-created_at')[:5]
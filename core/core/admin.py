@@ -15,7 +15,7 @@ from django.contrib.auth.forms import AuthenticationForm
 from captcha.fields import CaptchaField
 from django.utils.translation import gettext_lazy as _
 from django.contrib import admin
-from .models import LegalPage, CookieConsent
+from .models import LegalPage, CookieConsent, Redirect, NotFoundStat
 
 class SiteSettingsForm(ModelForm):
     """Site ayarları için özel form"""
@@ -301,4 +301,36 @@ class CookieConsentAdmin(admin.ModelAdmin):
         if obj.analytics_cookies: types.append("Analitik")
         if obj.marketing_cookies: types.append("Pazarlama")
         return ", ".join(types)
-    consent_summary.short_description = "Kabul Edilen Türler"
\ No newline at end of file
+    consent_summary.short_description = "Kabul Edilen Türler"
+
+
+@admin.register(Redirect)
+class RedirectAdmin(admin.ModelAdmin):
+    list_display = ('old_path', 'new_path', 'match_type', 'status_code', 'source', 'is_active', 'created_at')
+    list_filter = ('match_type', 'status_code', 'source', 'is_active')
+    search_fields = ('old_path', 'new_path')
+    list_editable = ('is_active',)
+    readonly_fields = ('source', 'created_at')
+    
+    fieldsets = (
+        ('Yönlendirme', {
+            'fields': ('old_path', 'new_path', 'match_type', 'status_code', 'is_active')
+        }),
+        ('Bilgi', {
+            'fields': ('source', 'created_at'),
+            'classes': ('collapse',)
+        })
+    )
+
+
+@admin.register(NotFoundStat)
+class NotFoundStatAdmin(admin.ModelAdmin):
+    list_display = ('path', 'date', 'hits', 'last_seen')
+    list_filter = ('date',)
+    search_fields = ('path',)
+    date_hierarchy = 'date'
+    readonly_fields = ('path', 'date', 'hits', 'top_referrers', 'last_seen')
+    
+    def has_add_permission(self, request):
+        # Kayıtlar compact_404_errors tarafından oluşturulur
+        return False
@@ -9,4 +9,11 @@ class CoreConfig(AppConfig):
         try:
             import core.translation
         except ImportError:
-            pass
\ No newline at end of file
+            pass
+        
+        import core.checks  # System check'leri kaydet
+        import core.language  # Dil profili sürüm sinyalleri
+        import core.redirects  # Redirect index + slug geçmişi sinyalleri
+        import core.cachetags  # Cache etiketi geçersiz kılma sinyalleri
+        import core.singletons  # Worker içi singleton cache'i
+        import core.sitemapfiles  # Sitemap dosyalarını içerik değişince yeniden yaz
@@ -0,0 +1,322 @@
+# core/cachetags.py
+"""
+Etiket (tag) tabanlı cache geçersiz kılma
+
+Her cache kaydı bağlı olduğu modelleri/nesneleri bildirir; anahtar bu
+etiketlerin güncel sürümlerinden türetilir:
+
+    about_info = cachetags.get_or_set('about_info', [About], build, 600)
+    keywords = cachetags.get_or_set('internal_link_keywords', [Product, Category], build, 3600)
+
+Etiketler:
+    - Model etiketi: 'products.product' - modeldeki her kayıt/silme artırır
+    - Nesne etiketi: 'products.product:42' - sadece o nesne değişince artar
+    - SITE_TAG: izlenen uygulamalardaki her değişiklikte artar (sayfa cache'i)
+
+Takip edilen uygulamalardaki modeller kaydedilip silindiğinde (m2m dahil)
+etiket sürümleri transaction başına bir kez, commit sonrası yenilenir.
+Sürüm değişince eski anahtarlar bir daha okunmaz ve TTL ile düşer; hiçbir
+kodun anahtar adı hatırlayıp silmesi gerekmez. Sürüm, oluşturulduğu zamanı
+da taşır (last_bumped) - koşullu GET'te Last-Modified bağımlılıklardan türetilir.
+
+update()/bulk işlemler sinyal tetiklemez - bu durumlarda invalidate()
+açıkça çağrılır.
+"""
+import hashlib
+import logging
+import time
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import Signal, receiver
+from django.http import HttpResponse
+from django.utils import translation
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'tag:v:{tag}'
+SITE_TAG = 'site'
+PENDING_ATTR = '_cache_tags_pending'
+
+# Sürümler yenilendikten sonra gönderilir (tags=set) - süreç içi kopyalar için
+tags_invalidated = Signal()
+
+DEFAULTS = {
+    'CACHE_ALIAS': 'default',
+    # Sinyalleri izlenen uygulamalar - değişiklikler SITE_TAG'i de artırır
+    'TRACKED_APPS': ('core', 'home', 'products', 'gallery', 'about', 'contact', 'reviews', 'dashboard'),
+    # Sayfa içeriğini etkilemeyen modeller - SITE_TAG artırılmaz (ziyaretçi
+    # formları, çerez onayları ve dashboard'a özel kayıtlar sayfa cache'ini silmesin)
+    'SITE_EXCLUDED_MODELS': (
+        'core.redirect', 'core.notfoundstat', 'core.cookieconsent',
+        'contact.contact', 'dashboard.message', 'dashboard.notification',
+        'dashboard.dailystats', 'dashboard.activityevent', 'dashboard.dashboardtranslationsettings',
+    ),
+    'VERSION_TIMEOUT': None,  # Sürüm anahtarları kalıcı
+}
+
+
+def get_tag_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'CACHE_TAGS', {}))
+    return config
+
+
+def get_cache():
+    return caches[get_tag_settings()['CACHE_ALIAS']]
+
+
+# ========================
+# Etiketler
+# ========================
+
+def model_tag(model):
+    """Model sınıfı, nesne veya 'app_label.ModelName' -> 'app_label.modelname'"""
+    if isinstance(model, str):
+        return model.lower()
+    return model._meta.label_lower
+
+
+def instance_tag(instance):
+    return f'{instance._meta.label_lower}:{instance.pk}'
+
+
+def to_tags(dependencies):
+    """
+    Bağımlılık listesini etiketlere çevir
+
+    Model sınıfı -> model etiketi, model nesnesi -> nesne etiketi,
+    str -> olduğu gibi (örn. 'products.product' veya SITE_TAG)
+    """
+    tags = []
+    for dependency in dependencies:
+        if isinstance(dependency, str):
+            tags.append(dependency.lower())
+        elif isinstance(dependency, models.Model):
+            tags.append(instance_tag(dependency))
+        else:
+            tags.append(model_tag(dependency))
+    return tags
+
+
+def new_version():
+    """'<unix zamanı>-<rastgele>' - zaman kısmı last_bumped() için"""
+    return f'{time.time():.6f}-{uuid.uuid4().hex}'
+
+
+def version_time(version):
+    """Sürümün oluşturulma zamanı (unix) - eski biçimli sürümlerde None"""
+    try:
+        return float(str(version).split('-', 1)[0])
+    except ValueError:
+        return None
+
+
+def get_versions(tags):
+    """Etiketlerin güncel sürümleri - olmayanlar oluşturulur"""
+    cache = get_cache()
+    keys = {tag: VERSION_KEY.format(tag=tag) for tag in tags}
+    values = cache.get_many(list(keys.values()))
+
+    versions = {}
+    for tag, key in keys.items():
+        version = values.get(key)
+        if version is None:
+            # İlk kullanım / boşaltılmış cache - yarışı kaybeden kazananın sürümünü okur
+            version = new_version()
+            if not cache.add(key, version, get_tag_settings()['VERSION_TIMEOUT']):
+                version = cache.get(key) or version
+        versions[tag] = version
+    return versions
+
+
+def digest(versions):
+    """get_versions() çıktısından kısa özet"""
+    raw = '|'.join(f'{tag}={versions[tag]}' for tag in sorted(versions))
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def version_digest(dependencies):
+    """Bağımlılıkların sürümlerinden kısa özet - anahtarlara/template cache'e eklenir"""
+    return digest(get_versions(sorted(set(to_tags(dependencies)))))
+
+
+def last_bumped(versions):
+    """
+    get_versions() çıktısındaki en yeni sürümün zamanı (aware datetime)
+
+    Sürüm, etiketin son yenilenmesinden (veya ilk kullanımından / cache
+    boşalmasından) sonra oluşturulur; değer gerçek değişiklik zamanından
+    hiçbir zaman eski değildir. Zamanı okunamayan sürüm varsa None.
+    """
+    times = [version_time(version) for version in versions.values()]
+    if not times or None in times:
+        return None
+    return datetime.fromtimestamp(max(times), tz=dt_timezone.utc)
+
+
+def _base_key(name, parts):
+    suffix = ':'.join(str(part) for part in parts)
+    return f'{name}:{suffix}' if suffix else name
+
+
+def make_key(name, dependencies, *parts):
+    return f'{_base_key(name, parts)}:{version_digest(dependencies)}'
+
+
+# ========================
+# Cache erişimi
+# ========================
+
+def get_value(name, dependencies, default=None, parts=()):
+    return get_cache().get(make_key(name, dependencies, *parts), default)
+
+
+def set_value(name, dependencies, value, timeout, parts=()):
+    get_cache().set(make_key(name, dependencies, *parts), value, timeout)
+
+
+def get_or_set(name, dependencies, compute, timeout, parts=()):
+    """
+    Değer cache'te yoksa compute() ile üret ve sakla (core.stampede)
+
+    Anahtar bir kez hesaplanır; compute sırasında bağımlılık değişirse değer
+    eski sürüm anahtarına yazılır ve bir daha okunmaz. Sürüm değiştiğinde
+    yeniden hesaplamayı tek worker yapar, diğerleri son değeri sunar.
+    """
+    from . import stampede
+
+    base = _base_key(name, parts)
+    return stampede.get_or_compute(
+        make_key(name, dependencies, *parts), compute, timeout,
+        name=name, stale_key=f'stale:{base}', cache=get_cache(),
+    )
+
+
+def cache_view(timeout, dependencies):
+    """
+    View cache'i - anahtar dil, tam URL ve etiket sürümlerinden üretilir
+
+        path('sitemap.xml', cache_view(86400, [Product, Category])(sitemap), ...)
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+
+            from . import stampede
+
+            language = translation.get_language() or settings.LANGUAGE_CODE
+            raw_url = request.build_absolute_uri()
+            url_hash = hashlib.md5(raw_url.encode('utf-8')).hexdigest()
+            name = f'view:{view_func.__name__}'
+
+            def render():
+                response = view_func(request, *args, **kwargs)
+                if hasattr(response, 'render') and callable(response.render):
+                    response.render()
+                if response.status_code != 200 or response.streaming or response.cookies:
+                    return stampede.uncached(response)
+                headers = [
+                    (header, value) for header, value in response.items()
+                    if header.lower() not in ('set-cookie', 'content-length')
+                ]
+                return (response.content, headers)
+
+            entry = stampede.get_or_compute(
+                make_key(name, dependencies, language, url_hash), render, timeout,
+                name=name, stale_key=f'stale:{name}:{language}:{url_hash}', cache=get_cache(),
+            )
+            if not isinstance(entry, tuple):
+                return entry  # Saklanamayan response (hata, cookie)
+
+            content, headers = entry
+            response = HttpResponse(content)
+            for header, value in headers:
+                response[header] = value
+            return response
+        return _wrapped
+    return decorator
+
+
+# ========================
+# Geçersiz kılma
+# ========================
+
+def _bump(tags):
+    if not tags:
+        return
+    timeout = get_tag_settings()['VERSION_TIMEOUT']
+    try:
+        get_cache().set_many(
+            {VERSION_KEY.format(tag=tag): new_version() for tag in tags}, timeout
+        )
+    except Exception as e:
+        logger.error(f"Cache etiketleri yenilenemedi ({', '.join(sorted(tags))}): {e}")
+        return
+    tags_invalidated.send(sender=None, tags=frozenset(tags))
+
+
+class _PendingTags(set):
+    """Transaction boyunca biriken etiketler - commit sonrası tek seferde yenilenir"""
+
+    def __call__(self):
+        _bump(self)
+
+
+def invalidate(*dependencies, using=None):
+    """
+    Etiket sürümlerini yenile
+
+    Transaction içinde çağrılırsa etiketler biriktirilir ve commit sonrası tek
+    set_many ile yenilenir; rollback olursa hiçbir şey yapılmaz.
+    """
+    tags = to_tags(dependencies)
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        _bump(tags)
+        return
+
+    pending = getattr(connection, PENDING_ATTR, None)
+    # Rollback ile düşmüş bir callback'e etiket eklenmesin
+    scheduled = pending is not None and any(entry[1] is pending for entry in connection.run_on_commit)
+    if not scheduled:
+        pending = _PendingTags()
+        setattr(connection, PENDING_ATTR, pending)
+        transaction.on_commit(pending, using=using)
+    pending.update(tags)
+
+
+def tags_for_instance(instance):
+    config = get_tag_settings()
+    label = instance._meta.label_lower
+    tags = [label, instance_tag(instance)]
+    if label not in config['SITE_EXCLUDED_MODELS']:
+        tags.append(SITE_TAG)
+    return tags
+
+
+def is_tracked(sender):
+    meta = getattr(sender, '_meta', None)
+    return meta is not None and meta.app_label in get_tag_settings()['TRACKED_APPS']
+
+
+@receiver(post_save, dispatch_uid='cachetags_post_save')
+@receiver(post_delete, dispatch_uid='cachetags_post_delete')
+def model_changed(sender, instance, raw=False, using=None, **kwargs):
+    if raw or not is_tracked(sender):
+        return
+    invalidate(*tags_for_instance(instance), using=using)
+
+
+@receiver(m2m_changed, dispatch_uid='cachetags_m2m_changed')
+def relation_changed(sender, instance, action, using=None, **kwargs):
+    if not action.startswith('post_') or not is_tracked(type(instance)):
+        return
+    invalidate(*tags_for_instance(instance), using=using)
@@ -0,0 +1,67 @@
+# core/checks.py
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+HEADERS_MIDDLEWARE = 'core.middleware.SecurityHeadersMiddleware'
+
+# SecurityHeadersMiddleware ile aynı başlıkları tekrar yazan middleware'ler
+DUPLICATE_HEADER_MIDDLEWARE = {
+    'django.middleware.clickjacking.XFrameOptionsMiddleware': 'X-Frame-Options',
+    'core.middleware.SecurityMiddleware': 'X-Content-Type-Options, X-Frame-Options, X-XSS-Protection',
+}
+
+
+@register(Tags.security)
+def check_duplicate_security_headers(app_configs, **kwargs):
+    """
+    SecurityHeadersMiddleware aktifken aynı başlıkları yazan
+    middleware'leri raporla
+    """
+    middleware = list(getattr(settings, 'MIDDLEWARE', []))
+    if HEADERS_MIDDLEWARE not in middleware:
+        return []
+
+    warnings = []
+    for path, headers in DUPLICATE_HEADER_MIDDLEWARE.items():
+        if path in middleware:
+            warnings.append(Warning(
+                f'{path} güvenlik başlıklarını tekrar yazıyor ({headers}).',
+                hint=(
+                    f'{HEADERS_MIDDLEWARE} bu başlıkları zaten tek geçişte ekliyor; '
+                    f'{path} MIDDLEWARE listesinden kaldırılabilir.'
+                ),
+                id='core.W001',
+            ))
+
+    profiles = getattr(settings, 'CSP_PROFILES', {})
+    for route, profile in getattr(settings, 'CSP_ROUTE_PROFILES', {}).items():
+        if profile != 'default' and profile not in profiles:
+            warnings.append(Warning(
+                f"CSP_ROUTE_PROFILES['{route}'] tanımsız '{profile}' profiline işaret ediyor.",
+                hint='Profili CSP_PROFILES içine ekleyin.',
+                id='core.W002',
+            ))
+
+    return warnings
+
+
+@register(deploy=True)
+def check_sitemap_base_url(app_configs, **kwargs):
+    """
+    Production'da sitemap kök adresi ayarlanmalı - aksi halde sitemap
+    sunulamaz (istemcinin gönderdiği Host başlığı kullanılmaz)
+
+    `manage.py check --deploy` ile çalışır.
+    """
+    if settings.DEBUG:
+        return []
+
+    from .sitemapfiles import get_sitemap_files_settings
+
+    if get_sitemap_files_settings()['BASE_URL']:
+        return []
+    return [Error(
+        "SITEMAP_FILES['BASE_URL'] production'da boş olamaz.",
+        hint='SITEMAP_BASE_URL ortam değişkenini sitenin kök adresine (https://ornek.com) ayarlayın.',
+        id='core.E001',
+    )]
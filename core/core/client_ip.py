@@ -0,0 +1,103 @@
+# core/client_ip.py
+"""
+İstemci IP çözümleme - güvenilir proxy listesine göre
+
+X-Forwarded-For başlığı istek başına yalnızca bir kez ayrıştırılır ve sonuç
+istek üzerinde saklanır (request.client_ip / request.ip_address). Başlık
+sadece REMOTE_ADDR güvenilir bir proxy ise (TRUSTED_PROXY_CIDRS) dikkate
+alınır; zincir sağdan sola yürünerek ilk güvenilmeyen adres istemci kabul
+edilir. Böylece istemcinin kendi eklediği sahte XFF değerleri yok sayılır.
+
+IP nesneleri lru_cache ile interned ve doğrulanmış olarak döner; aynı IP'den
+gelen istekler aynı nesneyi paylaşır.
+"""
+import ipaddress
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# İstek üzerinde saklanan attribute'lar
+REQUEST_ATTRIBUTE = 'client_ip'
+REQUEST_STRING_ATTRIBUTE = 'ip_address'
+
+DEFAULT_TRUSTED_PROXY_CIDRS = ['127.0.0.1/32', '::1/128']
+
+
+@lru_cache(maxsize=4096)
+def parse_ip(value):
+    """String'i ipaddress nesnesine çevir - geçersizse None"""
+    if not value:
+        return None
+    value = value.strip()
+    # IPv6 köşeli parantez ve IPv4:port biçimleri
+    if value.startswith('['):
+        value = value[1:value.find(']')] if ']' in value else value[1:]
+    elif value.count(':') == 1:
+        value = value.split(':', 1)[0]
+    try:
+        return ipaddress.ip_address(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_trusted_networks():
+    """settings.TRUSTED_PROXY_CIDRS'i bir kez derle"""
+    cidrs = getattr(settings, 'TRUSTED_PROXY_CIDRS', DEFAULT_TRUSTED_PROXY_CIDRS)
+    return tuple(ipaddress.ip_network(cidr, strict=False) for cidr in cidrs)
+
+
+@lru_cache(maxsize=4096)
+def is_trusted_proxy(ip):
+    """IP güvenilir proxy ağlarından birinde mi?"""
+    return any(ip in network for network in get_trusted_networks())
+
+
+def _resolve(meta):
+    remote = parse_ip(meta.get('REMOTE_ADDR', ''))
+    forwarded_for = meta.get('HTTP_X_FORWARDED_FOR')
+
+    if remote is None or not forwarded_for or not is_trusted_proxy(remote):
+        return remote
+
+    # Sağdan sola: ilk güvenilmeyen adres gerçek istemcidir
+    client = remote
+    for value in reversed(forwarded_for.split(',')):
+        ip = parse_ip(value)
+        if ip is None:
+            break
+        client = ip
+        if not is_trusted_proxy(ip):
+            break
+    return client
+
+
+def resolve_client_ip(request):
+    """
+    İsteğin istemci IP nesnesini döndür (ipaddress.IPv4Address/IPv6Address
+    veya None). İlk çağrıda hesaplanır, sonrakiler istek üzerindeki değeri
+    kullanır.
+    """
+    try:
+        return request.__dict__[REQUEST_ATTRIBUTE]
+    except KeyError:
+        pass
+    ip = _resolve(request.META)
+    request.__dict__[REQUEST_ATTRIBUTE] = ip
+    request.__dict__[REQUEST_STRING_ATTRIBUTE] = str(ip) if ip is not None else ''
+    return ip
+
+
+def get_client_ip(request):
+    """İstemci IP'sini string olarak döndür (bulunamazsa boş string)"""
+    resolve_client_ip(request)
+    return request.__dict__[REQUEST_STRING_ATTRIBUTE]
+
+
+@receiver(setting_changed)
+def reset_trusted_networks(*, setting, **kwargs):
+    if setting == 'TRUSTED_PROXY_CIDRS':
+        get_trusted_networks.cache_clear()
+        is_trusted_proxy.cache_clear()
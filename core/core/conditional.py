@@ -0,0 +1,176 @@
+# core/conditional.py
+"""
+Koşullu GET (ETag / Last-Modified / 304)
+
+Doğrulayıcılar view gövdesinden ÖNCE ucuz değerlerden hesaplanır; istemcinin
+kopyası güncelse 304 döner - template render edilmez, ilişkili queryset'ler
+oluşturulmaz:
+
+    @conditional.detail(Product.objects.select_related('category'),
+                        lambda slug: {'slug': slug, 'is_active': True},
+                        dependencies=[Product, Category])
+    def product_detail(request, slug): ...
+
+    @conditional.listing(Product, Category)
+    def product_list(request): ...
+
+    - detail: nesnenin updated_at alanı (nesne core.identity haritasına
+      kaydedilir, view aynı nesneyi tekrar sorgulamaz)
+    - listing: modellerin max(updated_at) değeri - etiket sürümüyle cache'lenir,
+      sıcak istekte veritabanına gidilmez
+    - ETag: zaman damgası + bağımlılık etiket sürümleri + aktif dil + site
+      ayarları sürümü + kullanıcı + query string + RELEASE
+    - Last-Modified: zaman damgası ile bağımlılık (site ayarları dahil)
+      etiketlerinin son yenilenme zamanının en yenisi - sadece If-Modified-Since
+      gönderen istemci de bağımlılık değişince 304 almaz. Zamanı bilinmeyen
+      etiket varsa Last-Modified gönderilmez, sadece ETag kullanılır.
+
+HTML her render'da CSRF token'ı ile değiştiği için ETag zayıftır (W/"...").
+Bekleyen flash mesajı olan istekler doğrulanmaz.
+"""
+import hashlib
+from functools import wraps
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Max, QuerySet
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from . import cachetags, identity
+from .pagecache import has_pending_messages
+
+DEFAULTS = {
+    'ENABLED': True,
+    # Deploy sürümü - template değişikliklerinden sonra eski ETag'ler geçersiz olsun
+    'RELEASE': '',
+    # Tüm sayfalarda görünen içerik (logo, iletişim, renkler)
+    'SITE_DEPENDENCIES': ['core.sitesettings', 'about.about'],
+    # Tarayıcı her seferinde doğrulasın (sezgisel cache ile eski sayfa göstermesin)
+    'CACHE_CONTROL': {'max_age': 0, 'must_revalidate': True},
+}
+
+
+def get_conditional_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'CONDITIONAL_GET', {}))
+    return config
+
+
+def _timestamp(value):
+    return value.timestamp() if value is not None else 0
+
+
+def make_validators(request, timestamp, dependencies, config):
+    """(etag, last_modified) - etiket sürümleri tek cache okumasıyla alınır"""
+    tags = sorted(set(cachetags.to_tags(list(dependencies) + list(config['SITE_DEPENDENCIES']))))
+    versions = cachetags.get_versions(tags)
+    bumped = cachetags.last_bumped(versions)
+    last_modified = max(value for value in (timestamp, bumped) if value is not None) if bumped else None
+    return make_etag(request, timestamp, cachetags.digest(versions), config), last_modified
+
+
+def make_etag(request, timestamp, version, config):
+    user = getattr(request, 'user', None)
+    user_part = user.pk if user is not None and user.is_authenticated else 'anon'
+    query = '&'.join(sorted(f'{key}={value}' for key, values in request.GET.lists() for value in values))
+    raw = '|'.join(str(part) for part in (
+        _timestamp(timestamp),
+        version,
+        translation.get_language() or settings.LANGUAGE_CODE,
+        user_part,
+        query,
+        config['RELEASE'],
+    ))
+    return 'W/"%s"' % hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+def conditional(validate):
+    """
+    validate(request, *args, **kwargs) -> (etag, last_modified) veya None
+
+    None: doğrulayıcı yok (nesne bulunamadı vb.) - view normal çalışır.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            config = get_conditional_settings()
+            if (not config['ENABLED'] or request.method not in ('GET', 'HEAD')
+                    or has_pending_messages(request)):
+                return view_func(request, *args, **kwargs)
+
+            validators = validate(request, *args, **kwargs)
+            if validators is None:
+                return view_func(request, *args, **kwargs)
+            etag, last_modified = validators
+            last_modified = int(last_modified.timestamp()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                if not response.has_header('ETag'):
+                    response['ETag'] = etag
+                if last_modified and not response.has_header('Last-Modified'):
+                    response['Last-Modified'] = http_date(last_modified)
+
+            patch_cache_control(response, **config['CACHE_CONTROL'])
+            if request.user.is_authenticated:
+                patch_cache_control(response, private=True)
+            return response
+        return _wrapped
+    return decorator
+
+
+# ========================
+# Hazır doğrulayıcılar
+# ========================
+
+def detail(queryset, lookup, timestamp_field='updated_at', dependencies=()):
+    """
+    Detay sayfası - nesnenin zaman damgası
+
+    Args:
+        queryset: View'ın kullandığı model/queryset (identity haritası paylaşılır)
+        lookup: URL kwargs -> lookup dict (örn. lambda slug: {'slug': slug, 'is_active': True})
+        dependencies: Sayfada görünen diğer içerik (ilgili ürünler vb.)
+    """
+    model = queryset.model if isinstance(queryset, QuerySet) else queryset
+
+    def validate(request, *args, **kwargs):
+        config = get_conditional_settings()
+        try:
+            obj = identity.get_object(request, queryset, **lookup(*args, **kwargs))
+        except model.DoesNotExist:
+            return None  # View 404 döndürür
+        timestamp = getattr(obj, timestamp_field, None)
+        return make_validators(request, timestamp, [obj] + list(dependencies), config)
+    return conditional(validate)
+
+
+def get_last_modified(model, timestamp_field='updated_at'):
+    """Modelin max(updated_at) değeri - model etiketi değişene kadar cache'te"""
+    if isinstance(model, str):
+        model = apps.get_model(model)
+    return cachetags.get_or_set(
+        f'last_modified:{timestamp_field}', [model],
+        lambda: model._default_manager.aggregate(value=Max(timestamp_field))['value'],
+        60 * 60 * 24, parts=(cachetags.model_tag(model),),
+    )
+
+
+def listing(*models, timestamp_field='updated_at', dependencies=()):
+    """
+    Liste sayfası - modellerin en son güncellenme zamanı + etiket sürümleri
+
+    models: Model sınıfları veya 'app_label.modelname'
+    """
+    def validate(request, *args, **kwargs):
+        config = get_conditional_settings()
+        timestamps = [get_last_modified(model, timestamp_field) for model in models]
+        timestamps = [value for value in timestamps if value is not None]
+        timestamp = max(timestamps) if timestamps else None
+        return make_validators(request, timestamp, list(models) + list(dependencies), config)
+    return conditional(validate)
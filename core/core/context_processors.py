@@ -1,82 +1,82 @@
 # core/context_processors.py 
-from django.core.cache import cache
+from . import cachetags, identity, storageusage
+from .language import get_language_profile
+from .lazycontext import lazy_context
+from .singletons import get_about, get_admin_translation_settings, get_site_settings
 from .models import SiteSettings
 from django.conf import settings
-from .utils import check_cloudinary_storage  # YENİ EKLENEN
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Geriye dönük uyumluluk - asıl tanım core.storageusage'da
+STORAGE_TAG = storageusage.STORAGE_TAG
+STORAGE_DEPENDENCIES = storageusage.STORAGE_DEPENDENCIES
+
+def _build_about_info(about):
+    if about is not None:
+        return {
+            'title': about.title,
+            'short_description': about.short_description,
+            'mission': about.mission,
+            'vision': about.vision,
+            'story': about.story,
+            'years_experience': about.years_experience,
+            'completed_jobs': about.completed_jobs,
+            'happy_customers': about.happy_customers,
+            'total_services': about.total_services,
+            'customer_satisfaction': about.customer_satisfaction,
+            'meta_title': about.meta_title,
+            'meta_description': about.meta_description,
+            'image': about.image,
+            'updated_at': about.updated_at,
+        }
+    # Varsayılan değerler
+    return {
+        'title': 'Hakkımızda',
+        'short_description': 'Profesyonel hizmet anlayışımızla sizlerleyiz.',
+        'mission': 'Müşterilerimize en iyi hizmeti sunmak.',
+        'vision': 'Sektörün lider firması olmak.',
+        'story': 'Yıllardır süregelen deneyimimizle hizmet veriyoruz.',
+        'years_experience': 20,
+        'completed_jobs': 5000,
+        'happy_customers': 1000,
+        'total_services': 10,
+        'customer_satisfaction': 100,
+        'meta_title': '',
+        'meta_description': '',
+        'image': None,
+        'updated_at': None,
+    }
+
+SEO_CONTEXT_KEYS = (
+    'site_name', 'site_tagline', 'site_full_name', 'seo_title', 'seo_description', 'seo_keywords',
+    'default_meta_description', 'default_meta_keywords', 'global_about', 'about_title',
+    'about_mission', 'about_vision', 'company_years_experience', 'company_completed_jobs',
+    'company_happy_customers', 'primary_color', 'secondary_color', 'navbar_color', 'site_logo',
+    'favicon', 'pdf_catalog_enabled', 'pdf_catalog_file', 'pdf_catalog_title', 'facebook_url',
+    'instagram_url', 'twitter_url', 'whatsapp_number', 'whatsapp_link', 'youtube_url',
+    'contact_phone', 'contact_email', 'contact_address', 'google_maps_embed_url', 'site_settings',
+    'translation_enabled', 'has_social_media', 'css_colors', 'current_language',
+    'available_languages', 'dashboard_languages', 'site_enabled_languages',
+    'user_primary_language', 'site_primary_url', 'context_debug', 'enabled_languages', 'pdf_debug',
+)
+
+@lazy_context(*SEO_CONTEXT_KEYS)
 def seo_context(request):
     """
     Site ayarlarını VE ABOUT bilgilerini tüm template'lerde kullanılabilir hale getirir
     Cache kullanarak performansı optimize eder
     """
     
-    # Cache'den site ayarlarını al
-    site_settings = cache.get('site_settings')
-    
-    if site_settings is None:
-        try:
-            site_settings = SiteSettings.objects.get()
-            cache.set('site_settings', site_settings, 60 * 15)  # 15 dakika cache
-        except SiteSettings.DoesNotExist:
-            site_settings = SiteSettings.objects.create()
-            cache.set('site_settings', site_settings, 60 * 15)
-    
-    # ABOUT VERİLERİNİ DE CACHE'DEN AL
-    about_info = cache.get('about_info')
-    
-    if about_info is None:
-        try:
-            from about.models import About
-            about = About.objects.get(pk=1)
-            about_info = {
-                'title': about.title,
-                'short_description': about.short_description,
-                'mission': about.mission,
-                'vision': about.vision,
-                'story': about.story,
-                'years_experience': about.years_experience,
-                'completed_jobs': about.completed_jobs,
-                'happy_customers': about.happy_customers,
-                'total_services': about.total_services,
-                'customer_satisfaction': about.customer_satisfaction,
-                'meta_title': about.meta_title,
-                'meta_description': about.meta_description,
-                'image': about.image,
-                'updated_at': about.updated_at,
-            }
-            cache.set('about_info', about_info, 60 * 10)  # 10 dakika cache
-        except:
-            # Varsayılan değerler
-            about_info = {
-                'title': 'Hakkımızda',
-                'short_description': 'Profesyonel hizmet anlayışımızla sizlerleyiz.',
-                'mission': 'Müşterilerimize en iyi hizmeti sunmak.',
-                'vision': 'Sektörün lider firması olmak.',
-                'story': 'Yıllardır süregelen deneyimimizle hizmet veriyoruz.',
-                'years_experience': 20,
-                'completed_jobs': 5000,
-                'happy_customers': 1000,
-                'total_services': 10,
-                'customer_satisfaction': 100,
-                'meta_title': '',
-                'meta_description': '',
-                'image': None,
-                'updated_at': None,
-            }
-            cache.set('about_info', about_info, 60 * 10)
+    # Site ayarları ve About worker içi kopyadan okunur (core.singletons)
+    site_settings = get_site_settings()
+    about_info = _build_about_info(get_about())
 
-    # Kullanıcı dil ayarları
+    # Kullanıcı dil ayarları (session'daki dil profili - core.language)
     user_primary_language = 'tr'
     if request.user.is_authenticated:
-        try:
-            from dashboard.models import DashboardTranslationSettings
-            user_settings = DashboardTranslationSettings.objects.get(user=request.user)
-            user_primary_language = user_settings.primary_language
-        except:
-            user_primary_language = 'tr'
+        user_primary_language = get_language_profile(request).primary_language or 'tr'
     
     # Template context
     context = {
@@ -184,6 +184,43 @@ def seo_context(request):
     
     return context
 
+# Detay view'ları -> (model, isim alanı) - nesne core.identity haritasından okunur
+DETAIL_VIEWS = {
+    'products:product_detail': ('products.Product', 'name'),
+    'products:category_detail': ('products.Category', 'name'),
+    'gallery:detail': ('gallery.Gallery', 'title'),
+    'about:service_detail': ('about.Service', 'title'),
+    'about:team_detail': ('about.TeamMember', 'name'),
+}
+
+def get_detail_object(request):
+    """
+    Detay sayfasının ana nesnesi - view kaydettiyse sorgusuz, aksi halde
+    istek başına tek sorguyla (core.identity)
+    """
+    from django.apps import apps
+    
+    resolved = identity.get_resolver_match(request)
+    if resolved is None or resolved.view_name not in DETAIL_VIEWS:
+        return None
+    
+    model = apps.get_model(DETAIL_VIEWS[resolved.view_name][0])
+    primary = identity.get_primary(request, model)
+    if primary is not None:
+        return primary
+    
+    slug = resolved.kwargs.get('slug')
+    if not slug:
+        return None
+    queryset = model.objects.all()
+    if model._meta.label == 'products.Product':
+        queryset = queryset.select_related('category')
+    try:
+        return identity.get_object(request, queryset, primary=True, slug=slug, is_active=True)
+    except model.DoesNotExist:
+        return None
+
+@lazy_context('meta_data', 'current_url', 'canonical_url')
 def meta_seo_context(request):
     """
     YENİ: SEO meta bilgileri için özel context processor
@@ -201,16 +238,15 @@ def meta_seo_context(request):
         'breadcrumbs': [],
     }
     
-    # URL path'e göre özel meta bilgileri
-    path = request.path.strip('/')
+    # Resolve edilmiş view'a göre özel meta bilgileri (path tekrar ayrıştırılmaz)
+    resolved = identity.get_resolver_match(request)
+    view_name = resolved.view_name if resolved is not None else ''
     
-    if path.startswith('urunler/') and path != 'urunler/':
+    if view_name == 'products:product_detail':
         # Ürün detay sayfası
         meta_data['page_type'] = 'product'
         try:
-            from products.models import Product
-            slug = path.split('/')[-1]
-            product = Product.objects.get(slug=slug, is_active=True)
+            product = get_detail_object(request)
             meta_data['product_price'] = f"{product.get_price_display()}"
             meta_data['product_availability'] = 'InStock' if product.is_in_stock() else 'OutOfStock'
             meta_data['breadcrumbs'] = [
@@ -222,13 +258,11 @@ def meta_seo_context(request):
         except:
             pass
     
-    elif path.startswith('galeri/') and path != 'galeri/':
+    elif view_name == 'gallery:detail':
         # Galeri detay sayfası
         meta_data['page_type'] = 'article'
         try:
-            from gallery.models import Gallery
-            slug = path.split('/')[-1]
-            gallery_item = Gallery.objects.get(slug=slug, is_active=True)
+            gallery_item = get_detail_object(request)
             meta_data['article_published_time'] = gallery_item.created_at.isoformat()
             meta_data['article_modified_time'] = gallery_item.updated_at.isoformat()
             meta_data['article_section'] = 'Galeri'
@@ -240,7 +274,7 @@ def meta_seo_context(request):
         except:
             pass
     
-    elif path.startswith('hakkimizda'):
+    elif view_name.startswith('about:'):
         # Hakkımızda sayfası
         meta_data['page_type'] = 'article'
         meta_data['article_section'] = 'Hakkımızda'
@@ -261,47 +295,34 @@ def storage_info(request):
     YENİ EKLENEN CONTEXT PROCESSOR
     """
     if request.path.startswith('/dashboard/'):
-        # Cache'den storage bilgilerini al (5 dakika cache)
-        storage_data = cache.get('cloudinary_storage_info')
-        
-        if storage_data is None:
-            try:
-                storage_data = check_cloudinary_storage()
-                cache.set('cloudinary_storage_info', storage_data, 60 * 5)  # 5 dakika cache
-            except Exception as e:
-                logger.error(f"Storage info error: {e}")
-                storage_data = {
-                    'used_gb': 0,
-                    'limit_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-                    'remaining_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-                    'usage_percentage': 0,
-                    'warning_level': 'success',
-                    'is_warning': False,
-                    'is_critical': False,
-                    'error': True
-                }
-        
-        return {
-            'cloudinary_storage': storage_data,
-            'storage_package_info': {
-                'current_package_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-                'available_packages': list(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
-                'is_upgradeable': settings.CLOUDINARY_STORAGE_LIMIT_GB < max(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
-            }
-        }
+        return _storage_context(request)
     return {}
 
+@lazy_context('cloudinary_storage', 'storage_package_info')
+def _storage_context(request):
+    # Son bilinen değer hemen döner, bayatsa arka planda yenilenir (core.storageusage)
+    storage_data = storageusage.get_storage_usage()
+
+    return {
+        'cloudinary_storage': storage_data,
+        'storage_package_info': {
+            'current_package_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
+            'available_packages': list(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
+            'is_upgradeable': settings.CLOUDINARY_STORAGE_LIMIT_GB < max(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
+        }
+    }
+
 def clear_site_settings_cache():
     """Site ayarları cache'ini temizle"""
-    cache.delete('site_settings')
+    cachetags.invalidate(SiteSettings)
 
 def clear_about_cache():
     """About bilgileri cache'ini temizle"""
-    cache.delete('about_info')
+    cachetags.invalidate('about.about')
 
 def clear_storage_cache():
     """Storage bilgileri cache'ini temizle - YENİ EKLENEN"""
-    cache.delete('cloudinary_storage_info')
+    storageusage.clear()
 
 def clear_all_cache():
     """Tüm cache'i temizle"""
@@ -322,11 +343,7 @@ def language_context(request):
 def get_site_enabled_languages():
     """Site için aktif dilleri getir"""
     try:
-        from dashboard.models import DashboardTranslationSettings
-        
-        admin_settings = DashboardTranslationSettings.objects.filter(
-            user__is_staff=True
-        ).order_by('-updated_at').first()
+        admin_settings = get_admin_translation_settings()
         
         if admin_settings and admin_settings.enabled_languages:
             return admin_settings.enabled_languages
@@ -339,18 +356,20 @@ def get_site_enabled_languages():
     
 
 
+@lazy_context('breadcrumbs')
 def breadcrumb_context(request):
     """
     Dinamik breadcrumb oluşturan context processor
     URL pattern'ine göre otomatik breadcrumb yapısı
     """
-    from django.urls import resolve, Resolver404
+    from django.urls import Resolver404
     from django.utils.translation import gettext as _
-    import re
     
     try:
-        # URL resolve et
-        resolved = resolve(request.path)
+        # View'ın resolver_match'i kullanılır (tekrar resolve edilmez)
+        resolved = identity.get_resolver_match(request)
+        if resolved is None:
+            raise Resolver404(request.path)
         breadcrumbs = []
         
         # Ana sayfa her zaman ilk
@@ -379,7 +398,7 @@ def breadcrumb_context(request):
             
             # Her seviye için breadcrumb ekle
             breadcrumb = {
-                'name': _get_breadcrumb_name(part, resolved.url_name, request),
+                'name': _get_breadcrumb_name(part, resolved, request),
                 'url': current_path + "/",
                 'is_current': is_last
             }
@@ -397,7 +416,7 @@ def breadcrumb_context(request):
             breadcrumbs.append(breadcrumb)
         
         # Detay sayfalar için özel işlem
-        if resolved.url_name in ['product_detail', 'gallery_detail', 'service_detail', 'team_detail']:
+        if resolved.view_name in DETAIL_VIEWS:
             _enhance_detail_breadcrumbs(breadcrumbs, resolved, request)
         
         return {'breadcrumbs': breadcrumbs}
@@ -419,7 +438,7 @@ def breadcrumb_context(request):
             ]
         }
 
-def _get_breadcrumb_name(part, url_name, request):
+def _get_breadcrumb_name(part, resolved, request):
     """Path kısmı için uygun breadcrumb ismi döndürür"""
     from django.utils.translation import gettext as _
     
@@ -444,38 +463,18 @@ def _get_breadcrumb_name(part, url_name, request):
     if part in section_names:
         return section_names[part]
     
-    # Slug'dan isim çıkarmaya çalış
-    if url_name in ['product_detail', 'category_detail', 'gallery_detail']:
-        return _get_object_name_from_slug(part, url_name)
+    # Detay sayfasının slug'ı -> ana nesnenin ismi
+    if resolved.view_name in DETAIL_VIEWS and part == resolved.kwargs.get('slug'):
+        return _get_object_name_from_slug(part, resolved, request)
     
     # Varsayılan: ilk harfi büyük, tire ve alt çizgiyi boşlukla değiştir
     return part.replace('-', ' ').replace('_', ' ').title()
 
-def _get_object_name_from_slug(slug, url_name):
-    """Slug'dan object ismini getirir"""
-    try:
-        if url_name == 'product_detail':
-            from products.models import Product
-            obj = Product.objects.get(slug=slug, is_active=True)
-            return obj.name
-        elif url_name == 'category_detail':
-            from products.models import Category
-            obj = Category.objects.get(slug=slug, is_active=True)
-            return obj.name
-        elif url_name == 'gallery_detail':
-            from gallery.models import Gallery
-            obj = Gallery.objects.get(slug=slug, is_active=True)
-            return obj.title
-        elif url_name == 'service_detail':
-            from about.models import Service
-            obj = Service.objects.get(slug=slug, is_active=True)
-            return obj.title
-        elif url_name == 'team_detail':
-            from about.models import TeamMember
-            obj = TeamMember.objects.get(slug=slug, is_active=True)
-            return obj.name
-    except:
-        pass
+def _get_object_name_from_slug(slug, resolved, request):
+    """Slug'dan object ismini getirir - nesne istek haritasından okunur"""
+    obj = get_detail_object(request)
+    if obj is not None:
+        return getattr(obj, DETAIL_VIEWS[resolved.view_name][1])
     
     # Hata durumunda slug'ı temizle
     return slug.replace('-', ' ').title()
@@ -483,12 +482,10 @@ def _get_object_name_from_slug(slug, url_name):
 def _enhance_detail_breadcrumbs(breadcrumbs, resolved, request):
     """Detay sayfaları için breadcrumb'ları zenginleştir"""
     try:
-        if resolved.url_name == 'product_detail':
-            # Ürün detay için kategori bilgisi ekle
-            from products.models import Product
-            slug = resolved.kwargs.get('slug')
-            if slug:
-                product = Product.objects.select_related('category').get(slug=slug, is_active=True)
+        if resolved.view_name == 'products:product_detail':
+            # Ürün detay için kategori bilgisi ekle (view select_related ile yükledi)
+            product = get_detail_object(request)
+            if product is not None:
                 
                 # Kategori breadcrumb'ı ekle (sondan bir önceki pozisyona)
                 if len(breadcrumbs) >= 2:
@@ -510,7 +507,7 @@ def get_structured_breadcrumbs(request):
     """
     JSON-LD structured data için breadcrumb verisi
     """
-    breadcrumb_data = breadcrumb_context(request)
+    breadcrumb_data = breadcrumb_context.__wrapped__(request)  # Tembel sarmalayıcı olmadan
     breadcrumbs = breadcrumb_data.get('breadcrumbs', [])
     
     if len(breadcrumbs) <= 1:
@@ -0,0 +1,196 @@
+# core/edge.py
+"""
+Edge katmanı - istek yolunu zincirin başında bir kez sınıflandırır
+
+Yol, uygulama açılışında derlenen segment tabanlı bir prefix trie'de
+(/static/, /media/, /dashboard/, admin URL'i...) ve tam eşleşme tablosunda
+(/favicon.ico, /robots.txt, eski URL yönlendirmeleri) aranır. Sonuç
+request.edge_route olarak saklanır; diğer middleware'ler startswith
+listeleri yerine get_edge_route() ile bu değeri kullanır.
+
+EdgeMiddleware statik/media, favicon, robots.txt ve eski URL yönlendirme
+isteklerini session, locale, CSRF, auth ve dil middleware'lerine hiç
+uğramadan yanıtlar. Django SecurityMiddleware'in hemen arkasında durur;
+kısa devre yanıtları da SECURE_SSL_REDIRECT ve HSTS'ten geçer.
+"""
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Route sınıfları
+ROUTE_PAGE = 'page'
+ROUTE_STATIC = 'static'
+ROUTE_MEDIA = 'media'
+ROUTE_FAVICON = 'favicon'
+ROUTE_ROBOTS = 'robots'
+ROUTE_SITEMAP = 'sitemap'
+ROUTE_REDIRECT = 'redirect'
+ROUTE_ADMIN = 'admin'
+ROUTE_DASHBOARD = 'dashboard'
+ROUTE_API = 'api'
+
+# Edge tarafından doğrudan yanıtlanan sınıflar
+SHORT_CIRCUIT_ROUTES = frozenset({
+    ROUTE_STATIC, ROUTE_MEDIA, ROUTE_FAVICON, ROUTE_ROBOTS, ROUTE_REDIRECT,
+})
+
+# Session/auth gerektirmeyen sınıflar - EdgeSessionMiddleware session cookie'sini
+# okumaz/yazmaz, EdgeAuthenticationMiddleware kullanıcıyı anonim kabul eder
+SESSIONLESS_ROUTES = SHORT_CIRCUIT_ROUTES | {ROUTE_SITEMAP}
+
+# Site içeriği olmayan (SEO/istatistik işlemleri atlanan) sınıflar
+NON_SITE_ROUTES = frozenset({
+    ROUTE_ADMIN, ROUTE_DASHBOARD, ROUTE_API, ROUTE_STATIC, ROUTE_MEDIA,
+})
+
+# Eski URL -> yeni URL (301) - ihtiyaca göre güncellenebilir
+LEGACY_REDIRECTS = {
+    # Eski format -> Yeni format
+    '/products/': '/urunler/',
+    '/gallery/': '/galeri/',
+    '/about/': '/hakkimizda/',
+    '/contact/': '/iletisim/',
+
+    # Eski slug'lar -> Yeni slug'lar (örnekler)
+    # '/old-product-name/': '/urunler/new-product-name/',
+}
+
+REQUEST_ATTRIBUTE = 'edge_route'
+
+
+class PrefixTrie:
+    """
+    Yol segmentleri üzerinde prefix trie
+
+    '/static/' gibi prefix'ler segmentlere bölünerek eklenir; arama en uzun
+    eşleşen prefix'in değerini döndürür. Segment başına tek dict lookup
+    yapıldığından maliyet prefix sayısından bağımsızdır.
+    """
+    __slots__ = ('root',)
+
+    def __init__(self):
+        self.root = {}
+
+    @staticmethod
+    def _segments(path):
+        return [segment for segment in path.split('/') if segment]
+
+    def insert(self, prefix, value):
+        node = self.root
+        for segment in self._segments(prefix):
+            node = node.setdefault(segment, {})
+        node[None] = value
+
+    def match(self, path, default=None):
+        node = self.root
+        found = node.get(None, default)
+        for segment in path.split('/'):
+            if not segment:
+                continue
+            node = node.get(segment)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
+
+
+class EdgeRouter:
+    """Derlenmiş trie + tam eşleşme tablosu"""
+
+    def __init__(self, prefixes, exact, redirects):
+        self.prefixes = dict(prefixes)
+        self.trie = PrefixTrie()
+        for prefix, route in prefixes.items():
+            self.trie.insert(prefix, route)
+        self.exact = dict(exact)
+        self.redirects = dict(redirects)
+        for path in self.redirects:
+            self.exact.setdefault(path, ROUTE_REDIRECT)
+
+    def prefix_for(self, route):
+        """Route sınıfına ait (son eklenen) prefix"""
+        for prefix, prefix_route in reversed(self.prefixes.items()):
+            if prefix_route == route:
+                return prefix
+        return None
+
+    def classify(self, path):
+        route = self.exact.get(path)
+        if route is None:
+            route = self.trie.match(path, ROUTE_PAGE)
+        return route
+
+
+def _url_prefix(url):
+    """'/static/' veya 'https://cdn.../static/' -> '/static/' (yerel değilse None)"""
+    if not url or '://' in url or url.startswith('//'):
+        return None
+    return '/' + url.strip('/') + '/'
+
+
+def build_router():
+    """Settings'ten edge router'ı oluştur"""
+    prefixes = {
+        '/dashboard/': ROUTE_DASHBOARD,
+        '/api/': ROUTE_API,
+        '/admin/': ROUTE_ADMIN,
+        '/sitemaps/': ROUTE_SITEMAP,
+    }
+    admin_prefix = _url_prefix(getattr(settings, 'ADMIN_URL', 'admin/'))
+    if admin_prefix:
+        prefixes[admin_prefix] = ROUTE_ADMIN
+    for setting_name, route in (('STATIC_URL', ROUTE_STATIC), ('MEDIA_URL', ROUTE_MEDIA)):
+        prefix = _url_prefix(getattr(settings, setting_name, None))
+        if prefix and prefix != '/':
+            prefixes[prefix] = route
+
+    exact = {
+        '/favicon.ico': ROUTE_FAVICON,
+        '/robots.txt': ROUTE_ROBOTS,
+        '/sitemap.xml': ROUTE_SITEMAP,
+    }
+
+    redirects = dict(LEGACY_REDIRECTS)
+    redirects.update(get_edge_settings().get('REDIRECTS', {}))
+    return EdgeRouter(prefixes, exact, redirects)
+
+
+def get_edge_settings():
+    return getattr(settings, 'EDGE_MIDDLEWARE', {})
+
+
+_router = None
+
+
+def get_router():
+    """Worker başına tek router örneği"""
+    global _router
+    if _router is None:
+        _router = build_router()
+    return _router
+
+
+def get_edge_route(request):
+    """
+    İsteğin route sınıfını döndür - EdgeMiddleware zincirde yoksa
+    ilk çağrıda hesaplanır
+    """
+    try:
+        return request.__dict__[REQUEST_ATTRIBUTE]
+    except KeyError:
+        pass
+    route = get_router().classify(request.path_info)
+    request.__dict__[REQUEST_ATTRIBUTE] = route
+    return route
+
+
+def is_sessionless(request):
+    """İstek session/auth işlemlerini atlamalı mı?"""
+    return get_edge_route(request) in SESSIONLESS_ROUTES
+
+
+@receiver(setting_changed)
+def reset_router(*, setting, **kwargs):
+    global _router
+    if setting in ('EDGE_MIDDLEWARE', 'STATIC_URL', 'MEDIA_URL', 'ADMIN_URL'):
+        _router = None
@@ -0,0 +1,118 @@
+# core/identity.py
+"""
+İstek kapsamlı nesne haritası (identity map)
+
+Detay sayfalarında view'ın çözdüğü ana nesne istek üzerinde saklanır; context
+processor'lar ve template tag'ler aynı nesneyi tekrar sorgulamak yerine
+buradan okur:
+
+    # View
+    product = identity.get_object_or_404(
+        request, Product.objects.select_related('category'), slug=slug, is_active=True
+    )
+
+    # Context processor / template tag
+    product = identity.get_primary(request)
+
+Aynı istekte aynı (model, lookup) ikinci kez istenirse sorgu yapılmaz.
+request.resolver_match tekrar resolve() yapılmadan kullanılır.
+"""
+from django.db.models import Model, QuerySet
+from django.http import Http404
+from django.urls import Resolver404, resolve
+
+REQUEST_ATTRIBUTE = '_identity_map'
+RESOLVER_ATTRIBUTE = '_identity_resolver_match'
+
+
+class IdentityMap:
+    """(model, lookup) -> nesne"""
+    __slots__ = ('objects', 'primary')
+
+    def __init__(self):
+        self.objects = {}
+        self.primary = None
+
+    @staticmethod
+    def make_key(model, lookup):
+        return model._meta.label_lower, tuple(sorted(lookup.items()))
+
+    def get(self, model, **lookup):
+        return self.objects.get(self.make_key(model, lookup))
+
+    def add(self, obj, lookup=None, primary=False):
+        model = type(obj)
+        self.objects[self.make_key(model, {'pk': obj.pk})] = obj
+        if lookup:
+            self.objects[self.make_key(model, lookup)] = obj
+        if primary:
+            self.primary = obj
+        return obj
+
+
+def get_identity_map(request):
+    identity_map = request.__dict__.get(REQUEST_ATTRIBUTE)
+    if identity_map is None:
+        identity_map = request.__dict__[REQUEST_ATTRIBUTE] = IdentityMap()
+    return identity_map
+
+
+def _queryset(model_or_queryset):
+    if isinstance(model_or_queryset, QuerySet):
+        return model_or_queryset
+    return model_or_queryset._default_manager.all()
+
+
+def get_object(request, model_or_queryset, primary=False, **lookup):
+    """
+    Nesneyi haritadan döndür, yoksa tek sorguyla getirip kaydet
+
+    Raises:
+        Model.DoesNotExist: Nesne bulunamazsa
+    """
+    queryset = _queryset(model_or_queryset)
+    identity_map = get_identity_map(request)
+    obj = identity_map.get(queryset.model, **lookup)
+    if obj is None:
+        obj = identity_map.add(queryset.get(**lookup), lookup)
+    if primary:
+        identity_map.primary = obj
+    return obj
+
+
+def get_object_or_404(request, model_or_queryset, **lookup):
+    """View'ın ana nesnesi - get_object_or_404 + primary olarak kaydet"""
+    queryset = _queryset(model_or_queryset)
+    try:
+        return get_object(request, queryset, primary=True, **lookup)
+    except queryset.model.DoesNotExist:
+        raise Http404(f'{queryset.model._meta.object_name} bulunamadı')
+
+
+def register_primary(request, obj, **lookup):
+    """View'ın başka yolla çözdüğü ana nesneyi kaydet"""
+    if isinstance(obj, Model):
+        get_identity_map(request).add(obj, lookup, primary=True)
+    return obj
+
+
+def get_primary(request, model=None):
+    """View'ın kaydettiği ana nesne (model verilirse sadece o tipteyse)"""
+    identity_map = request.__dict__.get(REQUEST_ATTRIBUTE)
+    obj = identity_map.primary if identity_map is not None else None
+    if obj is not None and model is not None and not isinstance(obj, model):
+        return None
+    return obj
+
+
+def get_resolver_match(request):
+    """request.resolver_match - yoksa (middleware yanıtı, hata sayfası) bir kez resolve et"""
+    match = getattr(request, 'resolver_match', None)
+    if match is not None:
+        return match
+    if RESOLVER_ATTRIBUTE not in request.__dict__:
+        try:
+            request.__dict__[RESOLVER_ATTRIBUTE] = resolve(request.path_info)
+        except Resolver404:
+            request.__dict__[RESOLVER_ATTRIBUTE] = None
+    return request.__dict__[RESOLVER_ATTRIBUTE]
@@ -0,0 +1,176 @@
+# core/inspection.py
+"""
+İstek içerik denetim motoru
+
+SecurityMiddleware ve SecurityMonitoringMiddleware'in kullandığı tüm kural
+setleri uygulama açılışında TEK bir birleşik regex'e derlenir. Her GET/POST
+değeri bu birleşik desenle yalnızca bir kez taranır; temiz isteklerde (trafiğin
+neredeyse tamamı) başka hiçbir regex çalışmaz. Eşleşme olursa hangi kuralların
+tetiklendiği, önceden derlenmiş tekil desenlerle belirlenir.
+
+Sonuç (verdict) istek üzerinde saklanır, böylece iki middleware aynı isteği
+ikinci kez taramaz.
+"""
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# Varsayılan kural setleri - settings.REQUEST_INSPECTION_RULES ile ezilebilir
+DEFAULT_INSPECTION_RULES = {
+    'sql_injection': [
+        r'(\s|^)(SELECT|INSERT|UPDATE|DELETE|DROP|UNION|ALTER)(\s|$)',
+        r'--',
+        r';',
+        r'\/\*.*\*\/',
+    ],
+    'xss': [
+        r'<script.*?>.*?<\/script>',
+        r'javascript:',
+        r'onerror=',
+        r'onload=',
+    ],
+    'suspicious': [
+        r'\.\./',  # Directory traversal
+        r'<script',  # XSS attempt
+        r'javascript:',  # XSS attempt
+        r'union\s+select',  # SQL injection
+        r'drop\s+table',  # SQL injection
+        r'exec\s*\(',  # Code injection
+        r'eval\s*\(',  # Code injection
+    ],
+}
+
+# Verdict'in istek üzerinde saklandığı attribute
+REQUEST_ATTRIBUTE = '_inspection_verdict'
+
+
+class InspectionHit:
+    """Tek bir kural eşleşmesi"""
+    __slots__ = ('source', 'rule_set', 'pattern')
+
+    def __init__(self, source, rule_set, pattern):
+        self.source = source
+        self.rule_set = rule_set
+        self.pattern = pattern
+
+    def __repr__(self):
+        return f'<InspectionHit {self.source}:{self.rule_set} {self.pattern!r}>'
+
+
+class InspectionVerdict:
+    """Bir isteğin denetim sonucu"""
+    __slots__ = ('hits',)
+
+    def __init__(self, hits=()):
+        self.hits = tuple(hits)
+
+    def __bool__(self):
+        return bool(self.hits)
+
+    def matched(self, rule_sets, sources=('GET', 'POST')):
+        """Verilen kural setlerinden biri verilen kaynaklarda eşleşti mi?"""
+        if isinstance(rule_sets, str):
+            rule_sets = (rule_sets,)
+        return any(
+            hit.rule_set in rule_sets and hit.source in sources
+            for hit in self.hits
+        )
+
+    def for_rule_set(self, rule_set, sources=('GET', 'POST')):
+        """Belirli bir kural setine ait eşleşmeler"""
+        return [
+            hit for hit in self.hits
+            if hit.rule_set == rule_set and hit.source in sources
+        ]
+
+
+CLEAN_VERDICT = InspectionVerdict()
+
+
+class RequestInspector:
+    """
+    Kural setlerini tek bir birleşik otomata derleyen denetleyici
+
+    Birleşik desen yalnızca "bu değerde herhangi bir kural eşleşiyor mu?"
+    sorusunu tek geçişte cevaplar. Alternation sırası nedeniyle örtüşen
+    kurallar gizlenebileceğinden, pozitif durumda kurallar tek tek
+    doğrulanır - bu yol sadece şüpheli değerlerde çalışır.
+    """
+
+    def __init__(self, rules):
+        self.rules = []
+        alternatives = []
+        for rule_set, patterns in rules.items():
+            for pattern in patterns:
+                compiled = re.compile(pattern, re.I)
+                self.rules.append((rule_set, pattern, compiled))
+                alternatives.append(f'(?:{pattern})')
+
+        self.rule_sets = frozenset(rules)
+        self.combined = re.compile('|'.join(alternatives), re.I) if alternatives else None
+
+    def scan_value(self, value):
+        """Tek bir değeri tara, eşleşen (rule_set, pattern) çiftlerini döndür"""
+        if self.combined is None or not value:
+            return ()
+        if self.combined.search(value) is None:
+            return ()
+        return tuple(
+            (rule_set, pattern)
+            for rule_set, pattern, compiled in self.rules
+            if compiled.search(value)
+        )
+
+    def inspect(self, request):
+        """GET ve POST değerlerini tarayıp verdict üret"""
+        hits = []
+        sources = [('GET', request.GET)]
+        if request.method == 'POST':
+            sources.append(('POST', request.POST))
+
+        for source, params in sources:
+            for value in params.values():
+                for rule_set, pattern in self.scan_value(str(value)):
+                    hits.append(InspectionHit(source, rule_set, pattern))
+
+        return InspectionVerdict(hits) if hits else CLEAN_VERDICT
+
+
+def get_inspection_rules():
+    """Varsayılan kurallar + settings.REQUEST_INSPECTION_RULES"""
+    rules = {name: list(patterns) for name, patterns in DEFAULT_INSPECTION_RULES.items()}
+    for name, patterns in getattr(settings, 'REQUEST_INSPECTION_RULES', {}).items():
+        if patterns:
+            rules[name] = list(patterns)
+        else:
+            # Boş liste verilen kural seti devre dışı bırakılır
+            rules.pop(name, None)
+    return rules
+
+
+@lru_cache(maxsize=None)
+def get_inspector():
+    """Worker başına tek, derlenmiş denetleyici"""
+    return RequestInspector(get_inspection_rules())
+
+
+def inspect_request(request):
+    """
+    İsteğin verdict'ini döndür - ilk çağrıda tarar, sonrakiler istek
+    üzerindeki sonucu kullanır
+    """
+    verdict = getattr(request, REQUEST_ATTRIBUTE, None)
+    if verdict is None:
+        verdict = get_inspector().inspect(request)
+        setattr(request, REQUEST_ATTRIBUTE, verdict)
+    return verdict
+
+
+@receiver(setting_changed)
+def reset_inspector(*, setting, **kwargs):
+    """Kurallar değiştiğinde derlenmiş denetleyiciyi sıfırla"""
+    if setting == 'REQUEST_INSPECTION_RULES':
+        get_inspector.cache_clear()
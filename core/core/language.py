@@ -0,0 +1,119 @@
+# core/language.py
+"""
+Dil tabloları ve kullanıcı başına dil profili
+
+settings.LANGUAGES açılışta frozenset'e çevrilir.
+
+Kullanıcının DashboardTranslationSettings kaydından okunan dashboard ve ana
+dil, session'da sürüm numarasıyla birlikte saklanır (LanguageProfile).
+Sürüm cache'te kullanıcı başına tutulur ve ayarlar kaydedildiğinde/silindiğinde
+yenilenir; session'daki sürüm eşleştiği sürece middleware'ler veritabanına
+gitmez. Cache'te sürüm yoksa (boşaltılmış cache, DummyCache) profil her
+seferinde veritabanından okunur - eski veri gösterilmez.
+"""
+import logging
+import uuid
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+SESSION_KEY = '_language_profile'
+VERSION_KEY = 'language_profile_version:{user_id}'
+VERSION_TIMEOUT = 60 * 60 * 24 * 30  # 30 gün
+
+
+@lru_cache(maxsize=None)
+def get_language_codes():
+    """Site dilleri (settings.LANGUAGES) - frozenset"""
+    return frozenset(code for code, name in settings.LANGUAGES)
+
+
+class LanguageProfile:
+    """Kullanıcının dil tercihleri - ayar kaydı yoksa alanlar None"""
+    __slots__ = ('dashboard_language', 'primary_language')
+
+    def __init__(self, dashboard_language=None, primary_language=None):
+        self.dashboard_language = dashboard_language
+        self.primary_language = primary_language
+
+    @property
+    def exists(self):
+        return self.dashboard_language is not None
+
+
+def _version_key(user_id):
+    return VERSION_KEY.format(user_id=user_id)
+
+
+def _load_profile(user_id):
+    from dashboard.models import DashboardTranslationSettings
+
+    row = (
+        DashboardTranslationSettings.objects.filter(user_id=user_id)
+        .values_list('dashboard_language', 'primary_language')
+        .first()
+    )
+    return row or (None, None)
+
+
+def get_language_profile(request):
+    """
+    Oturum açmış kullanıcının dil profilini döndür
+
+    Session'daki kopya, cache'teki sürümle eşleşiyorsa kullanılır;
+    aksi halde veritabanından tek sorguyla yenilenir.
+    """
+    user_id = request.user.pk
+    session = getattr(request, 'session', None)
+    version = cache.get(_version_key(user_id))
+
+    if session is not None and version is not None:
+        stored = session.get(SESSION_KEY)
+        if stored and stored[0] == version and stored[1] == user_id:
+            return LanguageProfile(stored[2], stored[3])
+
+    try:
+        dashboard_language, primary_language = _load_profile(user_id)
+    except Exception as e:
+        logger.error(f"Dil profili okunamadı (kullanıcı #{user_id}): {e}")
+        return LanguageProfile()
+
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(_version_key(user_id), version, VERSION_TIMEOUT):
+            version = None
+
+    if session is not None and version is not None:
+        session[SESSION_KEY] = (version, user_id, dashboard_language, primary_language)
+
+    logger.debug(
+        f"Dil profili yüklendi (kullanıcı #{user_id}): "
+        f"dashboard={dashboard_language}, ana={primary_language}"
+    )
+    return LanguageProfile(dashboard_language, primary_language)
+
+
+def invalidate_language_profile(user_id):
+    """Kullanıcının tüm session'lardaki profil kopyalarını geçersiz kıl"""
+    cache.set(_version_key(user_id), uuid.uuid4().hex, VERSION_TIMEOUT)
+
+
+@receiver(post_save, sender='dashboard.DashboardTranslationSettings')
+@receiver(post_delete, sender='dashboard.DashboardTranslationSettings')
+def language_settings_changed(sender, instance, **kwargs):
+    # Commit öncesi okunan eski kayıt yeni sürümle session'a yazılmasın
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_language_profile(user_id))
+
+
+@receiver(setting_changed)
+def reset_language_tables(*, setting, **kwargs):
+    if setting == 'LANGUAGES':
+        get_language_codes.cache_clear()
@@ -0,0 +1,150 @@
+# core/lazycontext.py
+"""
+Tembel (lazy) context processor'lar
+
+Django her RequestContext render'ında tüm context processor'ları çalıştırır;
+AJAX fragmanları ve hata sayfaları da kullanmadıkları değerlerin bedelini
+öder. @lazy_context ile işaretlenen processor'lar sadece anahtar listesini
+döndürür; her anahtar bir LazyContextValue'dur ve template ona ilk
+dokunduğunda processor bir kez çalıştırılır:
+
+    @lazy_context('breadcrumbs')
+    def breadcrumb_context(request):
+        ...
+        return {'breadcrumbs': breadcrumbs}
+
+Hiçbir anahtarına dokunulmayan processor hiç çalışmaz.
+
+Kullanım raporu: track() bloğu içinde render edilen template'lerin hangi
+anahtarları gerçekten kullandığı toplanır (context_usage_report komutu).
+Takip kapalıyken ek maliyet yoktur.
+"""
+import contextvars
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+
+from django.utils.functional import SimpleLazyObject
+
+_usage = contextvars.ContextVar('context_usage', default=None)
+_template = contextvars.ContextVar('context_template', default=None)
+
+UNKNOWN_TEMPLATE = '-'
+
+
+class LazyContextValue(SimpleLazyObject):
+    """İlk erişimde hesaplanan context değeri - erişim takip edilebilir"""
+
+    def __init__(self, func, key):
+        self.__dict__['_context_key'] = key
+        super().__init__(func)
+
+    def _setup(self):
+        super()._setup()
+        usage = _usage.get()
+        if usage is not None:
+            usage.consume(self.__dict__['_context_key'])
+
+    def __repr__(self):
+        return f"<LazyContextValue {self.__dict__['_context_key']!r}>"
+
+
+def lazy_context(*keys):
+    """
+    Context processor'ı tembel hale getir
+
+    Processor'ın döndürebileceği tüm anahtarlar verilmelidir; processor ilk
+    erişimde bir kez çalışır, döndürmediği anahtarlar None olur.
+    """
+    def decorator(processor):
+        @wraps(processor)
+        def wrapper(request):
+            computed = {}
+
+            def compute(key):
+                if 'values' not in computed:
+                    computed['values'] = processor(request) or {}
+                return computed['values'].get(key)
+
+            usage = _usage.get()
+            if usage is not None:
+                usage.provide(processor.__name__, keys)
+            return {key: LazyContextValue(lambda key=key: compute(key), key) for key in keys}
+
+        wrapper.lazy_keys = keys
+        return wrapper
+    return decorator
+
+
+# ========================
+# Kullanım raporu
+# ========================
+
+class ContextUsage:
+    """Template -> sağlanan / kullanılan context anahtarları"""
+
+    def __init__(self):
+        self.renders = defaultdict(int)
+        self.provided = defaultdict(set)
+        self.consumed = defaultdict(set)
+        self.processors = {}
+
+    def provide(self, processor_name, keys):
+        template = _template.get() or UNKNOWN_TEMPLATE
+        self.provided[template].update(keys)
+        for key in keys:
+            self.processors[key] = processor_name
+
+    def consume(self, key):
+        self.consumed[_template.get() or UNKNOWN_TEMPLATE].add(key)
+
+    def templates(self):
+        return sorted(set(self.provided) | set(self.consumed))
+
+    def unused(self, template):
+        return self.provided[template] - self.consumed[template]
+
+    def never_used(self):
+        """Hiçbir template'in kullanmadığı anahtarlar"""
+        provided = set().union(*self.provided.values()) if self.provided else set()
+        consumed = set().union(*self.consumed.values()) if self.consumed else set()
+        return provided - consumed
+
+
+def _template_name(template):
+    origin = getattr(template, 'origin', None)
+    return getattr(origin, 'template_name', None) or getattr(template, 'name', None) or UNKNOWN_TEMPLATE
+
+
+@contextmanager
+def track():
+    """
+    Blok içindeki render'larda context kullanımını topla
+
+        with lazycontext.track() as usage:
+            client.get('/')
+        usage.consumed
+    """
+    from django.template.context import RequestContext
+
+    original = RequestContext.bind_template
+
+    @contextmanager
+    def bind_template(self, template):
+        name = _template_name(template)
+        usage.renders[name] += 1
+        token = _template.set(name)
+        try:
+            with original(self, template):
+                yield
+        finally:
+            _template.reset(token)
+
+    usage = ContextUsage()
+    usage_token = _usage.set(usage)
+    RequestContext.bind_template = bind_template
+    try:
+        yield usage
+    finally:
+        RequestContext.bind_template = original
+        _usage.reset(usage_token)
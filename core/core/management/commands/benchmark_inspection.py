@@ -0,0 +1,72 @@
+# core/management/commands/benchmark_inspection.py
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+import re
+import timeit
+
+from core.inspection import RequestInspector, get_inspection_rules
+
+
+class Command(BaseCommand):
+    help = 'İstek denetim motorunu eski pattern-başına döngü ile karşılaştırır'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--params',
+            type=int,
+            default=10,
+            help='İstek başına GET parametre sayısı (varsayılan: 10)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=5000,
+            help='Ölçüm tekrar sayısı (varsayılan: 5000)',
+        )
+        parser.add_argument(
+            '--malicious',
+            action='store_true',
+            help='Parametrelerden birine saldırı deseni ekle',
+        )
+
+    def handle(self, *args, **options):
+        rules = get_inspection_rules()
+        inspector = RequestInspector(rules)
+
+        params = {
+            f'param{i}': f'deger-{i} arama metni sayfa {i}'
+            for i in range(options['params'])
+        }
+        if options['malicious']:
+            params['param0'] = "1' UNION SELECT password FROM users --"
+        request = RequestFactory().get('/urunler/', params)
+
+        def legacy():
+            # Eski davranış: her istek her pattern için re.search (string pattern)
+            for rule_set, patterns in rules.items():
+                for param in request.GET.values():
+                    for pattern in patterns:
+                        if re.search(pattern, str(param), re.I):
+                            break
+
+        def engine():
+            inspector.inspect(request)
+
+        iterations = options['iterations']
+        legacy_time = timeit.timeit(legacy, number=iterations)
+        engine_time = timeit.timeit(engine, number=iterations)
+
+        self.stdout.write(self.style.SUCCESS('⏱️  İstek Denetim Benchmark'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"  • Kural sayısı: {len(inspector.rules)}")
+        self.stdout.write(f"  • Parametre sayısı: {len(params)}")
+        self.stdout.write(f"  • Tekrar: {iterations}")
+        self.stdout.write(
+            f"  • Eski döngü: {legacy_time / iterations * 1e6:.1f} µs/istek"
+        )
+        self.stdout.write(
+            f"  • Birleşik motor: {engine_time / iterations * 1e6:.1f} µs/istek"
+        )
+        if engine_time:
+            self.stdout.write(f"  • Hızlanma: {legacy_time / engine_time:.1f}x")
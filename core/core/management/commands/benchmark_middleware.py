@@ -0,0 +1,109 @@
+# core/management/commands/benchmark_middleware.py
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+import ast
+import os
+import timeit
+
+EDGE_MIDDLEWARE = 'core.middleware.EdgeMiddleware'
+
+DEFAULT_PATHS = [
+    '/static/css/modal.css',
+    '/media/products/ornek.jpg',
+    '/favicon.ico',
+    '/robots.txt',
+    '/products/',
+    '/tr/urunler/',
+]
+
+
+def load_production_middleware():
+    """
+    core/settings/production.py içindeki MIDDLEWARE listesini import etmeden
+    oku (production ayarları ortam değişkeni gerektirir)
+    """
+    path = os.path.join(settings.BASE_DIR, 'core', 'settings', 'production.py')
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == 'MIDDLEWARE'
+            for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    return []
+
+
+def build_chain(middleware):
+    """Middleware listesinden (boş view ile biten) handler zinciri kur"""
+    def view(request):
+        return HttpResponse('')
+
+    handler = view
+    for path in reversed(middleware):
+        try:
+            handler = import_string(path)(handler)
+        except MiddlewareNotUsed:
+            continue
+    return handler
+
+
+class Command(BaseCommand):
+    help = "Production middleware zincirinin istek başına maliyetini EdgeMiddleware ile/olmadan ölçer"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=2000,
+            help='Yol başına ölçüm tekrar sayısı (varsayılan: 2000)',
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='Ölçülecek yol (birden fazla verilebilir)',
+        )
+
+    def handle(self, *args, **options):
+        middleware = load_production_middleware()
+        if not middleware:
+            self.stdout.write(self.style.ERROR('❌ production.py içinde MIDDLEWARE bulunamadı'))
+            return
+
+        without_edge = [path for path in middleware if path != EDGE_MIDDLEWARE]
+        # Edge production.py'deki yerinde ölçülür (SecurityMiddleware'in arkasında)
+        with_edge = middleware if EDGE_MIDDLEWARE in middleware else [EDGE_MIDDLEWARE] + without_edge
+        chains = {
+            'Edge olmadan': build_chain(without_edge),
+            'Edge ile': build_chain(with_edge),
+        }
+
+        factory = RequestFactory(HTTP_HOST=settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost')
+        iterations = options['iterations']
+        paths = options['paths'] or DEFAULT_PATHS
+
+        self.stdout.write(self.style.SUCCESS('⏱️  Middleware Zinciri Benchmark'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"  • Middleware sayısı: {len(without_edge)} (+ edge)")
+        self.stdout.write(f"  • Tekrar: {iterations}")
+
+        for path in paths:
+            self.stdout.write(f"\n📍 {path}")
+            timings = {}
+            for label, chain in chains.items():
+                status = chain(factory.get(path)).status_code
+                elapsed = timeit.timeit(lambda: chain(factory.get(path)), number=iterations)
+                timings[label] = elapsed
+                self.stdout.write(
+                    f"  • {label}: {elapsed / iterations * 1e6:.1f} µs/istek (HTTP {status})"
+                )
+            if timings['Edge ile']:
+                self.stdout.write(
+                    f"  • Hızlanma: {timings['Edge olmadan'] / timings['Edge ile']:.1f}x"
+                )
@@ -0,0 +1,74 @@
+# core/management/commands/build_sitemaps.py
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import sitemapfiles
+
+
+class Command(BaseCommand):
+    help = 'Sitemap dosyalarını (bölüm + dil bazında) ve index\'i yazar (core.sitemapfiles)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--section',
+            action='append',
+            default=[],
+            help=f"Sadece bu bölüm ({', '.join(sitemapfiles.SECTIONS)})",
+        )
+        parser.add_argument(
+            '--base-url',
+            help='Site kök adresi (örn. https://ornek.com) - varsayılan: SITEMAP_FILES BASE_URL / manifest',
+        )
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='Yazmadan mevcut manifest\'i ve eski bölümleri göster',
+        )
+
+    def handle(self, *args, **options):
+        unknown = [name for name in options['section'] if name not in sitemapfiles.SECTIONS]
+        if unknown:
+            raise CommandError(f"Bilinmeyen bölüm: {', '.join(unknown)}")
+
+        if options['status']:
+            self._show_status()
+            return
+
+        self.stdout.write(self.style.SUCCESS('🗺️  Sitemap Dosyaları'))
+        started = time.perf_counter()
+        manifest = sitemapfiles.rebuild(options['section'] or None, base_url=options['base_url'])
+        elapsed = (time.perf_counter() - started) * 1000
+        if manifest is None:
+            raise CommandError('Sitemap yazılamadı - kök adres yok (--base-url) veya kilit alınamadı')
+
+        self._show_manifest(manifest, options['section'] or list(sitemapfiles.SECTIONS))
+        self.stdout.write(f'⏱️  {elapsed:.0f} ms')
+
+    def _show_manifest(self, manifest, names):
+        config = sitemapfiles.get_sitemap_files_settings()
+        self.stdout.write(f"🌐 Kök adres: {manifest['base_url']}")
+        self.stdout.write(f"📁 Dizin: {config['ROOT']}")
+        for name in names:
+            section = manifest['sections'].get(name)
+            if section is None:
+                self.stdout.write(self.style.WARNING(f'   {name}: yazılmamış'))
+                continue
+            urls = sum(entry['urls'] for entry in section['files'])
+            self.stdout.write(
+                f"   {name:<12} {len(section['files']):>3} dosya  {urls:>7} URL  "
+                f"{section.get('build_ms', 0):>6} ms  ({', '.join(section['languages'])})"
+            )
+
+    def _show_status(self):
+        manifest = sitemapfiles.read_manifest()
+        if manifest is None:
+            self.stdout.write(self.style.WARNING('📭 Sitemap henüz yazılmamış'))
+            return
+        self._show_manifest(manifest, list(sitemapfiles.SECTIONS))
+        stale = sitemapfiles.stale_sections(manifest)
+        if stale:
+            self.stdout.write(self.style.WARNING(f"⚠️  Eski bölümler: {', '.join(stale)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS('✅ Tüm bölümler güncel'))
@@ -0,0 +1,22 @@
+# core/management/commands/compact_404_errors.py
+
+from django.core.management.base import BaseCommand
+
+from core import notfound
+
+
+class Command(BaseCommand):
+    help = "404 ring buffer'ını günlük yol sayaçlarına (NotFoundStat) sıkıştırır - cron ile çalıştırın"
+
+    def handle(self, *args, **options):
+        result = notfound.compact()
+
+        self.stdout.write(self.style.SUCCESS('🗜️  404 Sıkıştırma'))
+        self.stdout.write('=' * 50)
+        self.stdout.write(f"  • İşlenen olay: {result['events']}")
+        self.stdout.write(f"  • Güncellenen satır: {result['rows']}")
+        if result['lost']:
+            self.stdout.write(self.style.WARNING(
+                f"  ⚠️ Ring buffer taştı, {result['lost']} olay kayboldu - "
+                f"komutu daha sık çalıştırın veya NOT_FOUND_STORE['RING_SIZE'] değerini artırın"
+            ))
@@ -0,0 +1,42 @@
+# core/management/commands/compute_cache_stats.py
+
+from django.core.management.base import BaseCommand
+
+from core import stampede
+
+
+class Command(BaseCommand):
+    help = 'get_or_compute yeniden hesaplama metriklerini gösterir (core.stampede)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Metrikleri sıfırla',
+        )
+
+    def handle(self, *args, **options):
+        if options['reset']:
+            stampede.reset_metrics()
+            self.stdout.write(self.style.SUCCESS('🧹 Metrikler sıfırlandı'))
+            return
+
+        metrics = stampede.get_metrics()
+        self.stdout.write(self.style.SUCCESS('🔥 Cache Yeniden Hesaplama Metrikleri'))
+        self.stdout.write('=' * 70)
+
+        if not metrics:
+            self.stdout.write('📭 Henüz yeniden hesaplama kaydı yok')
+            return
+
+        self.stdout.write(f"{'İsim':<36} {'Adet':>6} {'Ort ms':>9} {'Maks ms':>9} {'Son ms':>9}")
+        for name, data in sorted(metrics.items(), key=lambda item: -item[1]['total_ms']):
+            average = data['total_ms'] / data['count'] if data['count'] else 0
+            self.stdout.write(
+                f"{name[:36]:<36} {data['count']:>6} {average:>9.1f} {data['max_ms']:>9.1f} {data['last_ms']:>9.1f}"
+            )
+            reasons = ', '.join(f'{reason}={count}' for reason, count in sorted(data['reasons'].items()))
+            self.stdout.write(f'   ↳ {reasons}')
+
+        self.stdout.write('')
+        self.stdout.write('ℹ️  miss: cache boş | expired: süre doldu | early: XFetch erken yenileme | wait_timeout: kilit beklenemedi')
@@ -0,0 +1,89 @@
+# core/management/commands/context_usage_report.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core import lazycontext
+
+
+DEFAULT_URLS = [
+    '/tr/',
+    '/tr/urunler/',
+    '/tr/galeri/',
+    '/tr/hakkimizda/',
+    '/tr/hakkimizda/hizmetler/',
+    '/tr/iletisim/',
+    '/tr/olmayan-sayfa-rapor/',  # 404 şablonu
+]
+
+
+class Command(BaseCommand):
+    help = 'Hangi template\'in hangi tembel context anahtarlarını kullandığını raporlar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            action='append',
+            default=[],
+            help='Rapora eklenecek URL (birden fazla verilebilir)',
+        )
+        parser.add_argument(
+            '--only',
+            action='store_true',
+            help='Varsayılan URL\'leri atla, sadece --url ile verilenleri render et',
+        )
+        parser.add_argument(
+            '--show-consumed',
+            action='store_true',
+            help='Kullanılan anahtarları da listele',
+        )
+
+    def handle(self, *args, **options):
+        urls = ([] if options['only'] else list(DEFAULT_URLS)) + options['url']
+        hosts = [host for host in settings.ALLOWED_HOSTS if host not in ('*',) and not host.startswith('.')]
+        client = Client(HTTP_HOST=hosts[0] if hosts else 'localhost')
+
+        self.stdout.write(self.style.SUCCESS('🧩 Context Kullanım Raporu'))
+        self.stdout.write('=' * 60)
+
+        # Sayfa cache'i kapalı - her URL gerçekten render edilsin
+        with override_settings(PAGE_CACHE={'ENABLED': False}), lazycontext.track() as usage:
+            for url in urls:
+                with CaptureQueriesContext(connection) as queries:
+                    try:
+                        response = client.get(url)
+                    except Exception as e:
+                        self.stdout.write(self.style.ERROR(f'❌ {url}: {e}'))
+                        continue
+                self.stdout.write(
+                    f'🌐 {url} -> {response.status_code} ({len(queries.captured_queries)} sorgu)'
+                )
+
+        self.stdout.write('')
+        for template in usage.templates():
+            provided = usage.provided[template]
+            consumed = usage.consumed[template]
+            unused = usage.unused(template)
+            self.stdout.write(self.style.HTTP_INFO(f'📄 {template}'))
+            self.stdout.write(
+                f'   render: {usage.renders.get(template, 0)} | '
+                f'sağlanan: {len(provided)} | kullanılan: {len(consumed)} | kullanılmayan: {len(unused)}'
+            )
+            if options['show_consumed'] and consumed:
+                self.stdout.write(f"   ✅ {', '.join(sorted(consumed))}")
+            if consumed and unused:
+                self.stdout.write(f"   💤 {', '.join(sorted(unused))}")
+            elif not consumed:
+                self.stdout.write('   💤 Hiçbir anahtar kullanılmadı - processor\'lar çalışmadı')
+
+        self.stdout.write('')
+        never_used = usage.never_used()
+        if never_used:
+            self.stdout.write(self.style.WARNING(f'⚠️  Hiçbir template\'te kullanılmayan anahtarlar ({len(never_used)}):'))
+            for key in sorted(never_used):
+                self.stdout.write(f'   - {key} ({usage.processors.get(key, "?")})')
+        else:
+            self.stdout.write(self.style.SUCCESS('✅ Tüm anahtarlar en az bir template\'te kullanıldı'))
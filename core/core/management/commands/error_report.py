@@ -1,12 +1,15 @@
 # core/management/commands/error_report.py - YENİ DOSYA OLUŞTUR
 
 from django.core.management.base import BaseCommand
-from django.core.cache import cache
-from django.conf import settings
+from django.db.models import Count, Sum
 from django.utils import timezone
 from collections import Counter
+from datetime import datetime, timedelta
 import json
 
+from core import notfound
+from core.models import NotFoundStat
+
 class Command(BaseCommand):
     help = '404 hata raporunu görüntüler ve analiz eder'
 
@@ -21,6 +24,17 @@ class Command(BaseCommand):
             type=str,
             help='Raporu JSON dosyasına aktar',
         )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=7,
+            help='Raporlanacak gün sayısı (varsayılan: 7)',
+        )
+        parser.add_argument(
+            '--no-compact',
+            action='store_true',
+            help='Rapordan önce ring buffer\'ı sıkıştırma',
+        )
         parser.add_argument(
             '--top',
             type=int,
@@ -36,15 +50,22 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('📊 404 Hata Raporu Analizi'))
         self.stdout.write('=' * 50)
         
-        # Cache'den 404 hatalarını al
-        errors = cache.get('404_errors_list', [])
+        # Ring buffer'daki yeni olayları günlük sayaçlara aktar
+        if not options['no_compact']:
+            result = notfound.compact()
+            if result['events']:
+                self.stdout.write(f"🗜️  {result['events']} yeni olay sıkıştırıldı")
         
-        if not errors:
+        since = timezone.localdate() - timedelta(days=options['days'] - 1)
+        stats = NotFoundStat.objects.filter(date__gte=since)
+        recent = notfound.get_recent_events()
+        
+        if not stats.exists() and not recent:
             self.stdout.write(self.style.WARNING('Hiç 404 hatası kaydı bulunamadı.'))
             return
         
         # Analiz yap
-        analysis = self._analyze_errors(errors)
+        analysis = self._analyze_errors(stats, recent, options['top'], options['days'])
         
         # Raporu göster
         self._display_report(analysis, options['top'])
@@ -53,30 +74,47 @@ class Command(BaseCommand):
         if options['export']:
             self._export_report(analysis, options['export'])
 
-    def _analyze_errors(self, errors):
-        """404 hatalarını analiz et"""
+    def _analyze_errors(self, stats, recent, top_count, days):
+        """
+        404 hatalarını analiz et - toplamlar veritabanındaki günlük sayaçlardan,
+        IP ve saatlik dağılım ring buffer'daki son olaylardan hesaplanır
+        """
+        totals = stats.aggregate(total=Sum('hits'), paths=Count('path', distinct=True))
+        path_counts = list(
+            stats.values('path').annotate(count=Sum('hits')).order_by('-count')[:top_count * 5]
+        )
+        
+        # Referrer özetleri sınırlı bellekte birleştirilir
+        referrers = notfound.SpaceSaving(top_count * 5)
+        for top_referrers in stats.exclude(top_referrers={}).values_list('top_referrers', flat=True).iterator():
+            referrers.merge(top_referrers)
+        
         analysis = {
-            'total_errors': len(errors),
-            'unique_paths': len(set(error['path'] for error in errors)),
-            'unique_ips': len(set(error['ip'] for error in errors)),
-            'path_counts': Counter(error['path'] for error in errors),
-            'ip_counts': Counter(error['ip'] for error in errors),
-            'referrer_counts': Counter(error.get('referrer', 'Direct') for error in errors if error.get('referrer')),
+            'days': days,
+            'total_errors': totals['total'] or 0,
+            'unique_paths': totals['paths'] or 0,
+            'unique_ips': len(set(error['ip'] for error in recent)),
+            'path_counts': [(row['path'], row['count']) for row in path_counts],
+            'ip_counts': Counter(error['ip'] for error in recent),
+            'referrer_counts': referrers.most_common(),
+            'daily_distribution': list(
+                stats.values_list('date').annotate(count=Sum('hits')).order_by('date')
+            ),
             'hourly_distribution': {},
             'critical_errors': [],
-            'recent_errors': sorted(errors, key=lambda x: x['timestamp'], reverse=True)[:20]
+            'recent_errors': sorted(recent, key=lambda x: x['timestamp'], reverse=True)[:20]
         }
         
-        # Saatlik dağılım
-        for error in errors:
+        # Saatlik dağılım (son olaylar)
+        for error in recent:
             try:
-                hour = timezone.datetime.fromisoformat(error['timestamp']).hour
+                hour = timezone.localtime(datetime.fromisoformat(error['timestamp'])).hour
                 analysis['hourly_distribution'][hour] = analysis['hourly_distribution'].get(hour, 0) + 1
-            except:
+            except (KeyError, ValueError):
                 pass
         
         # Kritik hatalar
-        for path, count in analysis['path_counts'].items():
+        for path, count in analysis['path_counts']:
             if self._is_critical_path(path) or count > 5:
                 analysis['critical_errors'].append({
                     'path': path,
@@ -104,14 +142,14 @@ class Command(BaseCommand):
 
     def _display_report(self, analysis, top_count):
         """Raporu konsola yazdır"""
-        self.stdout.write(f"\n📈 Genel İstatistikler:")
+        self.stdout.write(f"\n📈 Genel İstatistikler (son {analysis['days']} gün):")
         self.stdout.write(f"  • Toplam 404 hatası: {analysis['total_errors']}")
         self.stdout.write(f"  • Benzersiz path sayısı: {analysis['unique_paths']}")
-        self.stdout.write(f"  • Benzersiz IP sayısı: {analysis['unique_ips']}")
+        self.stdout.write(f"  • Benzersiz IP sayısı (son olaylar): {analysis['unique_ips']}")
         
         # En çok 404 alan path'ler
         self.stdout.write(f"\n🔥 En Çok 404 Alan Sayfalar (Top {top_count}):")
-        for path, count in analysis['path_counts'].most_common(top_count):
+        for path, count in analysis['path_counts'][:top_count]:
             status = "🔴 KRİTİK" if self._is_critical_path(path) else "ℹ️  Normal"
             self.stdout.write(f"  {status} {path}: {count} kez")
         
@@ -122,10 +160,10 @@ class Command(BaseCommand):
         
         # Referrer analizi
         if analysis['referrer_counts']:
-            self.stdout.write(f"\n🔗 Referrer Analizi (Top 5):")
-            for referrer, count in analysis['referrer_counts'].most_common(5):
+            self.stdout.write(f"\n🔗 Referrer Analizi (Top 5, tahmini sayılar):")
+            for referrer, count in analysis['referrer_counts'][:5]:
                 referrer_display = referrer if referrer != 'Direct' else 'Doğrudan Erişim'
-                self.stdout.write(f"  • {referrer_display}: {count} kez")
+                self.stdout.write(f"  • {referrer_display}: ~{count} kez")
         
         # Kritik hatalar
         if analysis['critical_errors']:
@@ -133,6 +171,12 @@ class Command(BaseCommand):
             for error in sorted(analysis['critical_errors'], key=lambda x: x['count'], reverse=True):
                 self.stdout.write(f"  🔴 {error['path']}: {error['count']} kez")
         
+        # Günlük dağılım
+        if analysis['daily_distribution']:
+            self.stdout.write(f"\n📅 Günlük Dağılım:")
+            for date, count in analysis['daily_distribution']:
+                self.stdout.write(f"  {date} ({count})")
+        
         # Saatlik dağılım
         if analysis['hourly_distribution']:
             self.stdout.write(f"\n⏰ Saatlik Dağılım:")
@@ -158,5 +202,5 @@ class Command(BaseCommand):
 
     def _clear_error_cache(self):
         """404 hata cache'ini temizle"""
-        cache.delete('404_errors_list')
-        self.stdout.write(self.style.SUCCESS("✅ 404 hata cache'i temizlendi."))
\ No newline at end of file
+        notfound.clear()
+        self.stdout.write(self.style.SUCCESS("✅ 404 hata cache'i (ring buffer) temizlendi. Günlük sayaçlar korundu."))
\ No newline at end of file
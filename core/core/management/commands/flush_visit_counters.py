@@ -0,0 +1,29 @@
+# core/management/commands/flush_visit_counters.py
+
+from django.core.management.base import BaseCommand
+
+from core import visits
+
+
+class Command(BaseCommand):
+    help = "Cache'te biriken ziyaret sayaçlarını veritabanına toplu olarak yazar (cron ile çalıştırın)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Sadece bekleyen ziyaret sayısını göster',
+        )
+
+    def handle(self, *args, **options):
+        pending = visits.get_pending_visits()
+        self.stdout.write(f"📥 Bekleyen ziyaret: {pending}")
+
+        if options['dry_run'] or pending <= 0:
+            return
+
+        flushed = visits.flush_visits()
+        if flushed:
+            self.stdout.write(self.style.SUCCESS(f"✅ {flushed} ziyaret About.completed_jobs'a yazıldı"))
+        else:
+            self.stdout.write(self.style.WARNING('⚠️ Ziyaretler yazılamadı (About kaydı yok mu / başka bir flush mu çalışıyor?)'))
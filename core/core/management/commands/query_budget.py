@@ -0,0 +1,90 @@
+# core/management/commands/query_budget.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import querybudget
+
+
+class Command(BaseCommand):
+    help = 'Tüm isimli URL\'leri anonim/staff/superuser olarak ister, sorgu ve süre bütçesini raporlar (kapı: core.tests.QueryBudgetTests)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            help='Büyük tablo başına sentetik kayıt (varsayılan: QUERY_BUDGET ROWS)',
+        )
+        parser.add_argument(
+            '--role',
+            action='append',
+            choices=querybudget.ROLES,
+            default=[],
+            help='Sadece bu rol (birden fazla verilebilir)',
+        )
+        parser.add_argument(
+            '--only',
+            action='append',
+            default=[],
+            help='Sadece bu önekle başlayan URL adları (örn. dashboard:)',
+        )
+        parser.add_argument(
+            '--no-time',
+            action='store_true',
+            help='Render süresi bütçesini kontrol etme (yavaş CI makineleri için)',
+        )
+
+    def handle(self, *args, **options):
+        config = querybudget.get_budget_settings()
+        roles = options['role'] or list(querybudget.ROLES)
+        rows = options['rows'] or config['ROWS']
+
+        self.stdout.write(self.style.SUCCESS('📏 Sorgu Bütçesi'))
+        self.stdout.write(
+            f"🗄️  Sentetik kayıt: {rows} | varsayılan bütçe: {config['QUERIES']} sorgu, {config['RENDER_MS']} ms"
+        )
+
+        results, skipped = querybudget.run(rows=rows, roles=roles, only=options['only'])
+        if options['no_time']:
+            for row in results:
+                row['over'] = [item for item in row['over'] if item != 'ms']
+
+        self.stdout.write('=' * 100)
+        header = f"{'URL adı':<44} " + ' '.join(f'{role:>16}' for role in roles) + f" {'bütçe':>12}"
+        self.stdout.write(header)
+        self.stdout.write('-' * 100)
+
+        by_name = {}
+        for row in results:
+            by_name.setdefault(row['name'], {})[row['role']] = row
+
+        failures = []
+        for name, rows_by_role in by_name.items():
+            cells = []
+            for role in roles:
+                row = rows_by_role[role]
+                cell = f"{row['queries']:>3}q {row['ms']:>6.0f}ms {row['status']!s:>3}"
+                if row['over']:
+                    failures.append(row)
+                    cell = self.style.ERROR(f'{cell:>16}')
+                else:
+                    cell = f'{cell:>16}'
+                cells.append(cell)
+            first = next(iter(rows_by_role.values()))
+            budget = f"{first['budget_queries']}q/{first['budget_ms']}ms"
+            self.stdout.write(f'{name[:44]:<44} ' + ' '.join(cells) + f' {budget:>12}')
+
+        if skipped:
+            self.stdout.write('')
+            self.stdout.write(f'⏭️  Atlanan: {len(skipped)}')
+            for name, reason in skipped:
+                self.stdout.write(f'   {name}: {reason}')
+
+        self.stdout.write('')
+        if failures:
+            for row in failures:
+                self.stdout.write(self.style.ERROR(
+                    f"❌ {row['name']} ({row['role']}): HTTP {row['status']}, {row['queries']} sorgu / "
+                    f"{row['ms']:.0f} ms - bütçe {row['budget_queries']} / {row['budget_ms']} ms"
+                ))
+            raise CommandError(f'{len(failures)} istek bütçeyi aştı')
+        self.stdout.write(self.style.SUCCESS(f'✅ {len(results)} istek bütçe içinde'))
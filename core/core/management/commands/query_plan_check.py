@@ -0,0 +1,104 @@
+# core/management/commands/query_plan_check.py
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core import queryplans
+
+
+class Command(BaseCommand):
+    help = 'Sayfa sorgularının EXPLAIN planlarını baseline ile karşılaştırır (core.queryplans)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            help='Büyük tablo başına sentetik kayıt (varsayılan: QUERY_PLAN_CHECK ROWS)',
+        )
+        parser.add_argument(
+            '--url',
+            action='append',
+            default=[],
+            help='Ek URL (birden fazla verilebilir)',
+        )
+        parser.add_argument(
+            '--public-only',
+            action='store_true',
+            help='Dashboard sayfalarını atla',
+        )
+        parser.add_argument(
+            '--update-baseline',
+            action='store_true',
+            help='Mevcut planları baseline olarak kaydet',
+        )
+        parser.add_argument(
+            '--allow-new-scans',
+            action='store_true',
+            help='Baseline\'da olmayan ve büyük tablo tarayan sorgular sadece uyarı olsun',
+        )
+        parser.add_argument(
+            '--show-plans',
+            action='store_true',
+            help='Tüm sorguların planlarını yazdır',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            raise CommandError(f'EXPLAIN desteklenmiyor: {connection.vendor}')
+
+        config = queryplans.get_query_plan_settings()
+        rows = options['rows'] or config['ROWS']
+        self.stdout.write(self.style.SUCCESS('🔍 Sorgu Planı Kontrolü'))
+        self.stdout.write(f'🗄️  Veritabanı: {connection.vendor} | sentetik kayıt: {rows}')
+        self.stdout.write('=' * 70)
+
+        started = time.perf_counter()
+        plans, pages = queryplans.run(
+            rows=rows, include_dashboard=not options['public_only'], extra_urls=options['url'],
+        )
+        elapsed = time.perf_counter() - started
+
+        for url, status, count in pages:
+            style = self.style.SUCCESS if status == 200 else self.style.WARNING
+            self.stdout.write(style(f'🌐 {url} -> {status} ({count} sorgu)'))
+        self.stdout.write(f'📊 {len(plans)} farklı sorgu, {elapsed:.1f} sn')
+
+        if options['show_plans']:
+            for key, plan in sorted(plans.items(), key=lambda item: item[1]['urls'][0]):
+                self.stdout.write('')
+                self.stdout.write(self.style.HTTP_INFO(f"[{key}] {plan['sql'][:160]}"))
+                for line in plan['plan']:
+                    self.stdout.write(f'   {line}')
+
+        if options['update_baseline']:
+            queryplans.save_baseline(plans, config)
+            scanning = sum(1 for plan in plans.values() if plan['scans'])
+            self.stdout.write(self.style.SUCCESS(
+                f"💾 Baseline kaydedildi: {config['BASELINE']} ({len(plans)} sorgu, {scanning} tam tarama)"
+            ))
+            return
+
+        baseline = queryplans.load_baseline(config)
+        if not baseline:
+            raise CommandError('Baseline yok - önce --update-baseline ile oluşturun')
+
+        regressions, new_scans = queryplans.compare(plans, baseline)
+        self.stdout.write('')
+        for key, plan, tables in new_scans:
+            style = self.style.WARNING if options['allow_new_scans'] else self.style.ERROR
+            self.stdout.write(style(f"🆕 [{key}] yeni sorgu tam tarama: {', '.join(tables)}"))
+            self.stdout.write(f"   {plan['sql'][:160]}")
+            self.stdout.write(f"   ↳ {', '.join(plan['urls'])}")
+        for key, plan, tables in regressions:
+            self.stdout.write(self.style.ERROR(f"❌ [{key}] index yerine tam tarama: {', '.join(tables)}"))
+            self.stdout.write(f"   {plan['sql'][:160]}")
+            self.stdout.write(f"   ↳ {', '.join(plan['urls'])}")
+            for line in plan['plan']:
+                self.stdout.write(f'      {line}')
+
+        failed = len(regressions) + (0 if options['allow_new_scans'] else len(new_scans))
+        if failed:
+            raise CommandError(f'{failed} sorgu planı regresyonu')
+        self.stdout.write(self.style.SUCCESS('✅ Plan regresyonu yok'))
@@ -0,0 +1,92 @@
+# core/management/commands/refresh_storage_usage.py
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from core import storageusage
+
+
+class Command(BaseCommand):
+    help = 'Cloudinary depolama kullanımını yeniler (cron ile zamanlanabilir)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='Yenilemeden mevcut değeri ve metrikleri göster',
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Sürekli çalış, her --interval saniyede bir yenile',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=None,
+            help='--loop aralığı (varsayılan: FRESH_TIMEOUT)',
+        )
+
+    def handle(self, *args, **options):
+        if options['status']:
+            self.show_status()
+            return
+
+        if not options['loop']:
+            self.refresh_once()
+            return
+
+        interval = options['interval'] or storageusage.get_storage_usage_settings()['FRESH_TIMEOUT']
+        self.stdout.write(f'🔁 Her {interval} saniyede bir yenilenecek (Ctrl+C ile çıkış)')
+        try:
+            while True:
+                self.refresh_once()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.stdout.write('\n👋 Durduruldu')
+
+    def refresh_once(self):
+        before = (storageusage.get_metrics() or {}).get('fetch_count', 0)
+        data = storageusage.refresh()
+        metrics = storageusage.get_metrics() or {}
+        if data is None:
+            if metrics.get('fetch_count', 0) > before:
+                self.stdout.write(self.style.ERROR(f"❌ Yenileme başarısız: {metrics['last_error']}"))
+            else:
+                self.stdout.write(self.style.WARNING('⏳ Başka bir yenileme sürüyor, atlandı'))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {data['used_gb']}GB / {data['limit_gb']}GB (%{data['usage_percentage']}) "
+            f"- {metrics.get('last_latency_ms')} ms"
+        ))
+
+    def show_status(self):
+        self.stdout.write(self.style.SUCCESS('☁️  Cloudinary Depolama Durumu'))
+        self.stdout.write('=' * 50)
+
+        config = storageusage.get_storage_usage_settings()
+        entry = storageusage.cachetags.get_cache().get(storageusage.ENTRY_KEY)
+        if entry is None:
+            self.stdout.write(self.style.WARNING('📭 Cache\'te değer yok - ilk istekte yüklenecek'))
+        else:
+            data = entry['data']
+            age = int(time.time() - entry['fetched_at'])
+            state = '🟢 taze' if storageusage.is_fresh(entry, config) else '🟡 bayat'
+            self.stdout.write(f"📦 Kullanım: {data['used_gb']}GB / {data['limit_gb']}GB (%{data['usage_percentage']})")
+            self.stdout.write(f'🕒 Yaş: {age} sn ({state})')
+            if data.get('error'):
+                self.stdout.write(self.style.ERROR('❌ Son bilinen değer hata değerleri'))
+
+        metrics = storageusage.get_metrics()
+        if not metrics:
+            self.stdout.write('📊 Henüz API çağrısı yapılmadı')
+            return
+        self.stdout.write(f"📊 Çağrı: {metrics['fetch_count']} | Hata: {metrics['error_count']}")
+        self.stdout.write(f"⏱️  Son süre: {metrics['last_latency_ms']} ms")
+        if metrics['last_success_at']:
+            self.stdout.write(f"✅ Son başarı: {metrics['last_success_at']:%Y-%m-%d %H:%M:%S}")
+        if metrics['last_error_at']:
+            self.stdout.write(self.style.WARNING(
+                f"⚠️  Son hata: {metrics['last_error_at']:%Y-%m-%d %H:%M:%S} - {metrics['last_error']}"
+            ))
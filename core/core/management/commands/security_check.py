@@ -68,6 +68,9 @@ class Command(BaseCommand):
         middleware = getattr(settings, 'MIDDLEWARE', [])
         for mw in security_middlewares:
             if mw not in middleware:
+                # X-Frame-Options SecurityHeadersMiddleware tarafından da eklenir
+                if mw.endswith('XFrameOptionsMiddleware') and 'core.middleware.SecurityHeadersMiddleware' in middleware:
+                    continue
                 issues.append(f'MEDIUM: {mw} middleware eksik')
         
         # Sonuçları göster
@@ -10,6 +10,8 @@ import json
 import requests
 from datetime import datetime
 
+from core import timing
+
 class Command(BaseCommand):
     help = 'SEO audit ve monitoring'
 
@@ -353,9 +355,12 @@ class Command(BaseCommand):
             try:
                 client = Client()
                 start_time = time.time()
-                response = client.get('/')
+                with timing.measure() as timer:
+                    response = client.get('/')
                 end_time = time.time()
                 performance['avg_response_time'] = round((end_time - start_time) * 1000, 2)
+                # DB / cache / template kırılımı
+                performance['breakdown'] = timer.as_dict()
             except Exception as e:
                 performance['avg_response_time'] = 0
                 performance['recommendations'].append(f'Ana sayfa testi başarısız: {str(e)[:50]}')
@@ -1,93 +1,70 @@
 # core/middleware.py
 import logging
-from django.http import HttpResponseForbidden, HttpResponsePermanentRedirect, HttpResponseRedirect
+from django.http import (
+    Http404, HttpResponse, HttpResponseForbidden, HttpResponseNotFound,
+    HttpResponsePermanentRedirect, HttpResponseRedirect,
+)
 from django.urls import reverse
+from django.core.exceptions import MiddlewareNotUsed
 from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
 from django.core.cache import cache
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
 from django.contrib.auth.signals import user_login_failed
+from django.contrib.sessions.middleware import SessionMiddleware
 from django.dispatch import receiver
-import re
+import random
 import time
 from django.utils import translation
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from .inspection import get_inspector, inspect_request
+from .client_ip import get_client_ip, resolve_client_ip
+from .language import get_language_codes, get_language_profile
+from .edge import (
+    NON_SITE_ROUTES, REQUEST_ATTRIBUTE as EDGE_ROUTE_ATTRIBUTE, ROUTE_ADMIN,
+    ROUTE_DASHBOARD, ROUTE_FAVICON, ROUTE_MEDIA, ROUTE_REDIRECT, ROUTE_ROBOTS,
+    ROUTE_STATIC, SESSIONLESS_ROUTES, get_edge_route, get_edge_settings, get_router,
+    is_sessionless,
+)
+from .ratelimit import get_limiter
+from .redirects import get_redirect_index
+from . import notfound, pagecache, timing, visits
+from .security_headers import CSPNonce, DEFAULT_PROFILE, build_header_bundles, resolve_profile_name
 from django.core.cache import cache
 from django.conf import settings
 import logging
 
 # Security logger
 security_logger = logging.getLogger('core.security')
+language_logger = logging.getLogger('core.language')
 
 class SecurityHeadersMiddleware:
     """
     Gelişmiş güvenlik başlıkları middleware'i
+
+    Başlıklar açılışta core.security_headers ile profillere göre
+    dondurulur; response başına sadece tek geçişte uygulanır.
     """
     def __init__(self, get_response):
         self.get_response = get_response
+        self.bundles = build_header_bundles()
+        self.route_profiles = dict(getattr(settings, 'CSP_ROUTE_PROFILES', {}))
+        self.use_nonce = any(bundle.use_nonce for bundle in self.bundles.values())
 
     def __call__(self, request):
-        response = self.get_response(request)
+        if self.use_nonce:
+            request.csp_nonce = CSPNonce()
         
-        # Güvenlik başlıklarını ekle
-        self._add_security_headers(response)
+        response = self.get_response(request)
         
-        # CSP başlığını ekle
-        self._add_csp_header(response)
+        # Güvenlik + CSP başlıklarını ekle
+        profile = resolve_profile_name(request, self.route_profiles)
+        bundle = self.bundles.get(profile) or self.bundles[DEFAULT_PROFILE]
+        bundle.apply(response, getattr(request, 'csp_nonce', None))
         
         return response
-    
-    def _add_security_headers(self, response):
-        """Temel güvenlik başlıkları"""
-        # XSS koruması
-        response['X-XSS-Protection'] = '1; mode=block'
-        
-        # Content type sniffing koruması
-        response['X-Content-Type-Options'] = 'nosniff'
-        
-        # Clickjacking koruması
-        response['X-Frame-Options'] = 'DENY'
-        
-        # Referrer policy
-        response['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-        
-        # Permissions policy (önceki Feature-Policy)
-        response['Permissions-Policy'] = (
-            'camera=(), microphone=(), geolocation=(), '
-            'payment=(), usb=(), magnetometer=(), gyroscope=(), '
-            'accelerometer=(), ambient-light-sensor=()'
-        )
-        
-        # HSTS (sadece HTTPS'de)
-        if hasattr(settings, 'SECURE_HSTS_SECONDS') and settings.SECURE_HSTS_SECONDS > 0:
-            hsts_header = f'max-age={settings.SECURE_HSTS_SECONDS}'
-            if getattr(settings, 'SECURE_HSTS_INCLUDE_SUBDOMAINS', False):
-                hsts_header += '; includeSubDomains'
-            if getattr(settings, 'SECURE_HSTS_PRELOAD', False):
-                hsts_header += '; preload'
-            response['Strict-Transport-Security'] = hsts_header
-    
-    def _add_csp_header(self, response):
-        """Content Security Policy başlığı"""
-        csp_directives = []
-        
-        # CSP direktiflerini settings'ten al
-        csp_settings = {
-            'default-src': getattr(settings, 'CSP_DEFAULT_SRC', ["'self'"]),
-            'script-src': getattr(settings, 'CSP_SCRIPT_SRC', ["'self'"]),
-            'style-src': getattr(settings, 'CSP_STYLE_SRC', ["'self'"]),
-            'img-src': getattr(settings, 'CSP_IMG_SRC', ["'self'"]),
-            'font-src': getattr(settings, 'CSP_FONT_SRC', ["'self'"]),
-            'connect-src': getattr(settings, 'CSP_CONNECT_SRC', ["'self'"]),
-            'frame-src': getattr(settings, 'CSP_FRAME_SRC', ["'none'"]),
-            'object-src': getattr(settings, 'CSP_OBJECT_SRC', ["'none'"]),
-            'media-src': getattr(settings, 'CSP_MEDIA_SRC', ["'self'"]),
-        }
-        
-        for directive, sources in csp_settings.items():
-            if sources:
-                csp_directives.append(f"{directive} {' '.join(sources)}")
-        
-        if csp_directives:
-            response['Content-Security-Policy'] = '; '.join(csp_directives)
 
 class SecurityMonitoringMiddleware:
     """
@@ -95,17 +72,11 @@ class SecurityMonitoringMiddleware:
     """
     def __init__(self, get_response):
         self.get_response = get_response
+        # Şüpheli pattern'ler core.inspection içinde tek otomata derlenir
+        get_inspector()
         
-        # Şüpheli pattern'ler
-        self.suspicious_patterns = [
-            r'\.\./',  # Directory traversal
-            r'<script',  # XSS attempt
-            r'javascript:',  # XSS attempt
-            r'union\s+select',  # SQL injection
-            r'drop\s+table',  # SQL injection
-            r'exec\s*\(',  # Code injection
-            r'eval\s*\(',  # Code injection
-        ]
+        rate = getattr(settings, 'SECURITY_MONITORING', {}).get('RATE_LIMIT', '100/m')
+        self.rate_limiter = get_limiter('rate_limit', rate)
 
     def __call__(self, request):
         # İstek öncesi kontroller
@@ -121,47 +92,29 @@ class SecurityMonitoringMiddleware:
     
     def _check_suspicious_request(self, request):
         """Şüpheli istek kontrolü"""
-        ip_address = self._get_client_ip(request)
-        
-        # Query string ve POST data kontrolü
-        all_params = []
-        all_params.extend(request.GET.values())
-        if hasattr(request, 'POST'):
-            all_params.extend(request.POST.values())
-        
-        for param in all_params:
-            for pattern in self.suspicious_patterns:
-                if re.search(pattern, str(param), re.I):
-                    security_logger.warning(
-                        f'Suspicious request pattern detected: {pattern} '
-                        f'from IP {ip_address} on URL {request.path}'
-                    )
-                    # Opsiyonel: IP'yi geçici olarak engelle
-                    self._block_suspicious_ip(ip_address)
-                    break
+        # Query string ve POST data kontrolü - verdict istek başına bir kez hesaplanır
+        hits = inspect_request(request).for_rule_set('suspicious')
+        if not hits:
+            return
+
+        ip_address = get_client_ip(request)
+        for hit in hits:
+            security_logger.warning(
+                f'Suspicious request pattern detected: {hit.pattern} '
+                f'from IP {ip_address} on URL {request.path}'
+            )
+        # Opsiyonel: IP'yi geçici olarak engelle
+        self._block_suspicious_ip(ip_address)
     
     def _check_rate_limit(self, request):
-        """Basit rate limiting"""
-        ip_address = self._get_client_ip(request)
-        cache_key = f'rate_limit_{ip_address}'
-        
-        # Son 1 dakikadaki istek sayısını kontrol et
-        requests = cache.get(cache_key, [])
-        now = time.time()
-        
-        # 1 dakikadan eski istekleri temizle
-        requests = [req_time for req_time in requests if now - req_time < 60]
-        
-        # Yeni isteği ekle
-        requests.append(now)
+        """Sliding-window rate limiting - atomik sayaçlarla O(1)"""
+        ip_address = get_client_ip(request)
+        result = self.rate_limiter.hit(ip_address)
         
-        # Cache'e kaydet
-        cache.set(cache_key, requests, 60)
-        
-        # Limit kontrolü (dakikada 100 istek)
-        if len(requests) > 100:
+        # Limit kontrolü (varsayılan dakikada 100 istek)
+        if not result:
             security_logger.warning(
-                f'Rate limit exceeded for IP {ip_address}: {len(requests)} requests/minute'
+                f'Rate limit exceeded for IP {ip_address}: {int(result.count)} requests/minute'
             )
     
     def _block_suspicious_ip(self, ip_address):
@@ -170,17 +123,10 @@ class SecurityMonitoringMiddleware:
             cache_key = f'blocked_ip_{ip_address}'
             cache.set(cache_key, True, 300)  # 5 dakika engelle
     
-    def _get_client_ip(self, request):
-        """Gerçek client IP'sini al"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR', '')
-    
     def _log_response(self, request, response):
         """Response logları"""
         if response.status_code >= 400:
-            ip_address = self._get_client_ip(request)
+            ip_address = get_client_ip(request)
             security_logger.info(
                 f'HTTP {response.status_code} response for {request.method} '
                 f'{request.path} from IP {ip_address}'
@@ -203,11 +149,11 @@ class LoginSecurityMiddleware:
     
     def _check_login_attempts(self, request):
         """Başarısız login denemelerini kontrol et"""
-        ip_address = self._get_client_ip(request)
-        cache_key = f'login_attempts_{ip_address}'
+        ip_address = get_client_ip(request)
+        login_limiter = get_login_limiter()
         
-        attempts = cache.get(cache_key, 0)
-        max_attempts = getattr(settings, 'SECURITY_MONITORING', {}).get('MAX_LOGIN_ATTEMPTS', 5)
+        attempts = int(login_limiter.peek(ip_address).count)
+        max_attempts = login_limiter.limit
         
         if attempts >= max_attempts:
             security_logger.warning(
@@ -218,21 +164,18 @@ class LoginSecurityMiddleware:
             timeout = getattr(settings, 'SECURITY_MONITORING', {}).get('LOGIN_ATTEMPT_TIMEOUT', 300)
             cache.set(block_key, True, timeout)
     
-    def _get_client_ip(self, request):
-        """Gerçek client IP'sini al"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR', '')
+def get_login_limiter():
+    """Başarısız login denemeleri için paylaşılan limiter"""
+    monitoring = getattr(settings, 'SECURITY_MONITORING', {})
+    max_attempts = monitoring.get('MAX_LOGIN_ATTEMPTS', 5)
+    timeout = monitoring.get('LOGIN_ATTEMPT_TIMEOUT', 300)
+    return get_limiter('login_attempts', f'{max_attempts}/{timeout}s')
 
 # Login failed signal handler
 @receiver(user_login_failed)
 def log_failed_login(sender, credentials, request, **kwargs):
     """Başarısız login denemelerini logla"""
-    ip_address = request.META.get('REMOTE_ADDR', '')
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip_address = x_forwarded_for.split(',')[0].strip()
+    ip_address = get_client_ip(request) if request is not None else ''
     
     username = credentials.get('username', 'Unknown')
     
@@ -240,15 +183,14 @@ def log_failed_login(sender, credentials, request, **kwargs):
         f'Failed login attempt: username={username}, IP={ip_address}'
     )
     
-    # Başarısız deneme sayısını artır
-    cache_key = f'login_attempts_{ip_address}'
-    attempts = cache.get(cache_key, 0)
-    cache.set(cache_key, attempts + 1, 300)  # 5 dakika
+    # Başarısız deneme sayısını artır (atomik)
+    get_login_limiter().hit(ip_address)
 
 # MEVCUT MIDDLEWARE'LER (SecurityMiddleware, IPAddressMiddleware, etc.) AYNI KALIR
 class SecurityMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        get_inspector()  # Kuralları açılışta derle
         
     def __call__(self, request):
         # SQL injection koruması
@@ -259,57 +201,245 @@ class SecurityMiddleware:
         if self._check_xss(request):
             return HttpResponseForbidden("Forbidden")
             
-        response = self.get_response(request)
+        # Güvenlik başlıkları SecurityHeadersMiddleware tarafından tek geçişte eklenir
+        return self.get_response(request)
         
-        # Güvenlik başlıkları
-        response['X-Content-Type-Options'] = 'nosniff'
-        response['X-Frame-Options'] = 'DENY'
-        response['X-XSS-Protection'] = '1; mode=block'
+    def _check_sql_injection(self, request):
+        return inspect_request(request).matched('sql_injection', sources=('GET',))
         
+    def _check_xss(self, request):
+        return inspect_request(request).matched('xss', sources=('GET',))
+
+class EdgeMiddleware:
+    """
+    SecurityMiddleware'in hemen arkasında çalışan hızlı yol middleware'i - bkz. core.edge
+
+    - Statik/media dosyaları (SERVE_FILES kapalıysa doğrudan 404)
+    - /favicon.ico -> statik favicon'a 301
+    - /robots.txt (host başına bir kez render edilir)
+    - Eski URL yönlendirmeleri (301)
+
+    Bu istekler session, locale, CSRF, auth ve dil middleware'lerine
+    uğramadan yanıtlanır; SSL yönlendirmesi ve HSTS önde çalışan
+    SecurityMiddleware'den gelir. Diğer istekler sınıflandırılıp zincire
+    devam eder.
+    """
+    ROBOTS_CACHE_SIZE = 32
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.router = get_router()
+
+        edge_settings = get_edge_settings()
+        self.serve_files = edge_settings.get('SERVE_FILES', settings.DEBUG)
+        self.robots_max_age = edge_settings.get('ROBOTS_MAX_AGE', 86400)
+        self.favicon_path = edge_settings.get('FAVICON', 'images/favicon.ico')
+        self.file_roots = {
+            ROUTE_STATIC: (self.router.prefix_for(ROUTE_STATIC), settings.STATIC_ROOT),
+            ROUTE_MEDIA: (self.router.prefix_for(ROUTE_MEDIA), settings.MEDIA_ROOT),
+        }
+        # Kısa devre yanıtlarına da varsayılan güvenlik başlıkları eklenir
+        self.header_bundle = build_header_bundles()[DEFAULT_PROFILE]
+
+        self._favicon_url = None
+        self._robots = {}
+        self.handlers = {
+            ROUTE_STATIC: self._serve_file,
+            ROUTE_MEDIA: self._serve_file,
+            ROUTE_FAVICON: self._favicon,
+            ROUTE_ROBOTS: self._robots_txt,
+            ROUTE_REDIRECT: self._redirect,
+        }
+
+    def __call__(self, request):
+        route = self.router.classify(request.path_info)
+        request.__dict__[EDGE_ROUTE_ATTRIBUTE] = route
+
+        handler = self.handlers.get(route)
+        if handler is None:
+            return self.get_response(request)
+
+        response = handler(request, route)
+        self.header_bundle.apply(response)
         return response
+
+    def _serve_file(self, request, route):
+        """Statik/media dosya - production'da nginx/CDN sunar, buraya düşen istek 404'tür"""
+        prefix, document_root = self.file_roots[route]
+        if not self.serve_files or prefix is None:
+            return HttpResponseNotFound()
+
+        path = request.path_info[len(prefix):]
+        try:
+            if route == ROUTE_STATIC and settings.DEBUG:
+                from django.contrib.staticfiles.views import serve
+                return serve(request, path)
+            if not document_root:
+                return HttpResponseNotFound()
+            from django.views.static import serve
+            return serve(request, path, document_root=document_root)
+        except Http404:
+            return HttpResponseNotFound()
+
+    def _favicon(self, request, route):
+        if self._favicon_url is None:
+            from django.templatetags.static import static
+            self._favicon_url = static(self.favicon_path)
+        return HttpResponsePermanentRedirect(self._favicon_url)
+
+    def _robots_txt(self, request, route):
+        """robots.txt - scheme/host başına bir kez render edilir"""
+        key = (request.scheme, request.get_host())
+        content = self._robots.get(key)
+        if content is None:
+            from django.template.loader import get_template
+            # Context processor'lar çalıştırılmaz (session/user yok)
+            content = get_template('robots.txt').render({'request': request})
+            if len(self._robots) < self.ROBOTS_CACHE_SIZE:
+                self._robots[key] = content
+
+        from django.utils.cache import patch_response_headers
+        response = HttpResponse(content, content_type='text/plain')
+        patch_response_headers(response, self.robots_max_age)
+        return response
+
+    def _redirect(self, request, route):
+        new_path = self.router.redirects[request.path_info]
+        query_string = request.META.get('QUERY_STRING')
+        if query_string:
+            new_path = f"{new_path}?{query_string}"
+        return HttpResponsePermanentRedirect(new_path)
+
+
+class EdgeSessionMiddleware(SessionMiddleware):
+    """
+    SessionMiddleware - sessionless route'larda (core.edge.SESSIONLESS_ROUTES:
+    sitemap; statik/robots vb. zaten EdgeMiddleware'de yanıtlanır) session
+    cookie'si okunmaz ve yazılmaz
+
+    Bu isteklerde request.session boş, kaydedilmeyen bir session'dır; yanıta
+    Vary: Cookie eklenmez.
+    """
+
+    def process_request(self, request):
+        if is_sessionless(request):
+            request.session = self.SessionStore()
+            return
+        super().process_request(request)
+
+    def process_response(self, request, response):
+        if is_sessionless(request):
+            return response
+        return super().process_response(request, response)
+
+
+async def _anonymous_user():
+    return AnonymousUser()
+
+
+class EdgeAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware - sessionless route'larda kullanıcı her zaman anonim"""
+
+    def process_request(self, request):
+        if is_sessionless(request):
+            request.user = AnonymousUser()
+            request.auser = _anonymous_user
+            return
+        super().process_request(request)
+
+
+class ServerTimingMiddleware:
+    """
+    Örneklenmiş istek zaman ölçümü - bkz. core.timing
+
+    SERVER_TIMING['ENABLED'] kapalıysa zincirden tamamen çıkar.
+    Örneklenen isteklere Server-Timing başlığı eklenir ve url_name bazında
+    JSON log satırı yazılır.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        config = getattr(settings, 'SERVER_TIMING', {})
+        if not config.get('ENABLED', False):
+            raise MiddlewareNotUsed
         
-    def _check_sql_injection(self, request):
-        sql_patterns = [
-            r'(\s|^)(SELECT|INSERT|UPDATE|DELETE|DROP|UNION|ALTER)(\s|$)',
-            r'--',
-            r';',
-            r'\/\*.*\*\/',
-        ]
-        
-        for param in request.GET.values():
-            for pattern in sql_patterns:
-                if re.search(pattern, param, re.I):
-                    return True
-        return False
+        self.sample_rate = config.get('SAMPLE_RATE', 0.01)
+        self.send_header = config.get('HEADER', True)
+        self.log = config.get('LOG', True)
+        timing.install()
+
+    def __call__(self, request):
+        if random.random() >= self.sample_rate:
+            return self.get_response(request)
         
-    def _check_xss(self, request):
-        xss_patterns = [
-            r'<script.*?>.*?<\/script>',
-            r'javascript:',
-            r'onerror=',
-            r'onload=',
-        ]
+        with timing.measure() as timer:
+            response = self.get_response(request)
         
-        for param in request.GET.values():
-            for pattern in xss_patterns:
-                if re.search(pattern, param, re.I):
-                    return True
-        return False
+        if self.send_header:
+            response['Server-Timing'] = timer.server_timing()
+        if self.log:
+            timing.log_request(request, response, timer)
+        return response
 
-class IPAddressMiddleware:
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timer = timing.get_current_timer()
+        if timer is not None:
+            timer.view_started = time.perf_counter()
+        return None
+
+
+class PageCacheMiddleware:
+    """
+    Anonim tam sayfa cache'i - bkz. core.pagecache
+
+    Session/Auth/CSRF/Messages middleware'lerinden sonra çalışır; böylece
+    cache'ten sunulan sayfaya CSRF token yerleştirilebilir ve cookie'si
+    CsrfViewMiddleware tarafından eklenir.
+    """
     def __init__(self, get_response):
         self.get_response = get_response
+        self.config = pagecache.get_page_cache_settings()
+        if not self.config['ENABLED']:
+            raise MiddlewareNotUsed
 
     def __call__(self, request):
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            request.ip_address = x_forwarded_for.split(',')[0]
-        else:
-            request.ip_address = request.META.get('REMOTE_ADDR')
-            
+        key = pagecache.lookup_key(request, self.config)
+        if key is None:
+            return self.get_response(request)
+        
+        response = pagecache.fetch(request, key)
+        if response is not None:
+            self._mark(response, 'HIT')
+            # Saklanan sayfanın ETag/Last-Modified'ı (core.conditional) - istemci kopyası güncelse 304
+            return get_conditional_response(
+                request,
+                etag=response.get('ETag'),
+                last_modified=parse_http_date_safe(response.get('Last-Modified')),
+                response=response,
+            )
+        
         response = self.get_response(request)
+        if pagecache.is_storable(request, response):
+            pagecache.store(request, response, key, self.config)
+            self._mark(response, 'MISS')
         return response
 
+    def _mark(self, response, state):
+        if self.config['HEADER']:
+            response['X-Page-Cache'] = state
+
+
+class IPAddressMiddleware:
+    """
+    İstemci IP'sini zincirin başında bir kez çözer
+    (request.client_ip / request.ip_address) - bkz. core.client_ip
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        resolve_client_ip(request)
+        return self.get_response(request)
+
 class SEOCanonicalMiddleware:
     """
     SEO için Canonical URL ve yönlendirme middleware'i
@@ -322,9 +452,8 @@ class SEOCanonicalMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        # Admin, dashboard ve API URL'lerini atla
-        skip_paths = ['/admin/', '/dashboard/', '/api/', '/static/', '/media/']
-        if any(request.path.startswith(path) for path in skip_paths):
+        # Admin, dashboard, API, static ve media URL'lerini atla
+        if get_edge_route(request) in NON_SITE_ROUTES:
             return self.get_response(request)
         
         # WWW/non-WWW standardizasyonu
@@ -401,22 +530,12 @@ class URLRedirectMiddleware:
     """
     def __init__(self, get_response):
         self.get_response = get_response
-        
-        # URL yönlendirme kuralları - İhtiyaca göre güncellenebilir
-        self.redirects = {
-            # Eski format -> Yeni format
-            '/products/': '/urunler/',
-            '/gallery/': '/galeri/',
-            '/about/': '/hakkimizda/',
-            '/contact/': '/iletisim/',
-            
-            # Eski slug'lar -> Yeni slug'lar (örnekler)
-            # '/old-product-name/': '/urunler/new-product-name/',
-        }
+        # Kurallar core.redirects içinde worker başına derlenir
+        # (Redirect tablosu + core.edge.LEGACY_REDIRECTS + slug geçmişi)
 
     def __call__(self, request):
         # Admin ve dashboard URL'lerini atla
-        if request.path.startswith('/admin/') or request.path.startswith('/dashboard/'):
+        if get_edge_route(request) in (ROUTE_ADMIN, ROUTE_DASHBOARD):
             return self.get_response(request)
         
         # URL yönlendirme kontrolü
@@ -427,56 +546,51 @@ class URLRedirectMiddleware:
         return self.get_response(request)
     
     def _check_redirects(self, request):
-        """Tanımlı yönlendirmeleri kontrol et"""
-        current_path = request.path
-        
-        # Tam URL eşleşmesi
-        if current_path in self.redirects:
-            new_path = self.redirects[current_path]
-            if request.META.get('QUERY_STRING'):
-                new_path = f"{new_path}?{request.META.get('QUERY_STRING')}"
+        """Tanımlı yönlendirmeleri kontrol et - tam eşleşme, önek ve regex"""
+        match = get_redirect_index().find(request.path_info)
+        if match is None:
+            return None
+
+        new_path, status_code = match
+        if request.META.get('QUERY_STRING'):
+            new_path = f"{new_path}?{request.META.get('QUERY_STRING')}"
+        if status_code == 301:
             return HttpResponsePermanentRedirect(new_path)
-        
-        # Pattern tabanlı yönlendirmeler (ihtiyaç halinde)
-        return None
+        return HttpResponseRedirect(new_path)
 
 class DashboardLocaleMiddleware:
-    """Dashboard dil middleware'i - Bağımsız çalışır"""
+    """
+    Dashboard dil middleware'i - Bağımsız çalışır
+
+    Kullanıcının dashboard dili core.language profilinden okunur
+    (session'da sürümlü kopya - sıcak yolda veritabanı sorgusu yok).
+    """
     def __init__(self, get_response):
         self.get_response = get_response
+        self.language_codes = get_language_codes()
 
     def __call__(self, request):
         # Dashboard URL pattern kontrolü
-        is_dashboard = (
-            request.path.startswith('/dashboard/') or 
-            '/dashboard/' in request.path or
-            request.path_info.startswith('/dashboard/')
-        )
+        is_dashboard = '/dashboard/' in request.path_info or '/dashboard/' in request.path
         
         if is_dashboard and request.user.is_authenticated:
-            dashboard_language = 'tr'  # Varsayılan
+            profile = get_language_profile(request)
             
-            try:
-                from dashboard.models import DashboardTranslationSettings
-                user_settings = DashboardTranslationSettings.objects.get(user=request.user)
-                
-                # Dashboard dili (primary_language'den BAĞIMSIZ)
-                dashboard_language = user_settings.dashboard_language
-                print(f"[MIDDLEWARE] Kullanıcı {request.user.username} dashboard dili: {dashboard_language}")
-                
-            except DashboardTranslationSettings.DoesNotExist:
+            # Dashboard dili (primary_language'den BAĞIMSIZ)
+            if profile.exists:
+                dashboard_language = profile.dashboard_language
+            else:
                 dashboard_language = request.COOKIES.get('dashboard_language', 'tr')
-                print(f"[MIDDLEWARE] Cookie'den dashboard dili: {dashboard_language}")
-            except Exception as e:
-                print(f"[MIDDLEWARE] Hata: {e}")
-                dashboard_language = 'tr'
             
             # Dil aktivasyonu
-            from django.utils import translation
-            if dashboard_language in [lang[0] for lang in settings.LANGUAGES]:
+            if dashboard_language in self.language_codes:
                 translation.activate(dashboard_language)
                 request.LANGUAGE_CODE = dashboard_language
-                print(f"[MIDDLEWARE] Dashboard dili aktive edildi: {dashboard_language}")
+                language_logger.debug(
+                    f"Dashboard dili aktive edildi: {dashboard_language} (kullanıcı #{request.user.pk})"
+                )
+            else:
+                language_logger.warning(f"Geçersiz dashboard dili yok sayıldı: {dashboard_language!r}")
             
         response = self.get_response(request)
         
@@ -517,47 +631,44 @@ class SitePrimaryLanguageMiddleware:
     """
     def __init__(self, get_response):
         self.get_response = get_response
+        self.language_codes = get_language_codes()
 
     def __call__(self, request):
         # Dashboard URL'leri için işlem yapma
-        if request.path.startswith('/dashboard/'):
+        if get_edge_route(request) == ROUTE_DASHBOARD:
             response = self.get_response(request)
             return response
         
         # Root URL kontrolü - SADECE authenticated user ve TAM ROOT URL
         if (request.path == '/' and 
             request.user.is_authenticated and 
-            not request.path.startswith('/tr/') and  # Zaten TR'de değilse
             not hasattr(request, '_redirect_processed')):  # İlk kez işleniyor
             
-            try:
-                from dashboard.models import DashboardTranslationSettings
-                user_settings = DashboardTranslationSettings.objects.get(user=request.user)
-                primary_language = user_settings.primary_language
-                
-                # Sadece farklı dildeyse yönlendir
-                if primary_language != 'tr':
-                    from django.shortcuts import redirect
-                    request._redirect_processed = True
-                    print(f"[SITE MIDDLEWARE] Root URL, ana dile yönlendiriliyor: /{primary_language}/")
-                    return redirect(f'/{primary_language}/')
-                    
-            except DashboardTranslationSettings.DoesNotExist:
-                pass
-            except Exception as e:
-                print(f"[SITE MIDDLEWARE] Hata: {e}")
+            primary_language = get_language_profile(request).primary_language
+            
+            # Sadece farklı dildeyse yönlendir
+            if primary_language and primary_language != 'tr' and primary_language in self.language_codes:
+                request._redirect_processed = True
+                language_logger.debug(f"Root URL, ana dile yönlendiriliyor: /{primary_language}/")
+                return HttpResponseRedirect(f'/{primary_language}/')
         
         response = self.get_response(request)
         return response
+
 # Error tracking logger
 error_logger = logging.getLogger('django')
 
 class Error404TrackingMiddleware:
     """
     404 hatalarını izleyen ve SEO için optimize eden middleware
+
+    Olaylar core.notfound ring buffer'ına yazılır ve compact_404_errors
+    ile günlük sayaçlara sıkıştırılır.
     """
     def __init__(self, get_response):
         self.get_response = get_response
+        max_errors = getattr(settings, 'MAX_404_LOGS_PER_IP', 10)
+        self.rate_limiter = get_limiter('404_log', f'{max_errors}/h')
 
     def __call__(self, request):
         response = self.get_response(request)
@@ -569,45 +680,24 @@ class Error404TrackingMiddleware:
         return response
     
     def _track_404_error(self, request):
-        """404 hatalarını logla ve cache'e kaydet"""
+        """404 hatalarını logla ve analitik deposuna kaydet"""
         if not getattr(settings, 'TRACK_404_ERRORS', True):
             return
         
-        ip_address = self._get_client_ip(request)
+        ip_address = get_client_ip(request)
         path = request.path
         referrer = request.META.get('HTTP_REFERER', '')
         user_agent = request.META.get('HTTP_USER_AGENT', '')
         
         # Rate limiting - aynı IP'den çok fazla 404 loglanmasın
-        cache_key = f'404_rate_limit_{ip_address}'
-        error_count = cache.get(cache_key, 0)
-        max_errors = getattr(settings, 'MAX_404_LOGS_PER_IP', 10)
-        
-        if error_count >= max_errors:
+        if not self.rate_limiter.hit(ip_address):
             return
         
-        # Error tracking cache'e ekle
-        cache.set(cache_key, error_count + 1, 3600)  # 1 saat
-        
-        # 404 hatalarını toplu şekilde cache'e kaydet
-        errors_cache_key = '404_errors_list'
-        errors = cache.get(errors_cache_key, [])
-        
-        error_data = {
-            'path': path,
-            'ip': ip_address,
-            'referrer': referrer,
-            'user_agent': user_agent[:200],  # Limit user agent length
-            'timestamp': timezone.now().isoformat(),
-        }
-        
-        errors.append(error_data)
-        
-        # Son 100 hatayı sakla
-        if len(errors) > 100:
-            errors = errors[-100:]
-        
-        cache.set(errors_cache_key, errors, 86400)  # 24 saat
+        # Ring buffer'a ekle (atomik sıra numarası, tek slot yazımı)
+        try:
+            notfound.record_404(path, ip_address, referrer, user_agent)
+        except Exception as e:
+            error_logger.error(f'404 kaydı yazılamadı: {e}')
         
         # Log kritik 404'leri
         if self._is_critical_404(path):
@@ -653,13 +743,6 @@ class Error404TrackingMiddleware:
             return True
         
         return False
-    
-    def _get_client_ip(self, request):
-        """Gerçek client IP'sini al"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR', '')
 
 class MaintenanceModeMiddleware:
     """
@@ -675,92 +758,54 @@ class MaintenanceModeMiddleware:
         if maintenance_settings.get('ENABLED', False):
             # İzinli IP'leri kontrol et
             allowed_ips = maintenance_settings.get('ALLOWED_IPS', [])
-            client_ip = self._get_client_ip(request)
+            client_ip = get_client_ip(request)
 
             if client_ip not in allowed_ips:
                 # Admin ve dashboard'a erişimi engelleme
-                if not request.path.startswith('/admin/') and not request.path.startswith('/dashboard/'):
+                if get_edge_route(request) not in (ROUTE_ADMIN, ROUTE_DASHBOARD):
                     from core.views import maintenance_view
                     return maintenance_view(request)
 
         return self.get_response(request)
 
-    def _get_client_ip(self, request):
-        """Gerçek client IP'sini al"""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR', '')
-
 
 class PageVisitStatisticsMiddleware:
     """
     Sayfa ziyaretlerini izleyen ve istatistikleri güncelleyen middleware
 
     Kural:
-    - Her benzersiz session için sadece 1 kez sayılır
-    - Dashboard, admin, static ve media URL'leri hariç
-    - Cache kullanarak optimize edilmiş
+    - Her ziyaretçi imzalı cookie ile günde sadece 1 kez sayılır
+      (server-side session oluşturulmaz)
+    - Dashboard, admin, API, static, media, robots.txt ve sitemap hariç
+      (sınıflandırma core.edge)
+    - Artışlar cache sayacında birikir, toplu yazılır (core.visits)
     """
     def __init__(self, get_response):
         self.get_response = get_response
-        self.skip_paths = ['/dashboard/', '/admin/', '/static/', '/media/', '/favicon.ico', '/robots.txt']
 
     def __call__(self, request):
         response = self.get_response(request)
 
         # Sadece başarılı GET isteklerini say
         if request.method == 'GET' and response.status_code == 200:
-            self._track_page_visit(request)
+            self._track_page_visit(request, response)
 
         return response
 
-    def _track_page_visit(self, request):
-        """Sayfa ziyaretini izle ve istatistikleri güncelle"""
-        # Skip edilecek path'leri kontrol et
-        if any(request.path.startswith(path) for path in self.skip_paths):
+    def _track_page_visit(self, request, response):
+        """Sayfa ziyaretini izle - istatistikler flush ile güncellenir"""
+        # Site sayfası olmayan ve session gerektirmeyen istekleri atla
+        route = get_edge_route(request)
+        if route in NON_SITE_ROUTES or route in SESSIONLESS_ROUTES:
             return
 
-        # Session kontrolü - her session için sadece 1 kez say
-        session_key = request.session.session_key
-        if not session_key:
-            # Session yoksa oluştur
-            request.session.create()
-            session_key = request.session.session_key
-
-        # Cache key oluştur
-        cache_key = f'page_visit_counted_{session_key}'
-
-        # Bu session daha önce sayıldı mı?
-        if cache.get(cache_key):
+        # Bu ziyaretçi daha önce sayıldı mı?
+        if visits.is_counted(request):
             return
 
-        # İstatistikleri güncelle
         try:
-            from about.models import About
-
-            about = About.objects.first()
-            if not about:
-                return
-
-            # Tamamlanan işi arttır
-            # NOT: Review ve Contact signal'leri de completed_jobs'ı güncelliyor
-            # Bu yüzden conflict'i önlemek için F() expression kullanıyoruz
-            from django.db.models import F
-            About.objects.filter(pk=about.pk).update(
-                completed_jobs=F('completed_jobs') + 1
-            )
-
-            # Cache'i temizle
-            cache.delete('about_info')
-            cache.delete('site_settings')
-
-            # Bu session'ı sayıldı olarak işaretle (1 gün geçerli)
-            cache.set(cache_key, True, 86400)
-
-            logger = logging.getLogger(__name__)
-            logger.debug(f"Sayfa ziyareti kaydedildi: session={session_key}")
-
+            visits.record_visit()
+            visits.mark_counted(request, response)
         except Exception as e:
             logger = logging.getLogger(__name__)
             logger.error(f"Sayfa ziyareti izleme hatası: {e}")
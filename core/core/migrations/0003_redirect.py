@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_cookieconsent_legalpage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Redirect',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('old_path', models.CharField(help_text='Örn: /urunler/eski-urun/ - önek kuralında /eski-kategori/, regex kuralında ^/blog/(\\d+)/$', max_length=500, verbose_name='Eski Yol')),
+                ('new_path', models.CharField(help_text='Örn: /urunler/yeni-urun/ - regex kuralında \\1 gibi grup referansları kullanılabilir', max_length=500, verbose_name='Yeni Yol')),
+                ('match_type', models.CharField(choices=[('exact', 'Tam Eşleşme'), ('prefix', 'Önek (Prefix)'), ('regex', 'Regex')], default='exact', max_length=10, verbose_name='Eşleşme Türü')),
+                ('status_code', models.PositiveSmallIntegerField(choices=[(301, '301 - Kalıcı'), (302, '302 - Geçici')], default=301, verbose_name='HTTP Kodu')),
+                ('source', models.CharField(choices=[('manual', 'Manuel'), ('slug', 'Slug Geçmişi')], default='manual', max_length=10, verbose_name='Kaynak')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Aktif')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+            ],
+            options={
+                'verbose_name': 'URL Yönlendirme',
+                'verbose_name_plural': 'URL Yönlendirmeleri',
+                'ordering': ['match_type', 'old_path'],
+                'unique_together': {('old_path', 'match_type')},
+            },
+        ),
+    ]
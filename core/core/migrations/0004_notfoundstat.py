@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_redirect'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotFoundStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=500, verbose_name='Yol')),
+                ('date', models.DateField(verbose_name='Tarih')),
+                ('hits', models.PositiveIntegerField(default=0, verbose_name='İstek Sayısı')),
+                ('top_referrers', models.JSONField(blank=True, default=dict, help_text='Heavy-hitters (Space-Saving) özeti - referrer: sayı', verbose_name="En Çok Gelen Referrer'lar")),
+                ('last_seen', models.DateTimeField(blank=True, null=True, verbose_name='Son Görülme')),
+            ],
+            options={
+                'verbose_name': '404 İstatistiği',
+                'verbose_name_plural': '404 İstatistikleri',
+                'ordering': ['-date', '-hits'],
+                'indexes': [models.Index(fields=['date', 'hits'], name='core_nf_date_hits_idx')],
+                'unique_together': {('path', 'date')},
+            },
+        ),
+    ]
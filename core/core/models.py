@@ -156,13 +156,8 @@ class SiteSettings(models.Model):
         if not self.pk and SiteSettings.objects.exists():
             raise ValidationError('Site ayarları zaten mevcut. Mevcut kaydı düzenleyiniz.')
         
-        result = super().save(*args, **kwargs)
-        
-        # Site ayarları değiştiğinde cache'i temizle
-        from django.core.cache import cache
-        cache.delete('site_settings')
-        
-        return result
+        # Cache geçersiz kılma post_save ile core.cachetags'te yapılır
+        return super().save(*args, **kwargs)
     
     def clean(self):
         # PDF katalog kontrolleri
@@ -175,8 +170,16 @@ class SiteSettings(models.Model):
                 raise ValidationError('WhatsApp numarası + ile başlamalı (örn: +905551234567)')
     
     @classmethod
-    def get_current(cls):
-        """Mevcut site ayarlarını getir, yoksa varsayılan değerlerle oluştur"""
+    def get_current(cls, cached=True):
+        """
+        Mevcut site ayarlarını getir, yoksa varsayılan değerlerle oluştur
+
+        cached=True: worker içi kopya (core.singletons) - salt okunur, değiştirmeyin.
+        Kaydedilecekse cached=False ile veritabanından taze nesne alın.
+        """
+        if cached:
+            from .singletons import get_site_settings
+            return get_site_settings()
         try:
             return cls.objects.get()
         except cls.DoesNotExist:
@@ -339,4 +342,99 @@ class CookieConsent(models.Model):
         ordering = ['-consent_date']
 
     def __str__(self):
-        return f"Çerez Onayı - {self.session_key[:10]}... ({self.consent_date})"
\ No newline at end of file
+        return f"Çerez Onayı - {self.session_key[:10]}... ({self.consent_date})"
+
+class Redirect(models.Model):
+    """
+    Veritabanı tabanlı URL yönlendirmeleri - core.redirects ile derlenir
+
+    Yollar dil öneki olmadan saklanır ('/urunler/eski-slug/'); '/en/urunler/eski-slug/'
+    isteği de aynı kurala eşleşir ve hedefe dil öneki eklenir.
+    """
+    MATCH_EXACT = 'exact'
+    MATCH_PREFIX = 'prefix'
+    MATCH_REGEX = 'regex'
+    MATCH_TYPES = [
+        (MATCH_EXACT, 'Tam Eşleşme'),
+        (MATCH_PREFIX, 'Önek (Prefix)'),
+        (MATCH_REGEX, 'Regex'),
+    ]
+
+    SOURCE_MANUAL = 'manual'
+    SOURCE_SLUG = 'slug'
+    SOURCES = [
+        (SOURCE_MANUAL, 'Manuel'),
+        (SOURCE_SLUG, 'Slug Geçmişi'),
+    ]
+
+    STATUS_CODES = [
+        (301, '301 - Kalıcı'),
+        (302, '302 - Geçici'),
+    ]
+
+    old_path = models.CharField(
+        "Eski Yol",
+        max_length=500,
+        help_text="Örn: /urunler/eski-urun/ - önek kuralında /eski-kategori/, regex kuralında ^/blog/(\\d+)/$"
+    )
+    new_path = models.CharField(
+        "Yeni Yol",
+        max_length=500,
+        help_text="Örn: /urunler/yeni-urun/ - regex kuralında \\1 gibi grup referansları kullanılabilir"
+    )
+    match_type = models.CharField("Eşleşme Türü", max_length=10, choices=MATCH_TYPES, default=MATCH_EXACT)
+    status_code = models.PositiveSmallIntegerField("HTTP Kodu", choices=STATUS_CODES, default=301)
+    source = models.CharField("Kaynak", max_length=10, choices=SOURCES, default=SOURCE_MANUAL)
+    is_active = models.BooleanField("Aktif", default=True)
+    created_at = models.DateTimeField("Oluşturulma Tarihi", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "URL Yönlendirme"
+        verbose_name_plural = "URL Yönlendirmeleri"
+        ordering = ['match_type', 'old_path']
+        unique_together = [('old_path', 'match_type')]
+
+    def clean(self):
+        if self.match_type == self.MATCH_REGEX:
+            import re
+            try:
+                re.compile(self.old_path)
+            except re.error as e:
+                raise ValidationError({'old_path': f'Geçersiz regex: {e}'})
+        elif not self.old_path.startswith('/'):
+            raise ValidationError({'old_path': "Yol '/' ile başlamalıdır."})
+
+        if self.match_type == self.MATCH_EXACT and self.old_path == self.new_path:
+            raise ValidationError({'new_path': 'Eski ve yeni yol aynı olamaz.'})
+
+    def __str__(self):
+        return f"{self.old_path} → {self.new_path}"
+
+
+class NotFoundStat(models.Model):
+    """
+    Yol başına günlük 404 sayacı - core.notfound tarafından cache'teki
+    ring buffer'dan sıkıştırılarak doldurulur
+    """
+    path = models.CharField("Yol", max_length=500)
+    date = models.DateField("Tarih")
+    hits = models.PositiveIntegerField("İstek Sayısı", default=0)
+    top_referrers = models.JSONField(
+        "En Çok Gelen Referrer'lar",
+        default=dict,
+        blank=True,
+        help_text="Heavy-hitters (Space-Saving) özeti - referrer: sayı"
+    )
+    last_seen = models.DateTimeField("Son Görülme", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "404 İstatistiği"
+        verbose_name_plural = "404 İstatistikleri"
+        ordering = ['-date', '-hits']
+        unique_together = [('path', 'date')]
+        indexes = [
+            models.Index(fields=['date', 'hits'], name='core_nf_date_hits_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.path} ({self.date}): {self.hits}"
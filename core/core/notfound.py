@@ -0,0 +1,268 @@
+# core/notfound.py
+"""
+404 analitik deposu
+
+Yazma yolu (her 404'te):
+    - Atomik sıra numarası (cache.incr) alınır ve olay ring buffer'daki
+      kendi slot'una yazılır: '404:event:{seq % RING_SIZE}'. Tek bir liste
+      anahtarı üzerinde read-modify-write yapılmadığı için eşzamanlı
+      isteklerde veri kaybolmaz.
+
+Sıkıştırma (compact_404_errors komutu / error_report):
+    - Son sıkıştırılan sıra numarasından itibaren slot'lar READ_CHUNK_SIZE'lık
+      parçalar halinde get_many ile okunur; bellekte tek parça tutulur
+    - Her parça (tarih, yol) bazında Counter ile TAM sayılır ve NotFoundStat
+      tablosuna eklenir; imleç parça başına ilerler (yarıda kesilen sıkıştırma
+      aynı olayları iki kez saymaz)
+    - En çok gelen referrer'lar satır başına Space-Saving sketch'iyle tutulur -
+      bu sayılar üst sınır tahminidir, hits alanı kesindir
+
+Rapor, tablodaki toplu sayaçları ve ring buffer'daki son olayları kullanır.
+"""
+import logging
+from collections import Counter
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE_KEY = '404:seq'
+CURSOR_KEY = '404:compacted'
+LOCK_KEY = '404:compact_lock'
+EVENT_KEY = '404:event:{slot}'
+READ_CHUNK_SIZE = 1000
+
+DEFAULTS = {
+    'RING_SIZE': 10000,  # Cache'te tutulan son olay sayısı
+    'EVENT_TIMEOUT': 60 * 60 * 24 * 7,  # Olaylar 7 gün saklanır
+    'TOP_REFERRERS': 10,  # Satır başına saklanan referrer sayısı
+}
+
+
+def get_store_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'NOT_FOUND_STORE', {}))
+    return config
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters sketch'i
+
+    En fazla `capacity` öğe tutar; dolduğunda en küçük sayaçlı öğe yeni
+    öğeyle değiştirilir ve sayacı devralınır (sayılar üst sınır tahminidir).
+    """
+    __slots__ = ('capacity', 'counts')
+
+    def __init__(self, capacity, counts=None):
+        self.capacity = capacity
+        self.counts = dict(counts or {})
+
+    def add(self, item, count=1):
+        """Öğeyi ekle - yer açmak için çıkarılan öğeyi döndür (yoksa None)"""
+        counts = self.counts
+        if item in counts:
+            counts[item] += count
+            return None
+        if len(counts) < self.capacity:
+            counts[item] = count
+            return None
+        evicted = min(counts, key=counts.get)
+        counts[item] = counts.pop(evicted) + count
+        return evicted
+
+    def merge(self, other_counts):
+        for item, count in other_counts.items():
+            self.add(item, count)
+        return self
+
+    def most_common(self, n=None):
+        items = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return items[:n] if n else items
+
+
+# ========================
+# Yazma yolu
+# ========================
+
+def _next_sequence():
+    try:
+        return cache.incr(SEQUENCE_KEY)
+    except ValueError:
+        if cache.add(SEQUENCE_KEY, 1, None):
+            return 1
+        return cache.incr(SEQUENCE_KEY)
+
+
+def record_404(path, ip, referrer='', user_agent=''):
+    """404 olayını ring buffer'a ekle - O(1), kilitsiz"""
+    config = get_store_settings()
+    seq = _next_sequence()
+    event = {
+        'seq': seq,
+        'path': path[:500],
+        'ip': ip,
+        'referrer': referrer[:500],
+        'user_agent': user_agent[:200],
+        'timestamp': timezone.now().isoformat(),
+    }
+    cache.set(EVENT_KEY.format(slot=seq % config['RING_SIZE']), event, config['EVENT_TIMEOUT'])
+    return seq
+
+
+def get_recent_events(limit=None):
+    """Ring buffer'daki olayları (eskiden yeniye) döndür"""
+    config = get_store_settings()
+    last = cache.get(SEQUENCE_KEY, 0) or 0
+    count = min(last, limit or config['RING_SIZE'], config['RING_SIZE'])
+    return _read_events(last - count, last, config['RING_SIZE'])
+
+
+def _read_chunks(after, until, ring_size):
+    """
+    (after, until] aralığındaki olayları parça parça oku - üzerine yazılmış
+    slot'ları atla
+
+    Yields:
+        (parçanın son sıra numarası, olay listesi)
+    """
+    for chunk_start in range(after + 1, until + 1, READ_CHUNK_SIZE):
+        chunk_end = min(chunk_start + READ_CHUNK_SIZE, until + 1)
+        keys = {seq: EVENT_KEY.format(slot=seq % ring_size) for seq in range(chunk_start, chunk_end)}
+        values = cache.get_many(list(keys.values()))
+        events = []
+        for seq, key in keys.items():
+            event = values.get(key)
+            if event and event.get('seq') == seq:
+                events.append(event)
+        yield chunk_end - 1, events
+
+
+def _read_events(after, until, ring_size):
+    """(after, until] aralığındaki olaylar - en fazla RING_SIZE olay"""
+    return [event for _, events in _read_chunks(after, until, ring_size) for event in events]
+
+
+# ========================
+# Sıkıştırma
+# ========================
+
+def compact():
+    """
+    Ring buffer'daki yeni olayları NotFoundStat'a yaz
+
+    Returns:
+        dict: {'events': işlenen olay, 'lost': üzerine yazılmış olay, 'rows': güncellenen satır}
+    """
+    result = {'events': 0, 'lost': 0, 'rows': 0}
+    if not cache.add(LOCK_KEY, True, 300):
+        logger.info("404 sıkıştırması zaten çalışıyor")
+        return result
+
+    try:
+        config = get_store_settings()
+        ring_size = config['RING_SIZE']
+        last = cache.get(SEQUENCE_KEY, 0) or 0
+        cursor = cache.get(CURSOR_KEY, 0) or 0
+        if cursor > last:
+            # Sayaç sıfırlanmış (cache temizlendi) - baştan başla
+            cursor = 0
+
+        # Ring'den taşan olaylar kaybolmuştur
+        start = max(cursor, last - ring_size)
+        result['lost'] = start - cursor
+
+        for chunk_last, events in _read_chunks(start, last, ring_size):
+            result['events'] += len(events)
+            result['rows'] += _store(_aggregate(events, config), config)
+            cache.set(CURSOR_KEY, chunk_last, None)
+
+        cache.set(CURSOR_KEY, last, None)
+    finally:
+        cache.delete(LOCK_KEY)
+
+    if result['lost']:
+        logger.warning(f"404 ring buffer taştı: {result['lost']} olay sıkıştırılamadan kayboldu")
+    return result
+
+
+def _aggregate(events, config):
+    """
+    Bir parçadaki olayları (tarih, yol) bazında kesin say
+
+    Returns:
+        list: [(tarih, yol, hits, {referrer: sayı}, son görülme)]
+    """
+    hits = Counter()
+    referrers = {}
+    last_seen = {}
+
+    for event in events:
+        try:
+            seen = datetime.fromisoformat(event['timestamp'])
+        except (KeyError, ValueError):
+            continue
+        key = (timezone.localdate(seen) if timezone.is_aware(seen) else seen.date(), event['path'])
+
+        hits[key] += 1
+        if event.get('referrer'):
+            referrers.setdefault(key, Counter())[event['referrer']] += 1
+        if key not in last_seen or seen > last_seen[key]:
+            last_seen[key] = seen
+
+    return [
+        (date, path, count, referrers.get((date, path)), last_seen[(date, path)])
+        for (date, path), count in hits.items()
+    ]
+
+
+def _store(rows, config, chunk_size=500):
+    """Toplanmış satırları NotFoundStat'a yaz (upsert)"""
+    from .models import NotFoundStat
+
+    updated = 0
+    for i in range(0, len(rows), chunk_size):
+        chunk = rows[i:i + chunk_size]
+        dates = {row[0] for row in chunk}
+        paths = {row[1] for row in chunk}
+
+        with transaction.atomic():
+            existing = {
+                (stat.date, stat.path): stat
+                for stat in NotFoundStat.objects.select_for_update().filter(
+                    date__in=dates, path__in=paths
+                )
+            }
+            to_create, to_update = [], []
+            for date, path, hits, referrer_counts, seen in chunk:
+                stat = existing.get((date, path))
+                if stat is None:
+                    stat = NotFoundStat(path=path, date=date, hits=0, top_referrers={})
+                    to_create.append(stat)
+                else:
+                    to_update.append(stat)
+
+                stat.hits += hits
+                if referrer_counts:
+                    # Sadece en çok gelenler saklanır - sayılar tahmini
+                    merged = SpaceSaving(config['TOP_REFERRERS'], stat.top_referrers)
+                    merged.merge(dict(referrer_counts.most_common()))
+                    stat.top_referrers = dict(merged.most_common())
+                if seen and (stat.last_seen is None or seen > stat.last_seen):
+                    stat.last_seen = seen
+
+            NotFoundStat.objects.bulk_create(to_create)
+            NotFoundStat.objects.bulk_update(to_update, ['hits', 'top_referrers', 'last_seen'])
+        updated += len(chunk)
+    return updated
+
+
+def clear():
+    """Ring buffer ve sayaçları temizle (tablo korunur)"""
+    ring_size = get_store_settings()['RING_SIZE']
+    cache.delete_many([EVENT_KEY.format(slot=slot) for slot in range(ring_size)])
+    cache.delete_many([SEQUENCE_KEY, CURSOR_KEY])
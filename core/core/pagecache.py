@@ -0,0 +1,233 @@
+# core/pagecache.py
+"""
+Anonim ziyaretçiler için tam sayfa cache'i
+
+Django'nun UpdateCacheMiddleware/FetchFromCacheMiddleware ikilisi sitede
+neredeyse hiçbir sayfayı saklamıyordu (session -> Vary: Cookie, CSRF token'lı
+formlar). Bu modül trafiğimize göre tasarlanmıştır:
+
+    - Anahtar: aktif dil + host + path + normalize edilmiş query string
+      (utm_*, fbclid, gclid gibi takip parametreleri atılır, kalanlar sıralanır)
+    - Sadece anonim GET/HEAD istekleri; dashboard/admin/api ve staff atlanır
+    - Oturum cookie'si olmayan istek veritabanına/session'a gitmeden anonim sayılır
+    - CSRF token ve CSP nonce saklanmadan önce yer tutucuya çevrilir, sunulurken
+      isteğe özel değer yerleştirilir (hole punching)
+    - Bekleyen flash mesajı olan istekler cache'i atlar (mesaj taze render edilir)
+
+Geçersiz kılma: anahtarlar core.cachetags.SITE_TAG sürümünü içerir; izlenen
+uygulamalardaki bir model kaydedilip silindiğinde sürüm commit sonrası
+yenilenir, eski sayfalar kendiliğinden düşer.
+"""
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils import translation
+
+from . import cachetags
+from .edge import NON_SITE_ROUTES, get_edge_route
+
+logger = logging.getLogger(__name__)
+
+PAGE_DEPENDENCIES = [cachetags.SITE_TAG]
+CSRF_PLACEHOLDER = '__PAGE_CACHE_CSRF__'
+NONCE_PLACEHOLDER = '__PAGE_CACHE_NONCE__'
+CSRF_INPUT = 'name="csrfmiddlewaretoken" value="'
+
+# Saklanan response'a kopyalanmayan başlıklar (dış middleware'ler yeniden ekler)
+SKIPPED_HEADERS = frozenset(['set-cookie', 'content-length', 'x-page-cache'])
+
+DEFAULTS = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'default',
+    'KEY_PREFIX': 'page',
+    'BYPASS_PREFIXES': ('/i18n/', '/set_language/', '/captcha/', '/ckeditor5/', '/__debug__/'),
+    'IGNORED_QUERY_PARAMS': ('utm_', 'fbclid', 'gclid', 'yclid', 'msclkid', '_ga'),
+    'BYPASS_QUERY_PARAMS': ('q',),  # Arama sonuçları cache'i şişirmesin
+    'HEADER': True,  # X-Page-Cache: HIT/MISS
+}
+
+
+def get_page_cache_settings():
+    config = dict(DEFAULTS)
+    config.setdefault('TIMEOUT', getattr(settings, 'CACHE_MIDDLEWARE_SECONDS', 600))
+    config['KEY_PREFIX'] = getattr(settings, 'CACHE_MIDDLEWARE_KEY_PREFIX', '') or config['KEY_PREFIX']
+    config.update(getattr(settings, 'PAGE_CACHE', {}))
+    return config
+
+
+def get_cache():
+    return caches[get_page_cache_settings()['CACHE_ALIAS']]
+
+
+# ========================
+# Uygunluk kontrolleri
+# ========================
+
+def is_anonymous(request):
+    """
+    Oturum cookie'si yoksa kullanıcı kesin anonimdir - session/kullanıcı yüklenmez.
+    Cookie varsa request.user'a bakılır (giriş yapmış kullanıcılar cache'i atlar).
+    """
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return True
+    user = getattr(request, 'user', None)
+    return user is None or not user.is_authenticated
+
+
+def has_pending_messages(request):
+    storage = getattr(request, '_messages', None)
+    # len() mesajları tüketmez (storage.used değişmez)
+    return storage is not None and len(storage) > 0
+
+
+def normalize_query(request, config):
+    """
+    Takip parametrelerini at, kalanları sırala
+
+    Returns:
+        str | None: Normalize query string - cache'lenmeyecek istekler için None
+    """
+    ignored = config['IGNORED_QUERY_PARAMS']
+    bypass = config['BYPASS_QUERY_PARAMS']
+    params = []
+    for name, values in request.GET.lists():
+        if name in bypass:
+            return None
+        if name.startswith(ignored):
+            continue
+        params.extend((name, value) for value in values)
+    params.sort()
+    return '&'.join(f'{name}={value}' for name, value in params)
+
+
+def get_cache_key(request, query, config, version):
+    raw = f'{request.get_host()}{request.path}?{query}'
+    digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+    language = translation.get_language() or settings.LANGUAGE_CODE
+    return f"{config['KEY_PREFIX']}:{version}:{language}:{digest}"
+
+
+def lookup_key(request, config):
+    """
+    İstek cache'lenebilirse anahtarını döndür, değilse None
+
+    Sıra ucuzdan pahalıya: yöntem -> rota -> query -> oturum -> mesajlar
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    if get_edge_route(request) in NON_SITE_ROUTES:
+        return None
+    if request.path.startswith(config['BYPASS_PREFIXES']):
+        return None
+    if 'HTTP_AUTHORIZATION' in request.META:
+        return None
+
+    query = normalize_query(request, config)
+    if query is None:
+        return None
+    if not is_anonymous(request) or has_pending_messages(request):
+        return None
+
+    version = cachetags.version_digest(PAGE_DEPENDENCIES)
+    return get_cache_key(request, query, config, version)
+
+
+def is_storable(request, response):
+    if request.method != 'GET' or response.status_code != 200:
+        return False
+    if response.streaming or response.cookies:
+        return False
+    cache_control = response.get('Cache-Control', '')
+    if any(directive in cache_control for directive in ('private', 'no-store', 'no-cache')):
+        return False
+    storage = getattr(request, '_messages', None)
+    if storage is not None and storage.added_new:
+        # View yeni mesaj ekledi - sonraki sayfa onu göstermeli
+        return False
+    return True
+
+
+# ========================
+# Saklama / sunma
+# ========================
+
+def _punch_holes(request, content):
+    """İsteğe özel değerleri yer tutucuya çevir"""
+    if CSRF_INPUT in content:
+        # Template'te render edilen token maskelidir - input değerleri değiştirilir
+        parts = content.split(CSRF_INPUT)
+        for index in range(1, len(parts)):
+            _, _, rest = parts[index].partition('"')
+            parts[index] = CSRF_PLACEHOLDER + '"' + rest
+        content = CSRF_INPUT.join(parts)
+
+    nonce = getattr(request, 'csp_nonce', None)
+    if nonce is not None and nonce.used:
+        content = content.replace(str(nonce), NONCE_PLACEHOLDER)
+    return content
+
+
+def _fill_holes(request, content):
+    if CSRF_PLACEHOLDER in content:
+        # get_token CSRF cookie'sinin gönderilmesini de sağlar
+        content = content.replace(CSRF_PLACEHOLDER, get_token(request))
+    if NONCE_PLACEHOLDER in content:
+        nonce = getattr(request, 'csp_nonce', None)
+        if nonce is None:
+            return None
+        content = content.replace(NONCE_PLACEHOLDER, str(nonce))
+    return content
+
+
+def store(request, response, key, config):
+    charset = response.charset
+    try:
+        content = response.content.decode(charset)
+    except UnicodeDecodeError:
+        return False
+    entry = {
+        'content': _punch_holes(request, content),
+        'charset': charset,
+        'headers': [
+            (name, value) for name, value in response.items()
+            if name.lower() not in SKIPPED_HEADERS
+        ],
+    }
+    try:
+        get_cache().set(key, entry, config['TIMEOUT'])
+    except Exception as e:
+        logger.error(f"Sayfa cache'e yazılamadı ({request.path}): {e}")
+        return False
+    return True
+
+
+def fetch(request, key):
+    """Cache'teki sayfayı isteğe özel değerlerle doldurup döndür - yoksa None"""
+    try:
+        entry = get_cache().get(key)
+    except Exception as e:
+        logger.error(f"Sayfa cache'i okunamadı ({request.path}): {e}")
+        return None
+    if entry is None:
+        return None
+
+    content = _fill_holes(request, entry['content'])
+    if content is None:
+        return None
+    response = HttpResponse(content.encode(entry['charset']), charset=entry['charset'])
+    for name, value in entry['headers']:
+        response[name] = value
+    return response
+
+
+# ========================
+# Geçersiz kılma
+# ========================
+
+def clear():
+    """Tüm sayfaları geçersiz kıl - anahtarlar yeni sürüme geçer"""
+    cachetags.invalidate(*PAGE_DEPENDENCIES)
@@ -0,0 +1,275 @@
+# core/querybudget.py
+"""
+Endpoint bazında sorgu ve render süresi bütçesi
+
+Büyük sentetik katalogla (core.queryplans.seed) projenin tüm isimli
+URL'lerini anonim, staff ve superuser olarak ister; sorgu sayısı veya
+render süresi bütçeyi aşan veya 2xx/3xx dışında yanıt veren endpoint'leri
+raporlar:
+
+    python manage.py query_budget
+    python manage.py query_budget --role staff --only dashboard:
+
+Kapı core.tests.QueryBudgetTests'tir (test veritabanında run(), hata
+olmamalı); komut aynı ölçümü tablo olarak gösteren rapor ön yüzüdür.
+
+    - URL'ler resolver'dan toplanır (sadece proje uygulamalarının view'ları;
+      admin, captcha, ckeditor vb. hariç)
+    - Parametreli URL'ler seed edilen kayıtlarla doldurulur; örnek değeri
+      bulunamayanlar "atlandı" olarak listelenir
+    - Veri değiştiren / dosya yazan endpoint'ler (silme, toggle, çıkış,
+      sitemap...) istenmez
+    - Tüm istekler tek transaction içinde, sonunda geri alınır
+
+Bütçe: QUERY_BUDGET['QUERIES'] / ['RENDER_MS'] varsayılanları, endpoint'e
+özel değerler QUERY_BUDGET['ENDPOINTS'][url_adı] ile verilir.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import translation
+
+from . import queryplans
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'QUERIES': 25,
+    'RENDER_MS': 1000,
+    'ROWS': 2000,
+    'ENDPOINTS': {},  # 'dashboard:dashboard_home': {'QUERIES': 40, 'RENDER_MS': 1500}
+}
+
+ROLES = ('anonymous', 'staff', 'superuser')
+
+# View'ları taranan uygulamalar
+PROJECT_APPS = ('core', 'home', 'products', 'gallery', 'about', 'contact', 'reviews', 'dashboard')
+EXCLUDED_NAMESPACES = ('admin', 'djdt')
+
+# GET ile de veri değiştiren / dış servis çağıran / dosya yazan endpoint'ler
+UNSAFE_NAME_PARTS = (
+    'delete', 'toggle', 'logout', 'mark_', 'set_', 'save_', 'catalog', 'add_review', 'sitemap',
+)
+
+# URL adındaki anahtar kelime -> parametre için kullanılacak model
+SAMPLE_MODELS = (
+    ('legal', 'core.legalpage'),
+    ('media_mention', 'dashboard.mediamention'),
+    ('notification', 'dashboard.notification'),
+    ('carousel', 'home.carouselslide'),
+    ('slide', 'home.carouselslide'),
+    ('categor', 'products.category'),
+    ('product', 'products.product'),
+    ('gallery', 'gallery.gallery'),
+    ('service', 'about.service'),
+    ('team', 'about.teammember'),
+    ('review', 'reviews.review'),
+    ('message', 'contact.contact'),
+    ('user', 'auth.user'),
+    ('about', 'about.about'),
+)
+
+# str parametreleri için sabit örnekler
+SAMPLE_VALUES = {
+    'chart_id': 'monthlyChart',
+}
+
+
+def get_budget_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'QUERY_BUDGET', {}))
+    return config
+
+
+def get_budget(name, config=None):
+    config = config or get_budget_settings()
+    override = config['ENDPOINTS'].get(name, {})
+    return override.get('QUERIES', config['QUERIES']), override.get('RENDER_MS', config['RENDER_MS'])
+
+
+# ========================
+# URL'ler
+# ========================
+
+def _pattern_kwargs(pattern):
+    converters = getattr(pattern.pattern, 'converters', None)
+    if converters is not None:
+        return list(converters)
+    regex = getattr(pattern.pattern, 'regex', None)
+    return list(regex.groupindex) if regex is not None else []
+
+
+def iter_named_urls(patterns=None, namespace=None, kwargs=()):
+    """(isim, parametre adları, view modülü) - include'lar dahil"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            child_namespace = namespace
+            if pattern.namespace:
+                child_namespace = f'{namespace}:{pattern.namespace}' if namespace else pattern.namespace
+            yield from iter_named_urls(
+                pattern.url_patterns, child_namespace, list(kwargs) + _pattern_kwargs(pattern),
+            )
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            name = f'{namespace}:{pattern.name}' if namespace else pattern.name
+            module = getattr(pattern.callback, '__module__', '') or ''
+            yield name, list(kwargs) + _pattern_kwargs(pattern), module
+
+
+def _sample_object(model):
+    """Parametre için örnek kayıt - varsa aktif olanlardan (detay sayfası 404 vermesin)"""
+    queryset = model._default_manager.order_by('pk')
+    field_names = {field.name for field in model._meta.get_fields()}
+    for field_name in ('is_active', 'is_approved'):
+        if field_name in field_names:
+            queryset = queryset.filter(**{field_name: True})
+    return queryset.first()
+
+
+def collect_urls(only=()):
+    """
+    Returns:
+        list: [(isim, yol)]
+        list: [(isim, atlanma nedeni)]
+    """
+    from django.apps import apps
+
+    urls, skipped, seen = [], [], set()
+    for name, kwarg_names, module in iter_named_urls():
+        if name in seen:
+            continue
+        seen.add(name)
+        if module.split('.')[0] not in PROJECT_APPS or name.split(':')[0] in EXCLUDED_NAMESPACES:
+            continue
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        if any(part in name for part in UNSAFE_NAME_PARTS):
+            skipped.append((name, 'güvenli değil (veri/dosya yazar veya dış servis çağırır)'))
+            continue
+
+        kwargs = {}
+        for kwarg in kwarg_names:
+            if kwarg in SAMPLE_VALUES:
+                kwargs[kwarg] = SAMPLE_VALUES[kwarg]
+                continue
+            label = next((label for keyword, label in SAMPLE_MODELS if keyword in name), None)
+            obj = _sample_object(apps.get_model(label)) if label else None
+            if obj is None:
+                break
+            kwargs[kwarg] = getattr(obj, 'slug', obj.pk) if kwarg == 'slug' else obj.pk
+        else:
+            try:
+                with translation.override(settings.LANGUAGE_CODE):
+                    urls.append((name, reverse(name, kwargs=kwargs)))
+            except Exception as e:
+                skipped.append((name, f'reverse: {e}'))
+            continue
+        skipped.append((name, f'örnek kayıt yok ({", ".join(kwarg_names)})'))
+    return urls, skipped
+
+
+# ========================
+# Ölçüm
+# ========================
+
+def seed(rows):
+    """queryplans.seed + diğer içerik modelleri"""
+    from dashboard.models import MediaMention
+    from home.models import CarouselSlide
+
+    samples = queryplans.seed(rows)
+    small = max(10, rows // 50)
+    CarouselSlide.objects.bulk_create(
+        CarouselSlide(title=f'Slayt {i}', slug=f'{queryplans.SEED_PREFIX}-slide-{i}', description='Açıklama', order=i)
+        for i in range(small)
+    )
+    MediaMention.objects.bulk_create(
+        MediaMention(title=f'Haber {i}', source='Gazete', order=i) for i in range(small)
+    )
+    return samples
+
+
+def _clients():
+    from django.contrib.auth import get_user_model
+
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')]
+    host = hosts[0] if hosts else 'localhost'
+    User = get_user_model()
+    clients = {'anonymous': Client(HTTP_HOST=host, raise_request_exception=False)}
+    staff = User.objects.create_user(
+        username=f'{queryplans.SEED_PREFIX}-staff', email='qb-staff@example.com', password=None, is_staff=True,
+    )
+    superuser = User.objects.create_superuser(
+        username=f'{queryplans.SEED_PREFIX}-superuser', email='qb-super@example.com', password=None,
+    )
+    for role, user in (('staff', staff), ('superuser', superuser)):
+        client = Client(HTTP_HOST=host, raise_request_exception=False)
+        client.force_login(user)
+        clients[role] = client
+    return clients
+
+
+def is_ok_status(status):
+    """2xx / 3xx - 'hata' (istek exception fırlattı) ve 4xx/5xx bütçeyi geçemez"""
+    return isinstance(status, int) and 200 <= status < 400
+
+
+def measure(client, path):
+    """(durum kodu, sorgu sayısı, süre ms)"""
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                status = client.get(path).status_code
+        except Exception as e:
+            logger.error(f"Sorgu bütçesi: {path} istenemedi: {e}")
+            status = 'hata'
+        elapsed = (time.perf_counter() - started) * 1000
+    return status, len(queries.captured_queries), elapsed
+
+
+def run(rows=None, roles=ROLES, only=()):
+    """
+    Seed et, tüm URL'leri her rol için iste - veri geri alınır
+
+    Returns:
+        list: [{'name', 'path', 'role', 'status', 'queries', 'ms', 'budget_queries',
+                'budget_ms', 'over'}]
+        list: [(isim, atlanma nedeni)]
+    """
+    config = get_budget_settings()
+    results = []
+    with transaction.atomic():
+        seed(rows or config['ROWS'])
+        clients = _clients()
+        urls, skipped = collect_urls(only)
+        # Cache'ler kapalı - soğuk istek ölçülür
+        with override_settings(
+            PAGE_CACHE={'ENABLED': False},
+            CONDITIONAL_GET={'ENABLED': False},
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+        ):
+            for name, path in urls:
+                budget_queries, budget_ms = get_budget(name, config)
+                for role in roles:
+                    status, count, elapsed = measure(clients[role], path)
+                    over = []
+                    if not is_ok_status(status):
+                        over.append('status')
+                    if count > budget_queries:
+                        over.append('queries')
+                    if elapsed > budget_ms:
+                        over.append('ms')
+                    results.append({
+                        'name': name, 'path': path, 'role': role, 'status': status,
+                        'queries': count, 'ms': elapsed,
+                        'budget_queries': budget_queries, 'budget_ms': budget_ms, 'over': over,
+                    })
+        transaction.set_rollback(True)
+    return results, skipped
@@ -0,0 +1,384 @@
+# core/queryplans.py
+"""
+Sorgu planı regresyon kontrolü (EXPLAIN)
+
+Sentetik veriyle public ve dashboard sayfalarını gezip çalışan her ORM
+sorgusunun planını alır; daha önce index kullanan bir sorgu tam tablo
+taramasına (Seq Scan / SCAN) döndüyse veya baseline'da olmayan yeni bir
+sorgu büyük tablo tarıyorsa hata verir:
+
+    python manage.py query_plan_check                   # baseline ile karşılaştır
+    python manage.py query_plan_check --update-baseline  # mevcut planları kaydet
+    python manage.py query_plan_check --allow-new-scans  # yeni taramalar sadece uyarı
+
+    - Veri ve oturum tek transaction içinde oluşturulur, sonunda geri alınır
+    - Sorgular parametreleri çıkarılmış SQL'in özetiyle eşleştirilir
+      (aynı sorgu farklı slug/id ile aynı kaydı üretir)
+    - Baseline veritabanı motoruna göre ayrı tutulur (sqlite / postgresql)
+
+Sadece HOT_MODELS tablolarının taraması dikkate alınır; küçük tablolar
+(ayarlar, kullanıcılar) her zaman taranabilir.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'BASELINE': None,  # Varsayılan: BASE_DIR/core/query_plan_baseline.json
+    'ROWS': 5000,  # Büyük tablo başına sentetik kayıt
+}
+
+# Sentetik veri basılan (büyüyebilen) tablolar
+HOT_MODELS = [
+    'products.product', 'products.category', 'gallery.gallery', 'reviews.review',
+    'contact.contact', 'dashboard.notification', 'about.service', 'about.teammember',
+]
+
+SEED_PREFIX = 'qp-seed'
+
+PUBLIC_URLS = [
+    '/tr/',
+    '/tr/urunler/',
+    '/tr/urunler/?sort=newest&page=2',
+    '/tr/urunler/kategoriler/',
+    '/tr/urunler/kategori/{category}/',
+    '/tr/urunler/one-cikan/',
+    '/tr/urunler/{product}/',
+    '/tr/galeri/',
+    '/tr/galeri/resimler/',
+    '/tr/galeri/videolar/',
+    '/tr/galeri/{gallery}/',
+    '/tr/hakkimizda/',
+    '/tr/hakkimizda/hizmetler/',
+    '/tr/hakkimizda/hizmet/{service}/',
+    '/tr/hakkimizda/ekip/',
+    '/tr/hakkimizda/ekip/{team}/',
+    '/tr/iletisim/',
+]
+
+DASHBOARD_URLS = [
+    '/dashboard/',
+    '/dashboard/messages/',
+    '/dashboard/reviews/',
+    '/dashboard/products/',
+    '/dashboard/categories/',
+    '/dashboard/gallery/',
+    '/dashboard/services/',
+    '/dashboard/team/',
+    '/dashboard/notifications/',
+    '/dashboard/notifications/get/',
+    '/dashboard/activities/',
+]
+
+
+def get_query_plan_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'QUERY_PLAN_CHECK', {}))
+    if not config['BASELINE']:
+        config['BASELINE'] = os.path.join(settings.BASE_DIR, 'core', 'query_plan_baseline.json')
+    config['BASELINE'] = str(config['BASELINE'])
+    return config
+
+
+def hot_tables():
+    from django.apps import apps
+    return {apps.get_model(label)._meta.db_table for label in HOT_MODELS}
+
+
+# ========================
+# Sentetik veri
+# ========================
+
+def seed(rows):
+    """
+    Büyük tablolara sentetik kayıt ekle (çağıran transaction'ı geri almalı)
+
+    Returns:
+        dict: URL şablonları için örnek slug'lar
+    """
+    from about.models import Service, TeamMember
+    from contact.models import Contact
+    from dashboard.models import Notification
+    from gallery.models import Gallery
+    from products.models import Category, Product
+    from reviews.models import Review
+
+    small = max(10, rows // 25)
+    categories = Category.objects.bulk_create(
+        Category(name=f'Kategori {i}', slug=f'{SEED_PREFIX}-cat-{i}', order=i % 10, is_active=i % 5 != 0)
+        for i in range(small)
+    )
+    Product.objects.bulk_create((
+        Product(
+            category=categories[i % len(categories)], name=f'Ürün {i}', slug=f'{SEED_PREFIX}-product-{i}',
+            is_active=i % 10 != 0, is_featured=i % 20 == 0, price=i % 500 + 1, stock=i % 30,
+        ) for i in range(rows)
+    ), batch_size=1000)
+    Gallery.objects.bulk_create((
+        Gallery(
+            title=f'Galeri {i}', slug=f'{SEED_PREFIX}-gallery-{i}', media_type='video' if i % 4 == 0 else 'image',
+            order=i % 100, is_active=i % 10 != 0, is_featured=i % 15 == 0,
+        ) for i in range(rows)
+    ), batch_size=1000)
+    Review.objects.bulk_create((
+        Review(name=f'Müşteri {i}', rating=i % 5 + 1, comment='Yorum', is_approved=i % 3 != 0)
+        for i in range(rows)
+    ), batch_size=1000)
+    Contact.objects.bulk_create((
+        Contact(name=f'Kişi {i}', email=f'kisi{i}@example.com', phone='0000', subject='Konu',
+                message='Mesaj', is_read=i % 4 != 0)
+        for i in range(rows)
+    ), batch_size=1000)
+    Notification.objects.bulk_create((
+        Notification(title=f'Bildirim {i}', message='Mesaj', notification_type='system', is_read=i % 5 != 0)
+        for i in range(rows)
+    ), batch_size=1000)
+    Service.objects.bulk_create(
+        Service(title=f'Hizmet {i}', slug=f'{SEED_PREFIX}-service-{i}', description='Açıklama',
+                order=i, is_active=i % 8 != 0)
+        for i in range(small)
+    )
+    TeamMember.objects.bulk_create(
+        TeamMember(name=f'Üye {i}', slug=f'{SEED_PREFIX}-team-{i}', position='Uzman', order=i, is_active=i % 8 != 0)
+        for i in range(small)
+    )
+
+    return {
+        'category': f'{SEED_PREFIX}-cat-1',
+        'product': f'{SEED_PREFIX}-product-1',
+        'gallery': f'{SEED_PREFIX}-gallery-1',
+        'service': f'{SEED_PREFIX}-service-1',
+        'team': f'{SEED_PREFIX}-team-1',
+    }
+
+
+def analyze():
+    """Planlayıcı istatistiklerini güncelle - yoksa küçük tablo gibi plan yapılır"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            for table in sorted(hot_tables()):
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(table)}')
+        elif connection.vendor == 'sqlite':
+            cursor.execute('ANALYZE')
+
+
+# ========================
+# Plan
+# ========================
+
+_LITERALS = [
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'\b\d+(\.\d+)?\b'), '?'),
+    (re.compile(r'\((\?\s*,\s*)+\?\)'), '(?...)'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def normalize(sql):
+    """Parametreleri çıkar - aynı sorgu farklı değerlerle aynı metni verir"""
+    for pattern, replacement in _LITERALS:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+def fingerprint(sql):
+    return hashlib.md5(normalize(sql).encode('utf-8')).hexdigest()[:12]
+
+
+def _aliases(sql):
+    """Alt sorgu takma adları (U0, T3) -> tablo"""
+    return {alias: table for table, alias in re.findall(r'"(\w+)" (U\d+|T\d+)\b', sql)}
+
+
+def _sqlite_scans(sql):
+    aliases = _aliases(sql)
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        details = [row[-1] for row in cursor.fetchall()]
+    scans = set()
+    for detail in details:
+        match = re.match(r'SCAN (\w+)$', detail)
+        if match:
+            scans.add(aliases.get(match.group(1), match.group(1)))
+    return scans, details
+
+
+def _walk(node):
+    yield node
+    for child in node.get('Plans', []):
+        yield from _walk(child)
+
+
+def _postgresql_scans(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    nodes = list(_walk(plan[0]['Plan']))
+    scans = {node['Relation Name'] for node in nodes if node.get('Node Type') == 'Seq Scan'}
+    details = [
+        f"{node.get('Node Type')} {node.get('Relation Name', '')} {node.get('Index Name', '')}".strip()
+        for node in nodes
+    ]
+    return scans, details
+
+
+def explain(sql):
+    """
+    Returns:
+        (tam taranan tablolar, plan satırları)
+    """
+    if connection.vendor == 'sqlite':
+        return _sqlite_scans(sql)
+    if connection.vendor == 'postgresql':
+        return _postgresql_scans(sql)
+    raise NotImplementedError(f'EXPLAIN desteklenmiyor: {connection.vendor}')
+
+
+# ========================
+# Sayfaları gez
+# ========================
+
+def _client(staff):
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')]
+    client = Client(HTTP_HOST=hosts[0] if hosts else 'localhost', raise_request_exception=False)
+    if staff:
+        from django.contrib.auth import get_user_model
+        user = get_user_model().objects.create_superuser(
+            username=f'{SEED_PREFIX}-admin', email='qp-admin@example.com', password=None,
+        )
+        client.force_login(user)
+    return client
+
+
+def collect(urls, staff=False):
+    """
+    URL'leri render et, çalışan SELECT'leri topla
+
+    Returns:
+        list: [(url, status, [sql, ...])]
+    """
+    client = _client(staff)
+    results = []
+    # Cache'ler kapalı - her sorgu gerçekten çalışsın
+    with override_settings(
+        PAGE_CACHE={'ENABLED': False},
+        CONDITIONAL_GET={'ENABLED': False},
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+    ):
+        for url in urls:
+            with CaptureQueriesContext(connection) as queries:
+                try:
+                    with transaction.atomic():
+                        response = client.get(url)
+                        status = response.status_code
+                except Exception as e:
+                    logger.error(f"Sorgu planı: {url} render edilemedi: {e}")
+                    status = 'hata'
+            selects = [query['sql'] for query in queries.captured_queries
+                       if query['sql'].lstrip().upper().startswith(('SELECT', 'WITH'))]
+            results.append((url, status, selects))
+    return results
+
+
+def run(rows=None, include_dashboard=True, extra_urls=()):
+    """
+    Sentetik veriyle sayfaları gez ve planları çıkar - veri geri alınır
+
+    Returns:
+        dict: fingerprint -> {'sql', 'urls', 'scans', 'plan'}
+        list: [(url, status, sorgu sayısı)]
+    """
+    config = get_query_plan_settings()
+    tables = hot_tables()
+    plans = {}
+    pages = []
+    with transaction.atomic():
+        samples = seed(rows or config['ROWS'])
+        analyze()
+        groups = [(PUBLIC_URLS, False)]
+        if include_dashboard:
+            groups.append((DASHBOARD_URLS, True))
+        if extra_urls:
+            groups.append((list(extra_urls), include_dashboard))
+
+        for urls, staff in groups:
+            urls = [url.format(**samples) for url in urls]
+            for url, status, selects in collect(urls, staff=staff):
+                pages.append((url, status, len(selects)))
+                for sql in selects:
+                    key = fingerprint(sql)
+                    if key not in plans:
+                        try:
+                            scans, details = explain(sql)
+                        except Exception as e:
+                            logger.error(f"EXPLAIN başarısız ({url}): {e}")
+                            continue
+                        plans[key] = {
+                            'sql': normalize(sql)[:400],
+                            'urls': [],
+                            'scans': sorted(scans & tables),
+                            'plan': details,
+                        }
+                    if url not in plans[key]['urls']:
+                        plans[key]['urls'].append(url)
+        transaction.set_rollback(True)
+    return plans, pages
+
+
+# ========================
+# Baseline
+# ========================
+
+def load_baseline(config=None):
+    config = config or get_query_plan_settings()
+    try:
+        with open(config['BASELINE'], encoding='utf-8') as handle:
+            return json.load(handle).get(connection.vendor, {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(plans, config=None):
+    config = config or get_query_plan_settings()
+    try:
+        with open(config['BASELINE'], encoding='utf-8') as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        data = {}
+    data[connection.vendor] = {
+        key: {'sql': plan['sql'], 'urls': plan['urls'], 'scans': plan['scans']}
+        for key, plan in sorted(plans.items())
+    }
+    with open(config['BASELINE'], 'w', encoding='utf-8') as handle:
+        json.dump(data, handle, ensure_ascii=False, indent=2, sort_keys=True)
+        handle.write('\n')
+
+
+def compare(plans, baseline):
+    """
+    Returns:
+        regressions: baseline'da index kullanan, şimdi tam taranan sorgular
+        new_scans: baseline'da olmayan ve büyük tablo tarayan sorgular
+    """
+    regressions, new_scans = [], []
+    for key, plan in plans.items():
+        previous = baseline.get(key)
+        if previous is None:
+            if plan['scans']:
+                new_scans.append((key, plan, plan['scans']))
+            continue
+        added = sorted(set(plan['scans']) - set(previous['scans']))
+        if added:
+            regressions.append((key, plan, added))
+    return regressions, new_scans
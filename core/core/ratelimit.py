@@ -0,0 +1,195 @@
+# core/ratelimit.py
+"""
+Atomik cache sayaçları üzerine kurulu sliding-window rate limiter
+
+Her istek için O(1) iş yapılır: mevcut pencerenin sayacı atomik olarak
+artırılır (Redis'te INCR, LocMemCache'te kilitli incr) ve bir önceki
+pencerenin sayacı okunur. Tahmini istek sayısı, önceki pencerenin geçen süre
+oranında ağırlıklandırılmasıyla hesaplanır (sliding window counter).
+
+FileBasedCache'te incr atomik değildir; orada sayaçlar yaklaşık değerdir,
+ama zaman damgası listesi tutan eski yaklaşıma göre yine O(1)'dir.
+"""
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+from django_ratelimit.exceptions import Ratelimited
+
+from .client_ip import get_client_ip
+
+RATE_UNITS = {
+    's': 1,
+    'm': 60,
+    'h': 60 * 60,
+    'd': 24 * 60 * 60,
+}
+
+
+def parse_rate(rate):
+    """
+    '10/m', '5/h', '3/600s', '100/5m' formatındaki oranı
+    (limit, pencere_saniye) çiftine çevirir
+    """
+    count, _, period = rate.partition('/')
+    if not period:
+        raise ValueError(f'Geçersiz rate formatı: {rate}')
+
+    unit = period[-1]
+    if unit.isdigit():
+        multiplier, unit = period, 's'
+    else:
+        multiplier = period[:-1] or '1'
+
+    if unit not in RATE_UNITS:
+        raise ValueError(f'Geçersiz rate birimi: {rate}')
+
+    return int(count), int(multiplier) * RATE_UNITS[unit]
+
+
+class RateLimitResult:
+    """Bir limit kontrolünün sonucu"""
+    __slots__ = ('allowed', 'count', 'limit', 'reset')
+
+    def __init__(self, allowed, count, limit, reset):
+        self.allowed = allowed
+        self.count = count
+        self.limit = limit
+        self.reset = reset
+
+    @property
+    def remaining(self):
+        return max(0, self.limit - int(self.count))
+
+    def __bool__(self):
+        return self.allowed
+
+
+class SlidingWindowRateLimiter:
+    """
+    Sliding-window counter rate limiter
+
+    Args:
+        scope (str): Cache key öneki (örn. 'rate_limit', 'login_attempts')
+        rate (str): '100/m' formatında limit
+        cache_alias (str): Kullanılacak cache (varsayılan: RATELIMIT_USE_CACHE)
+    """
+
+    def __init__(self, scope, rate, cache_alias=None):
+        self.scope = scope
+        self.rate = rate
+        self.limit, self.window = parse_rate(rate)
+        self.cache_alias = cache_alias or getattr(settings, 'RATELIMIT_USE_CACHE', 'default')
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _keys(self, identifier, now):
+        index = int(now // self.window)
+        prefix = f'{self.scope}:{identifier}'
+        return f'{prefix}:{index}', f'{prefix}:{index - 1}'
+
+    def _increment(self, key, amount):
+        cache = self.cache
+        try:
+            return cache.incr(key, amount)
+        except ValueError:
+            # Pencerenin ilk isteği - add() yarışı kaybedilirse incr tekrar denenir
+            if cache.add(key, amount, self.window * 2):
+                return amount
+            return cache.incr(key, amount)
+
+    def _estimate(self, current, previous, now):
+        elapsed = (now % self.window) / self.window
+        return previous * (1 - elapsed) + current
+
+    def _result(self, current, previous, now):
+        count = self._estimate(current or 0, previous or 0, now)
+        reset = self.window - (now % self.window)
+        return RateLimitResult(count <= self.limit, count, self.limit, reset)
+
+    def hit(self, identifier, amount=1):
+        """İsteği say ve limit sonucunu döndür"""
+        now = time.time()
+        current_key, previous_key = self._keys(identifier, now)
+        current = self._increment(current_key, amount)
+        previous = self.cache.get(previous_key, 0)
+        return self._result(current, previous, now)
+
+    def peek(self, identifier):
+        """Sayacı artırmadan mevcut durumu döndür"""
+        now = time.time()
+        current_key, previous_key = self._keys(identifier, now)
+        values = self.cache.get_many([current_key, previous_key])
+        return self._result(values.get(current_key, 0), values.get(previous_key, 0), now)
+
+    def reset(self, identifier):
+        """Kimliğe ait sayaçları temizle"""
+        self.cache.delete_many(self._keys(identifier, time.time()))
+
+
+# ========================
+# View decorator
+# ========================
+
+_limiters = {}
+
+
+def get_limiter(scope, rate):
+    """Aynı scope/rate için worker başına tek limiter örneği"""
+    limiter = _limiters.get((scope, rate))
+    if limiter is None:
+        limiter = _limiters[(scope, rate)] = SlidingWindowRateLimiter(scope, rate)
+    return limiter
+
+
+def _get_key(request, key, group):
+    if callable(key):
+        return key(group, request)
+    if key == 'ip':
+        return get_client_ip(request)
+    if key == 'user':
+        return str(request.user.pk) if request.user.is_authenticated else None
+    if key == 'user_or_ip':
+        if request.user.is_authenticated:
+            return f'user-{request.user.pk}'
+        return get_client_ip(request)
+    raise ValueError(f'Bilinmeyen ratelimit key: {key}')
+
+
+def ratelimit(key='ip', rate='10/m', method='POST', block=True, group=None):
+    """
+    django_ratelimit.decorators.ratelimit ile aynı imzaya sahip,
+    SlidingWindowRateLimiter kullanan decorator
+
+    Limit aşıldığında Ratelimited fırlatılır; RatelimitMiddleware bunu
+    RATELIMIT_VIEW'e yönlendirir.
+    """
+    methods = (method,) if isinstance(method, str) else tuple(method or ())
+
+    def decorator(fn):
+        scope = f"rl:{group or f'{fn.__module__}.{fn.__qualname__}'}"
+        limiter = get_limiter(scope, rate)
+
+        @wraps(fn)
+        def _wrapped(request, *args, **kwargs):
+            old_limited = getattr(request, 'limited', False)
+            limited = False
+
+            if getattr(settings, 'RATELIMIT_ENABLE', True) and (
+                not methods or request.method in methods
+            ):
+                identifier = _get_key(request, key, group)
+                if identifier is not None:
+                    limited = not limiter.hit(identifier)
+
+            request.limited = limited or old_limited
+            if limited and block:
+                cls = getattr(settings, 'RATELIMIT_EXCEPTION_CLASS', Ratelimited)
+                raise (import_string(cls) if isinstance(cls, str) else cls)()
+            return fn(request, *args, **kwargs)
+        return _wrapped
+    return decorator
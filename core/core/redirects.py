@@ -0,0 +1,281 @@
+# core/redirects.py
+"""
+Veritabanı tabanlı yönlendirme motoru
+
+Redirect tablosu worker başına bir kez derlenir:
+    - Tam eşleşmeler: dict (O(1))
+    - Önek kuralları: segment tabanlı prefix trie (core.edge.PrefixTrie)
+    - Regex kuralları: tek birleşik regex; hangi kuralın eşleştiği
+      m.lastindex ile doğrudan bulunur
+
+Derlenmiş index, cache'teki sürüm anahtarı (VERSION_KEY) değişene kadar
+kullanılır. Redirect kaydedilip silindiğinde sürüm transaction commit
+sonrası artırılır; diğer worker'lar en geç VERSION_CHECK_INTERVAL saniye
+içinde yeni index'i derler. Arama maliyeti tablo boyutundan bağımsızdır.
+
+Product, Category ve Gallery slug'ı değiştiğinde eski URL için otomatik 301
+kaydı oluşturulur (slug geçmişi).
+"""
+import logging
+import re
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .edge import LEGACY_REDIRECTS, PrefixTrie
+from .language import get_language_codes
+from .models import Redirect
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'redirects:version'
+
+# Slug değişikliği izlenen modeller
+SLUG_HISTORY_MODELS = ('products.Product', 'products.Category', 'gallery.Gallery')
+
+
+def split_language(path):
+    """'/en/urunler/x/' -> ('en', '/urunler/x/'); önek yoksa (None, path)"""
+    segment, _, rest = path[1:].partition('/')
+    if segment in get_language_codes():
+        return segment, '/' + rest
+    return None, path
+
+
+def strip_language(path):
+    return split_language(path)[1]
+
+
+class RedirectIndex:
+    """Derlenmiş yönlendirme kuralları"""
+
+    def __init__(self, rules, version=None):
+        self.version = version
+        self.exact = {}
+        self.trie = PrefixTrie()
+        self.size = 0
+
+        regex_rules = []
+        for old_path, new_path, match_type, status_code in rules:
+            target = (new_path, status_code)
+            if match_type == Redirect.MATCH_EXACT:
+                self.exact.setdefault(old_path, target)
+            elif match_type == Redirect.MATCH_PREFIX:
+                self.trie.insert(old_path, (old_path.rstrip('/'), new_path, status_code))
+            elif match_type == Redirect.MATCH_REGEX:
+                try:
+                    regex_rules.append((re.compile(old_path), new_path, status_code))
+                except re.error as e:
+                    logger.warning(f"Geçersiz redirect regex atlandı: {old_path} ({e})")
+                    continue
+            self.size += 1
+
+        self.regex_rules = regex_rules
+        self.combined, self.group_rules = self._combine(regex_rules)
+
+    @staticmethod
+    def _combine(regex_rules):
+        """Tüm regex kurallarını tek alternation'a derle"""
+        if not regex_rules:
+            return None, {}
+        pattern = '|'.join(
+            f'(?P<_r{index}>{rule[0].pattern})' for index, rule in enumerate(regex_rules)
+        )
+        try:
+            combined = re.compile(pattern)
+        except re.error:
+            # Örn. iki kuralda aynı isimli grup - kurallar sırayla denenir
+            return None, {}
+        group_rules = {
+            combined.groupindex[f'_r{index}']: rule
+            for index, rule in enumerate(regex_rules)
+        }
+        return combined, group_rules
+
+    def _match_regex(self, path):
+        if self.combined is not None:
+            m = self.combined.match(path)
+            if m is None:
+                return None
+            # Dış grup en son kapanır -> lastindex eşleşen kuralı verir
+            rule = self.group_rules[m.lastindex]
+            candidates = (rule,)
+        else:
+            candidates = self.regex_rules
+
+        for pattern, new_path, status_code in candidates:
+            m = pattern.match(path)
+            if m is not None:
+                return m.expand(new_path), status_code
+        return None
+
+    def _match(self, path):
+        target = self.exact.get(path)
+        if target is not None:
+            return target
+
+        prefix_rule = self.trie.match(path)
+        if prefix_rule is not None:
+            base, new_path, status_code = prefix_rule
+            rest = path[len(base):]
+            if rest and rest != '/':
+                new_path = new_path.rstrip('/') + rest
+            return new_path, status_code
+
+        if self.regex_rules:
+            return self._match_regex(path)
+        return None
+
+    def find(self, path):
+        """
+        Yol için (hedef, status_code) döndür - eşleşme yoksa None
+
+        Dil önekli istekler ('/en/...') öneksiz kurallara da eşleşir,
+        hedefe aynı dil öneki eklenir.
+        """
+        result = self._match(path)
+        if result is None:
+            language, rest = split_language(path)
+            if language is None:
+                return None
+            result = self._match(rest)
+            if result is None:
+                return None
+            new_path, status_code = result
+            if new_path.startswith('/') and split_language(new_path)[0] is None:
+                result = f'/{language}{new_path}', status_code
+
+        if result[0] == path:
+            return None
+        return result
+
+
+def _load_rules():
+    rules = [
+        (old_path, new_path, Redirect.MATCH_EXACT, 301)
+        for old_path, new_path in LEGACY_REDIRECTS.items()
+    ]
+    try:
+        rules.extend(
+            Redirect.objects.filter(is_active=True)
+            .order_by('match_type', 'old_path')
+            .values_list('old_path', 'new_path', 'match_type', 'status_code')
+        )
+    except DatabaseError as e:
+        logger.error(f"Redirect tablosu okunamadı: {e}")
+    return rules
+
+
+_index = None
+_checked_at = 0.0
+
+
+def get_redirect_index():
+    """
+    Worker'ın derlenmiş index'i - sürüm anahtarı en fazla
+    VERSION_CHECK_INTERVAL saniyede bir kontrol edilir
+    """
+    global _index, _checked_at
+
+    now = time.monotonic()
+    interval = getattr(settings, 'REDIRECT_ENGINE', {}).get('VERSION_CHECK_INTERVAL', 5)
+    if _index is not None and now - _checked_at < interval:
+        return _index
+
+    version = cache.get(VERSION_KEY)
+    if _index is None or _index.version != version:
+        _index = RedirectIndex(_load_rules(), version)
+        logger.debug(f"Redirect index derlendi: {_index.size} kural (sürüm {version})")
+    _checked_at = now
+    return _index
+
+
+def bump_version():
+    """Tüm worker'ların index'ini geçersiz kıl (commit sonrası)"""
+    def _bump():
+        global _index
+        cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+        _index = None
+
+    transaction.on_commit(_bump)
+
+
+@receiver(post_save, sender=Redirect)
+@receiver(post_delete, sender=Redirect)
+def invalidate_redirect_index(sender, **kwargs):
+    bump_version()
+
+
+# ========================
+# Slug geçmişi
+# ========================
+
+def remember_old_slug(sender, instance, raw=False, **kwargs):
+    """pre_save: slug değiştiyse eski URL'i instance üzerinde sakla"""
+    if raw or not instance.pk:
+        return
+
+    old_slug = (
+        sender._default_manager.filter(pk=instance.pk)
+        .values_list('slug', flat=True).first()
+    )
+    if not old_slug or old_slug == instance.slug:
+        return
+
+    new_slug = instance.slug
+    instance.slug = old_slug
+    try:
+        instance._redirect_old_path = strip_language(instance.get_absolute_url())
+    except Exception as e:
+        logger.warning(f"Eski slug URL'i hesaplanamadı ({sender.__name__} #{instance.pk}): {e}")
+    finally:
+        instance.slug = new_slug
+
+
+def record_slug_redirect(sender, instance, raw=False, **kwargs):
+    """post_save: eski URL -> yeni URL kalıcı yönlendirmesini kaydet"""
+    old_path = instance.__dict__.pop('_redirect_old_path', None)
+    if raw or not old_path:
+        return
+
+    try:
+        new_path = strip_language(instance.get_absolute_url())
+        add_slug_redirect(old_path, new_path)
+    except Exception as e:
+        logger.error(f"Slug yönlendirmesi kaydedilemedi ({old_path}): {e}")
+
+
+def add_slug_redirect(old_path, new_path):
+    """
+    Slug geçmişi kaydı oluştur - zincirleri düzleştirir
+    (a -> b, b -> c yerine a -> c, b -> c)
+    """
+    if old_path == new_path:
+        return
+
+    exact = Redirect.objects.filter(match_type=Redirect.MATCH_EXACT)
+    # Eski slug geri alındıysa ona işaret eden kayıt kaldırılır
+    exact.filter(old_path=new_path).delete()
+    exact.filter(new_path=old_path).update(new_path=new_path)
+    Redirect.objects.update_or_create(
+        old_path=old_path,
+        match_type=Redirect.MATCH_EXACT,
+        defaults={
+            'new_path': new_path,
+            'status_code': 301,
+            'source': Redirect.SOURCE_SLUG,
+            'is_active': True,
+        },
+    )
+    # update() sinyal tetiklemez - sürüm açıkça artırılır
+    bump_version()
+
+
+for model in SLUG_HISTORY_MODELS:
+    pre_save.connect(remember_old_slug, sender=model, dispatch_uid=f'redirect_slug_pre_{model}')
+    post_save.connect(record_slug_redirect, sender=model, dispatch_uid=f'redirect_slug_post_{model}')
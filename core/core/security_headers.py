@@ -0,0 +1,183 @@
+# core/security_headers.py
+"""
+Önceden hesaplanmış güvenlik başlığı paketleri
+
+Tüm başlık değerleri (CSP, HSTS, Permissions-Policy vb.) uygulama açılışında
+settings'ten okunup değişmez tuple'lara dondurulur. Middleware her response'da
+sadece ilgili paketi tek geçişte uygular.
+
+CSP profilleri URL namespace'ine veya url_name'e göre seçilir:
+
+    CSP_PROFILES = {'dashboard': {'img-src': [...]}}
+    CSP_ROUTE_PROFILES = {'dashboard': 'dashboard', 'catalog_view': 'catalog'}
+
+Profil, varsayılan CSP direktiflerinin üzerine yazılan direktifleri içerir.
+'nonce': True olan profillerde script-src'ye istek başına nonce eklenir;
+template'lerde {{ request.csp_nonce }} ile kullanılır.
+"""
+import secrets
+
+from django.conf import settings
+
+DEFAULT_PROFILE = 'default'
+
+# Direktif adı -> settings adı ve varsayılan değer
+CSP_DIRECTIVE_SETTINGS = (
+    ('default-src', 'CSP_DEFAULT_SRC', ["'self'"]),
+    ('script-src', 'CSP_SCRIPT_SRC', ["'self'"]),
+    ('style-src', 'CSP_STYLE_SRC', ["'self'"]),
+    ('img-src', 'CSP_IMG_SRC', ["'self'"]),
+    ('font-src', 'CSP_FONT_SRC', ["'self'"]),
+    ('connect-src', 'CSP_CONNECT_SRC', ["'self'"]),
+    ('frame-src', 'CSP_FRAME_SRC', ["'none'"]),
+    ('object-src', 'CSP_OBJECT_SRC', ["'none'"]),
+    ('media-src', 'CSP_MEDIA_SRC', ["'self'"]),
+)
+
+# Nonce yer tutucusu - paket derlenirken script-src'ye eklenir
+NONCE_PLACEHOLDER = '{nonce}'
+
+
+class CSPNonce:
+    """
+    İstek başına tembel nonce - sadece template'te kullanılırsa üretilir,
+    kullanılmadıysa başlığa da eklenmez
+    """
+    __slots__ = ('_value',)
+
+    def __init__(self):
+        self._value = None
+
+    @property
+    def used(self):
+        return self._value is not None
+
+    def __str__(self):
+        if self._value is None:
+            self._value = secrets.token_urlsafe(16)
+        return self._value
+
+    __html__ = __str__
+
+
+def _base_headers():
+    """Profilden bağımsız başlıklar"""
+    headers = [
+        # XSS koruması
+        ('X-XSS-Protection', '1; mode=block'),
+        # Content type sniffing koruması
+        ('X-Content-Type-Options', 'nosniff'),
+        # Referrer policy
+        ('Referrer-Policy', getattr(settings, 'SECURE_REFERRER_POLICY', None) or 'strict-origin-when-cross-origin'),
+        # Permissions policy (önceki Feature-Policy)
+        ('Permissions-Policy', (
+            'camera=(), microphone=(), geolocation=(), '
+            'payment=(), usb=(), magnetometer=(), gyroscope=(), '
+            'accelerometer=(), ambient-light-sensor=()'
+        )),
+    ]
+
+    # HSTS (sadece HTTPS'de)
+    hsts_seconds = getattr(settings, 'SECURE_HSTS_SECONDS', 0)
+    if hsts_seconds and hsts_seconds > 0:
+        hsts_header = f'max-age={hsts_seconds}'
+        if getattr(settings, 'SECURE_HSTS_INCLUDE_SUBDOMAINS', False):
+            hsts_header += '; includeSubDomains'
+        if getattr(settings, 'SECURE_HSTS_PRELOAD', False):
+            hsts_header += '; preload'
+        headers.append(('Strict-Transport-Security', hsts_header))
+
+    return headers
+
+
+def _build_csp(overrides):
+    """
+    Varsayılan direktifler + profil override'ları -> (csp, nonce_csp)
+
+    nonce_csp, nonce kullanan profillerde {nonce} yer tutuculu şablondur;
+    diğer profillerde None döner.
+    """
+    directives = {
+        directive: list(getattr(settings, setting_name, default))
+        for directive, setting_name, default in CSP_DIRECTIVE_SETTINGS
+    }
+    use_nonce = False
+    for directive, sources in overrides.items():
+        if directive == 'nonce':
+            use_nonce = bool(sources)
+            continue
+        directives[directive] = list(sources)
+
+    def join(directives):
+        return '; '.join(
+            f"{directive} {' '.join(sources)}"
+            for directive, sources in directives.items()
+            if sources
+        )
+
+    csp = join(directives)
+    if not use_nonce:
+        return csp, None
+
+    directives['script-src'] = directives.get('script-src', []) + [f"'nonce-{NONCE_PLACEHOLDER}'"]
+    return csp, join(directives)
+
+
+class HeaderBundle:
+    """Bir CSP profili için dondurulmuş başlık seti"""
+    __slots__ = ('name', 'headers', 'csp', 'nonce_csp', 'frame_options')
+
+    def __init__(self, name, headers, csp, nonce_csp=None):
+        self.name = name
+        self.headers = tuple(headers)
+        self.csp = csp
+        self.nonce_csp = nonce_csp
+        self.frame_options = getattr(settings, 'X_FRAME_OPTIONS', 'DENY')
+
+    @property
+    def use_nonce(self):
+        return self.nonce_csp is not None
+
+    def apply(self, response, nonce=None):
+        """
+        Başlıkları tek geçişte uygula - view'in kendi ayarladığı başlıklar
+        korunur
+        """
+        headers = response.headers
+        for name, value in self.headers:
+            if name not in headers:
+                headers[name] = value
+
+        # Clickjacking koruması (xframe_options_exempt desteği ile)
+        if 'X-Frame-Options' not in headers and not getattr(response, 'xframe_options_exempt', False):
+            headers['X-Frame-Options'] = self.frame_options
+
+        if self.csp and 'Content-Security-Policy' not in headers:
+            if self.nonce_csp and nonce is not None and nonce.used:
+                headers['Content-Security-Policy'] = self.nonce_csp.replace(NONCE_PLACEHOLDER, str(nonce))
+            else:
+                headers['Content-Security-Policy'] = self.csp
+
+
+def build_header_bundles():
+    """Tüm profiller için başlık paketlerini oluştur"""
+    base = _base_headers()
+    profiles = {DEFAULT_PROFILE: {}}
+    profiles.update(getattr(settings, 'CSP_PROFILES', {}))
+
+    bundles = {}
+    for name, overrides in profiles.items():
+        csp, nonce_csp = _build_csp(overrides)
+        bundles[name] = HeaderBundle(name, base, csp, nonce_csp)
+    return bundles
+
+
+def resolve_profile_name(request, route_profiles):
+    """İsteğin namespace/url_name bilgisinden CSP profil adını bul"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return DEFAULT_PROFILE
+    for namespace in match.namespaces:
+        if namespace in route_profiles:
+            return route_profiles[namespace]
+    return route_profiles.get(match.url_name, DEFAULT_PROFILE)
@@ -50,21 +50,21 @@ INSTALLED_APPS = [
 ]
 # Security middleware sıralaması - EN ÖNEMLİ DEĞİŞİKLİK
 MIDDLEWARE = [
-    'django.middleware.cache.UpdateCacheMiddleware',
-    'django.middleware.security.SecurityMiddleware',  # En başta
+    'core.middleware.ServerTimingMiddleware',         # SERVER_TIMING['ENABLED'] ile açılır
+    'django.middleware.security.SecurityMiddleware',  # SSL yönlendirme + HSTS - edge yanıtları dahil
+    'core.middleware.EdgeMiddleware',                 # Statik/robots/yönlendirme hızlı yolu
+    'core.middleware.IPAddressMiddleware',            # İstemci IP'si bir kez çözülür
     'core.middleware.SecurityHeadersMiddleware',      # Özel güvenlik middleware'i
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.EdgeSessionMiddleware',          # Sessionless route'larda session açılmaz
     'django.middleware.locale.LocaleMiddleware',
     'core.middleware.SEOCanonicalMiddleware',
     'core.middleware.URLRedirectMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.EdgeAuthenticationMiddleware',   # Sessionless route'larda anonim kullanıcı
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'django.middleware.cache.FetchFromCacheMiddleware',
+    'core.middleware.PageCacheMiddleware',            # Anonim tam sayfa cache'i (core.pagecache)
     'django_ratelimit.middleware.RatelimitMiddleware',
-    'core.middleware.IPAddressMiddleware',
     'core.middleware.SitePrimaryLanguageMiddleware',
     'core.middleware.DashboardLocaleMiddleware',
 ]
@@ -154,6 +154,11 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'core.timing': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
@@ -164,6 +169,173 @@ SECURITY_MONITORING = {
     'BLOCK_SUSPICIOUS_IPS': True,
     'MAX_LOGIN_ATTEMPTS': 5,
     'LOGIN_ATTEMPT_TIMEOUT': 300,  # 5 dakika
+    'RATE_LIMIT': '100/m',  # IP başına sliding-window limit (core.ratelimit)
+}
+
+# İstemci IP çözümleme (core.client_ip) - X-Forwarded-For sadece bu ağlardaki
+# proxy'lerden geldiğinde dikkate alınır (nginx aynı makinede)
+TRUSTED_PROXY_CIDRS = config(
+    'TRUSTED_PROXY_CIDRS',
+    default='127.0.0.1/32,::1/128',
+    cast=lambda v: [s.strip() for s in v.split(',') if s.strip()]
+)
+
+# Anonim tam sayfa cache'i (core.pagecache)
+PAGE_CACHE = {
+    'ENABLED': True,
+    # 'TIMEOUT': 600,  # Varsayılan CACHE_MIDDLEWARE_SECONDS (production: 3600)
+    'BYPASS_PREFIXES': ('/i18n/', '/set_language/', '/captcha/', '/ckeditor5/', '/__debug__/'),
+    'IGNORED_QUERY_PARAMS': ('utm_', 'fbclid', 'gclid', 'yclid', 'msclkid', '_ga'),  # Anahtara girmez
+    'BYPASS_QUERY_PARAMS': ('q',),  # Arama sonuçları cache'lenmez
+}
+
+# Etiket tabanlı cache geçersiz kılma (core.cachetags)
+CACHE_TAGS = {
+    # Bu uygulamalardaki kayıt/silmeler model + nesne etiketlerini ve 'site' etiketini yeniler
+    'TRACKED_APPS': ('core', 'home', 'products', 'gallery', 'about', 'contact', 'reviews', 'dashboard'),
+    # Sayfa içeriğini etkilemez - ziyaretçi yazmaları (iletişim formu, çerez onayı) sayfa cache'ini silmez
+    'SITE_EXCLUDED_MODELS': (
+        'core.redirect', 'core.notfoundstat', 'core.cookieconsent',
+        'contact.contact', 'dashboard.message', 'dashboard.notification',
+        'dashboard.dailystats', 'dashboard.activityevent', 'dashboard.dashboardtranslationsettings',
+    ),
+}
+
+# Cache stampede koruması (core.stampede) - cachetags.get_or_set, cache_view, singleton'lar
+CACHE_STAMPEDE = {
+    'BETA': 1.0,  # XFetch erken yenileme katsayısı (0: kapalı)
+    'JITTER': 0.1,  # TTL'ler ±%10 dağıtılır
+    'STALE_GRACE': 60 * 5,  # Yenilenirken eski değer sunulabilecek süre
+    'WAIT_TIMEOUT': 2.0,  # Eski değer yoksa hesaplayan worker'ı bekleme süresi
+}
+
+# Koşullu GET - ETag / Last-Modified / 304 (core.conditional)
+CONDITIONAL_GET = {
+    'ENABLED': True,
+    'RELEASE': config('RELEASE_VERSION', default=''),  # Deploy'da değiştirilirse eski ETag'ler düşer
+    'SITE_DEPENDENCIES': ['core.sitesettings', 'about.about'],  # Tüm sayfalarda görünen içerik
+}
+
+# Önceden yazılan sitemap dosyaları (core.sitemapfiles)
+SITEMAP_FILES = {
+    'ROOT': BASE_DIR / 'var' / 'sitemaps',
+    # Production'da zorunlu (core.E001) - boşsa sadece DEBUG'da isteğin host'u kullanılır
+    'BASE_URL': config('SITEMAP_BASE_URL', default=''),
+    'MAX_URLS': 50000,  # Dosya başına URL - aşılınca yeni parça
+    'REBUILD_ON_CHANGE': True,  # İçerik değişince sadece etkilenen bölümü yeniden yaz
+}
+
+# Sorgu planı regresyon kontrolü (core.queryplans - query_plan_check komutu)
+QUERY_PLAN_CHECK = {
+    'BASELINE': BASE_DIR / 'core' / 'query_plan_baseline.json',  # Motor bazında (sqlite / postgresql)
+    'ROWS': 5000,  # Büyük tablo başına sentetik kayıt
+}
+
+# Dashboard grafikleri - günlük özet tablo (dashboard.analytics, rebuild_daily_stats komutu)
+DASHBOARD_ANALYTICS = {
+    'MONTHS': 6,  # Ana sayfa aylık grafiği
+    'MAX_PERIOD_DAYS': 366 * 2,  # chart_data_api ?period= üst sınırı
+    'DAILY_PERIOD_LIMIT': 90,  # Daha uzun dönemler aylık gruplanır
+    'SIGNALS': True,  # Ürün / yorum / mesaj kayıt-silmede özet tabloyu güncelle
+}
+
+# Aktivite geçmişi - ActivityEvent olay tablosu (dashboard.activity, backfill_activity_events komutu)
+DASHBOARD_ACTIVITY = {
+    'PAGE_SIZE': 20,  # Aktivite sayfası
+    'WIDGET_SIZE': 8,  # Ana sayfa "Son Aktiviteler"
+    'BATCH_SIZE': 1000,  # Backfill toplu yazma
+    'MAX_DAYS': 3650,  # Aktivite sayfası ?days= üst sınırı
+}
+
+# Dashboard mesaj kutusu (dashboard.inbox)
+DASHBOARD_INBOX = {
+    'PAGE_SIZE': 25,
+    'MAX_PAGE_SIZE': 100,  # Sonsuz kaydırma ?size= üst sınırı
+    'MAX_IDS': 500,  # Toplu okundu işaretlemede tek istekteki en fazla mesaj
+}
+
+# Endpoint sorgu / render süresi bütçesi (core.querybudget - query_budget komutu)
+QUERY_BUDGET = {
+    'QUERIES': 25,
+    'RENDER_MS': 1000,
+    'ROWS': 2000,  # Büyük tablo başına sentetik kayıt
+    # Mevcut değerlere sabitlenmiş istisnalar - sayı ARTARSA komut hata verir
+    'ENDPOINTS': {
+        'dashboard:dashboard_about_edit': {'QUERIES': 28},
+        # Sayfalamasız listeler - tüm kayıtlar render ediliyor
+        'dashboard:dashboard_gallery': {'RENDER_MS': 15000},
+        'dashboard:ajax_gallery_list': {'RENDER_MS': 15000},
+        'dashboard:legacy_dashboard_gallery': {'RENDER_MS': 15000},
+    },
+}
+
+# Ana sayfa bölüm fragment cache'i (home.sections)
+HOME_SECTION_CACHE = {
+    'ENABLED': True,
+    'TIMEOUT': 60 * 60,
+    'WARM_ON_CHANGE': True,  # İçerik değişince aktif diller için arka planda yeniden oluştur
+}
+
+# Cloudinary depolama paketleri (dashboard depolama göstergesi)
+CLOUDINARY_STORAGE_PACKAGES = {
+    5: 5 * 1024 * 1024 * 1024,
+    10: 10 * 1024 * 1024 * 1024,
+    15: 15 * 1024 * 1024 * 1024,
+    20: 20 * 1024 * 1024 * 1024,
+    25: 25 * 1024 * 1024 * 1024,
+}
+
+CLOUDINARY_STORAGE_LIMIT_GB = int(config('CLOUDINARY_STORAGE_LIMIT', default='5'))
+CLOUDINARY_STORAGE_LIMIT_BYTES = CLOUDINARY_STORAGE_PACKAGES.get(
+    CLOUDINARY_STORAGE_LIMIT_GB,
+    CLOUDINARY_STORAGE_PACKAGES[5]
+)
+
+# Cloudinary depolama kullanımı - stale-while-revalidate (core.storageusage)
+STORAGE_USAGE = {
+    'FRESH_TIMEOUT': 60 * 5,  # Daha eski değer sunulur ve arka planda yenilenir
+    'STALE_TIMEOUT': 60 * 60 * 24,  # Bayat değerin azami ömrü
+    'LOCK_TIMEOUT': 30,  # Tek uçuş kilidi
+    'RETRY_AFTER': 60,  # API hatasından sonra tekrar deneme
+    # 'USAGE_FUNCTION': 'myapp.stubs.fake_usage',  # Yerel test için stub
+}
+
+# İstek zaman ölçümü (core.timing) - Server-Timing başlığı + 'core.timing' log satırı
+SERVER_TIMING = {
+    'ENABLED': config('SERVER_TIMING_ENABLED', default=False, cast=bool),
+    'SAMPLE_RATE': config('SERVER_TIMING_SAMPLE_RATE', default=0.01, cast=float),  # İsteklerin %1'i
+    'HEADER': True,  # Server-Timing başlığını response'a ekle
+    'LOG': True,  # url_name bazında JSON log satırı
+}
+
+# Edge middleware (core.edge) - zincirin başında kısa devre edilen istekler
+EDGE_MIDDLEWARE = {
+    # 'SERVE_FILES': True,  # Varsayılan DEBUG; kapalıysa /static/ ve /media/ doğrudan 404 (nginx/CDN sunar)
+    'FAVICON': 'images/favicon.ico',  # /favicon.ico -> statik dosyaya 301
+    'ROBOTS_MAX_AGE': 86400,
+    'REDIRECTS': {
+        # Eski URL -> yeni URL (core.edge.LEGACY_REDIRECTS'e eklenir)
+    },
+}
+
+# Ziyaret sayacı (core.visits) - imzalı cookie ile tekil ziyaretçi, toplu yazma
+VISIT_COUNTER = {
+    'COOKIE_NAME': '_pv',
+    'DEDUP_SECONDS': 60 * 60 * 24,
+    'FLUSH_THRESHOLD': 100,  # None: sadece 'manage.py flush_visit_counters' (cron) ile yazılır
+}
+
+# Veritabanı yönlendirme motoru (core.redirects)
+REDIRECT_ENGINE = {
+    'VERSION_CHECK_INTERVAL': 5,  # Saniye - worker'lar index sürümünü bu aralıkla kontrol eder
+}
+
+# İstek denetim kuralları (core.inspection) - varsayılan setleri ezer
+# Boş liste verilen set devre dışı kalır, yeni isimler yeni set olarak eklenir
+REQUEST_INSPECTION_RULES = {
+    # 'sql_injection': [...],
+    # 'xss': [...],
+    # 'suspicious': [...],
 }
 
 
@@ -338,6 +510,25 @@ CSP_FRAME_SRC = ["'none'"]
 CSP_OBJECT_SRC = ["'none'"]
 CSP_MEDIA_SRC = ["'self'", "https://res.cloudinary.com"]
 
+# Route bazlı CSP profilleri - varsayılan direktiflerin üzerine yazılır
+# (core.security_headers). 'nonce': True ile script-src'ye istek başına nonce eklenir.
+CSP_PROFILES = {
+    'dashboard': {
+        'img-src': ["'self'", "data:", "blob:", "https:", "https://res.cloudinary.com"],
+        'frame-src': ["'self'", "https://www.youtube.com", "https://www.google.com"],
+    },
+    'catalog': {
+        # PDF.js worker'ı ve PDF dosyasının Cloudinary'den okunması
+        'connect-src': ["'self'", "https://api.cloudinary.com", "https://res.cloudinary.com"],
+        'worker-src': ["'self'", "blob:", "https://cdnjs.cloudflare.com", "https://cdn.jsdelivr.net"],
+    },
+}
+# URL namespace veya url_name -> CSP profili
+CSP_ROUTE_PROFILES = {
+    'dashboard': 'dashboard',
+    'catalog_view': 'catalog',
+}
+
 
 # Güvenli dosya yükleme
 FILE_UPLOAD_PERMISSIONS = 0o644
@@ -410,7 +601,14 @@ ERROR_PAGE_SETTINGS = {
 
 # 404 Error tracking
 TRACK_404_ERRORS = True
-MAX_404_LOGS_PER_IP = 10  # IP başına maksimum 404 log sayısı
+MAX_404_LOGS_PER_IP = 10  # IP başına saatte maksimum 404 log sayısı
+
+# 404 analitik deposu (core.notfound) - cache ring buffer + günlük sayaç tablosu
+NOT_FOUND_STORE = {
+    'RING_SIZE': 10000,  # Sıkıştırılmadan tutulabilecek olay sayısı
+    'EVENT_TIMEOUT': 60 * 60 * 24 * 7,
+    'TOP_REFERRERS': 10,  # Satır başına referrer sketch kapasitesi (sayılar tahmini)
+}
 
 # Broken link monitoring
 BROKEN_LINK_MONITORING = {
@@ -34,23 +34,23 @@ CSRF_TRUSTED_ORIGINS = config('CSRF_TRUSTED_ORIGINS',
 
 # Security middleware - production için SecurityMonitoringMiddleware ekle
 MIDDLEWARE = [
-    'django.middleware.cache.UpdateCacheMiddleware',
-    'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ServerTimingMiddleware',         # SERVER_TIMING['ENABLED'] ile açılır
+    'django.middleware.security.SecurityMiddleware',  # SSL yönlendirme + HSTS - edge yanıtları dahil
+    'core.middleware.EdgeMiddleware',                 # Statik/robots/yönlendirme hızlı yolu
+    'core.middleware.IPAddressMiddleware',            # İstemci IP'si bir kez çözülür
     'core.middleware.SecurityHeadersMiddleware',
     'core.middleware.SecurityMonitoringMiddleware',  # Production'da aktif
     'core.middleware.LoginSecurityMiddleware',       # Production'da aktif
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.EdgeSessionMiddleware',          # Sessionless route'larda session açılmaz
     'django.middleware.locale.LocaleMiddleware',
     'core.middleware.SEOCanonicalMiddleware',
     'core.middleware.URLRedirectMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.EdgeAuthenticationMiddleware',   # Sessionless route'larda anonim kullanıcı
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'django.middleware.cache.FetchFromCacheMiddleware',
+    'core.middleware.PageCacheMiddleware',            # Anonim tam sayfa cache'i (core.pagecache)
     'django_ratelimit.middleware.RatelimitMiddleware',
-    'core.middleware.IPAddressMiddleware',
     'core.middleware.SitePrimaryLanguageMiddleware',
     'core.middleware.DashboardLocaleMiddleware',
 ]
@@ -104,6 +104,10 @@ LOGGING = {
             'format': 'SECURITY {asctime} [{levelname}] {message}',
             'style': '{',
         },
+        'timing': {
+            'format': '{asctime} {message}',
+            'style': '{',
+        },
     },
     'handlers': {
         'file': {
@@ -122,6 +126,14 @@ LOGGING = {
             'backupCount': 10,
             'formatter': 'security',
         },
+        'timing_file': {
+            'level': 'INFO',
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': '/var/log/django/timing.log',
+            'maxBytes': 50 * 1024 * 1024,  # 50MB
+            'backupCount': 3,
+            'formatter': 'timing',
+        },
         'mail_admins': {
             'level': 'ERROR',
             'class': 'django.utils.log.AdminEmailHandler',
@@ -144,6 +156,11 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'core.timing': {
+            'handlers': ['timing_file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
@@ -169,6 +186,7 @@ SECURITY_MONITORING = {
     'BLOCK_SUSPICIOUS_IPS': True,
     'MAX_LOGIN_ATTEMPTS': 3,  # Production'da daha sıkı
     'LOGIN_ATTEMPT_TIMEOUT': 600,  # 10 dakika
+    'RATE_LIMIT': '100/m',
 }
 
 # Rate limiting - production için sıkı
@@ -5,7 +5,6 @@ from django.conf import settings
 from django.contrib.auth.models import User
 import logging
 
-from django.core.cache import cache
 from cloudinary.models import CloudinaryField
 # Model imports
 from about.models import About, Service, TeamMember
@@ -181,7 +180,9 @@ def clear_storage_cache_on_media_change(sender, **kwargs):
     if hasattr(sender, '_meta'):
         for field in sender._meta.fields:
             if isinstance(field, CloudinaryField):
-                cache.delete('cloudinary_storage_info')
+                from core.context_processors import STORAGE_TAG
+                from core import cachetags
+                cachetags.invalidate(STORAGE_TAG)
                 break
             
             
@@ -0,0 +1,182 @@
+# core/singletons.py
+"""
+Tekil satırlar için iki katmanlı cache (SiteSettings, About, admin çeviri ayarları)
+
+    1. Worker içi kopya: değer süreç belleğinde tutulur, okuma bir dict/attribute
+       erişimidir (unpickle yok, cache round trip yok).
+    2. Paylaşılan cache: kopyası olmayan worker'lar değeri veritabanı yerine
+       buradan alır.
+
+Geçerlilik core.cachetags etiket sürümleriyle kontrol edilir: kayıtlı tüm
+singleton'ların etiketleri istek başına EN FAZLA BİR KEZ tek get_many ile
+okunur. Model kaydedilip silindiğinde etiket sürümü commit sonrası yenilenir;
+bu worker hemen, diğer worker'lar bir sonraki isteklerinde yeni değeri yükler.
+
+Dönen nesneler worker genelinde paylaşılır - DEĞİŞTİRİLMEMELİ. Kaydetmek için
+veritabanından taze nesne alınmalıdır (örn. SiteSettings.get_current(cached=False)).
+"""
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.dispatch import receiver
+
+from . import cachetags, stampede
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'TIMEOUT': 60 * 15,  # Paylaşılan cache + worker kopyası azami ömrü
+    'CHECK_INTERVAL': 5,  # İstek dışı kullanımda (komutlar) sürüm kontrol aralığı (sn)
+}
+
+_MISSING = object()
+
+
+def get_singleton_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'SINGLETON_CACHE', {}))
+    return config
+
+
+class _VersionState:
+    """Kayıtlı singleton etiketlerinin bu istekte okunan sürümleri"""
+
+    def __init__(self):
+        self.request_generation = 0
+        self.checked_generation = -1
+        self.checked_at = 0.0
+        self.versions = {}
+        self.tags = set()
+
+    def current(self):
+        now = time.monotonic()
+        if (self.checked_generation == self.request_generation
+                and now - self.checked_at < get_singleton_settings()['CHECK_INTERVAL']):
+            return self.versions
+        generation = self.request_generation
+        self.versions = cachetags.get_versions(sorted(self.tags))
+        self.checked_generation = generation
+        self.checked_at = now
+        return self.versions
+
+    def reset(self):
+        self.checked_generation = -1
+
+
+_state = _VersionState()
+
+
+class CachedSingleton:
+    """
+    Tek satırlık sorgu sonucu için iki katmanlı cache
+
+        site_settings = CachedSingleton('site_settings', [SiteSettings], loader)
+        site_settings.get()
+    """
+
+    def __init__(self, name, dependencies, loader):
+        self.name = name
+        self.tags = tuple(sorted(set(cachetags.to_tags(dependencies))))
+        self.loader = loader
+        self._lock = threading.Lock()
+        self._value = _MISSING
+        self._token = None
+        self._loaded_at = 0.0
+        _state.tags.update(self.tags)
+
+    def _shared_key(self, token):
+        digest = hashlib.md5('|'.join(token).encode('utf-8')).hexdigest()[:16]
+        return f'singleton:{self.name}:{digest}'
+
+    def get(self):
+        versions = _state.current()
+        token = tuple(versions[tag] for tag in self.tags)
+        timeout = get_singleton_settings()['TIMEOUT']
+
+        value = self._value
+        if value is not _MISSING and self._token == token and time.monotonic() - self._loaded_at < timeout:
+            return value
+
+        with self._lock:
+            if self._value is not _MISSING and self._token == token and time.monotonic() - self._loaded_at < timeout:
+                return self._value
+
+            # Sürüm değişince veritabanından tek worker yükler (core.stampede)
+            value = stampede.get_or_compute(
+                self._shared_key(token), self.loader, timeout,
+                name=f'singleton:{self.name}', cache=cachetags.get_cache(),
+            )
+
+            self._value = value
+            self._token = token
+            self._loaded_at = time.monotonic()
+            return value
+
+    def clear(self):
+        """Worker kopyasını at (paylaşılan cache etiket sürümleriyle yönetilir)"""
+        self._value = _MISSING
+
+
+@receiver(request_started, dispatch_uid='singletons_request_started')
+def _new_request(**kwargs):
+    # Sürümler bu istekte ilk erişimde bir kez kontrol edilir
+    _state.request_generation += 1
+
+
+@receiver(cachetags.tags_invalidated, dispatch_uid='singletons_tags_invalidated')
+def _tags_invalidated(sender, tags, **kwargs):
+    # Aynı worker'da kaydeden istek yeni değeri hemen görsün
+    if _state.tags.intersection(tags):
+        _state.reset()
+
+
+# ========================
+# Site singleton'ları
+# ========================
+
+def _load_site_settings():
+    from .models import SiteSettings
+    try:
+        return SiteSettings.objects.get()
+    except SiteSettings.DoesNotExist:
+        return SiteSettings.objects.create()
+
+
+def _load_about():
+    from about.models import About
+    return About.objects.order_by('pk').first()
+
+
+def _load_admin_translation_settings():
+    from dashboard.models import DashboardTranslationSettings
+    return (
+        DashboardTranslationSettings.objects.filter(user__is_staff=True)
+        .order_by('-updated_at').first()
+    )
+
+
+site_settings = CachedSingleton('site_settings', ['core.sitesettings'], _load_site_settings)
+about = CachedSingleton('about', ['about.about'], _load_about)
+admin_translation_settings = CachedSingleton(
+    'admin_translation_settings', ['dashboard.dashboardtranslationsettings'],
+    _load_admin_translation_settings,
+)
+
+
+def get_site_settings():
+    """SiteSettings (yoksa oluşturulur) - paylaşılan nesne, değiştirmeyin"""
+    return site_settings.get()
+
+
+def get_about():
+    """İlk About kaydı veya None - paylaşılan nesne, değiştirmeyin"""
+    return about.get()
+
+
+def get_admin_translation_settings():
+    """Staff kullanıcının en son güncellenen çeviri ayarları veya None"""
+    return admin_translation_settings.get()
@@ -0,0 +1,503 @@
+# core/sitemapfiles.py
+"""
+Bölüm ve dil bazında önceden yazılmış sitemap dosyaları
+
+Sitemap istek sırasında ORM'den üretilmez; core.sitemaps sınıfları diskteki
+dosyalara yazılır, view'lar sadece dosyayı okur:
+
+    /sitemap.xml                      -> sitemap index (ROOT/sitemap.xml)
+    /sitemaps/products-tr-1.xml.gz    -> bölüm dosyası (gzip)
+
+    - Her bölüm (products, categories, ...) her aktif dil için ayrı dosyaya
+      yazılır; her URL diğer dillerdeki karşılıklarını hreflang alternate
+      olarak taşır (+ x-default)
+    - Dosya MAX_URLS / MAX_BYTES sınırını aşarsa yeni parçaya geçilir
+      (products-tr-2.xml.gz ...) - 50k URL sınırı sorun olmaz
+    - lastmod değerleri veriden gelir; index'teki lastmod dosyadaki en yeni kayıt
+    - İçerik değişince (tags_invalidated) sadece etkilenen bölüm arka planda
+      yeniden yazılır; başka worker'daki değişiklik manifest'teki etiket
+      sürümüyle karşılaştırılarak yakalanır
+    - Dosyalar geçici isimle yazılıp os.replace ile değiştirilir - okuyan
+      istek yarım dosya görmez
+
+Elle oluşturma: `python manage.py build_sitemaps`
+"""
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime
+from xml.sax.saxutils import quoteattr, escape
+
+from django.conf import settings
+from django.core.cache.backends.dummy import DummyCache
+from django.db import connections
+from django.db.models import QuerySet
+from django.dispatch import receiver
+from django.urls import NoReverseMatch
+from django.utils import timezone, translation
+
+from . import cachetags
+from .sitemaps import (
+    STATIC_PAGE_MODELS, StaticViewSitemap, ProductSitemap, CategorySitemap,
+    GallerySitemap, ServiceSitemap, TeamSitemap, CarouselSitemap,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+INDEX_NAME = 'sitemap.xml'
+FILE_NAME = '{section}-{language}-{number}.xml.gz'
+LOCK_KEY = 'sitemapfiles:lock'
+
+# Aktif dil listesi değişirse tüm bölümler yeniden yazılır
+LANGUAGE_DEPENDENCIES = ['dashboard.dashboardtranslationsettings']
+
+DEFAULTS = {
+    'ROOT': None,  # Varsayılan: BASE_DIR/var/sitemaps
+    'BASE_URL': '',  # https://ornek.com - production'da zorunlu (core.E001); DEBUG'da boşsa isteğin host'u
+    'URL_PREFIX': 'sitemaps/',
+    'MAX_URLS': 50000,  # Dosya başına URL (Google sınırı)
+    'MAX_BYTES': 50 * 1024 * 1024,  # Dosya başına sıkıştırılmamış boyut (Google sınırı)
+    'REBUILD_ON_CHANGE': True,
+    'LOCK_TIMEOUT': 60 * 5,
+    'ITERATOR_CHUNK_SIZE': 2000,
+}
+
+# Bölüm adı -> (Sitemap sınıfı, bağımlılıklar)
+SECTIONS = {
+    'static': (StaticViewSitemap, sorted({label for labels in STATIC_PAGE_MODELS.values() for label in labels})),
+    'products': (ProductSitemap, ['products.product']),
+    'categories': (CategorySitemap, ['products.category', 'products.product']),
+    'gallery': (GallerySitemap, ['gallery.gallery']),
+    'services': (ServiceSitemap, ['about.service']),
+    'team': (TeamSitemap, ['about.teammember']),
+    'carousel': (CarouselSitemap, ['home.carouselslide']),
+}
+
+URLSET_OPEN = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+    'xmlns:xhtml="http://www.w3.org/1999/xhtml">\n'
+).encode('utf-8')
+URLSET_CLOSE = b'</urlset>\n'
+
+
+def get_sitemap_files_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'SITEMAP_FILES', {}))
+    if not config['ROOT']:
+        config['ROOT'] = os.path.join(settings.BASE_DIR, 'var', 'sitemaps')
+    config['ROOT'] = str(config['ROOT'])
+    config['BASE_URL'] = (config['BASE_URL'] or '').rstrip('/')
+    return config
+
+
+def section_dependencies(name):
+    return list(SECTIONS[name][1]) + LANGUAGE_DEPENDENCIES
+
+
+def affected_sections(tags):
+    """Değişen etiketlere bağlı bölümler"""
+    tags = set(tags)
+    return [name for name in SECTIONS if tags.intersection(cachetags.to_tags(section_dependencies(name)))]
+
+
+def get_languages():
+    """Sitemap dilleri - site aktif dilleri (settings.LANGUAGES sırasıyla)"""
+    from .context_processors import get_site_enabled_languages
+
+    enabled = set(get_site_enabled_languages())
+    return [code for code, _ in settings.LANGUAGES if code in enabled] or [settings.LANGUAGE_CODE]
+
+
+# ========================
+# Manifest
+# ========================
+
+def read_manifest(config=None):
+    config = config or get_sitemap_files_settings()
+    try:
+        with open(os.path.join(config['ROOT'], MANIFEST_NAME), encoding='utf-8') as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.error(f"Sitemap manifest okunamadı: {e}")
+        return None
+
+
+def _write_atomic(path, data):
+    temp_path = f'{path}.tmp-{os.getpid()}-{threading.get_ident()}'
+    with open(temp_path, 'wb') as handle:
+        handle.write(data)
+    os.replace(temp_path, path)
+
+
+def _format_lastmod(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        return value.replace(microsecond=0).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _write_index(manifest, config):
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+    prefix = f"{manifest['base_url']}/{config['URL_PREFIX']}"
+    for name in SECTIONS:
+        for entry in manifest['sections'].get(name, {}).get('files', []):
+            lines.append('<sitemap>')
+            lines.append(f"<loc>{escape(prefix + entry['name'])}</loc>")
+            if entry.get('lastmod'):
+                lines.append(f"<lastmod>{entry['lastmod']}</lastmod>")
+            lines.append('</sitemap>')
+    lines.append('</sitemapindex>')
+    _write_atomic(os.path.join(config['ROOT'], INDEX_NAME), ('\n'.join(lines) + '\n').encode('utf-8'))
+
+
+def _write_manifest(manifest, config):
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+    _write_atomic(os.path.join(config['ROOT'], MANIFEST_NAME), data)
+
+
+# ========================
+# Yazma
+# ========================
+
+class _ChunkWriter:
+    """Bir bölümün bir dildeki dosyaları - sınır aşılınca yeni parçaya geçer"""
+
+    def __init__(self, root, section, language, config):
+        self.root = root
+        self.section = section
+        self.language = language
+        self.max_urls = config['MAX_URLS']
+        self.max_bytes = config['MAX_BYTES'] - len(URLSET_CLOSE)
+        self.files = []
+        self._handle = None
+
+    def _open(self):
+        number = len(self.files) + 1
+        name = FILE_NAME.format(section=self.section, language=self.language, number=number)
+        path = os.path.join(self.root, name)
+        self._temp_path = f'{path}.tmp-{os.getpid()}-{threading.get_ident()}'
+        self._path = path
+        # mtime=0: aynı içerik aynı dosyayı üretir
+        self._handle = gzip.GzipFile(filename=self._temp_path, mode='wb', compresslevel=6, mtime=0)
+        self._handle.write(URLSET_OPEN)
+        self._urls = 0
+        self._bytes = len(URLSET_OPEN)
+        self._lastmod = None
+        self.files.append({'name': name})
+
+    def _close(self):
+        self._handle.write(URLSET_CLOSE)
+        self._handle.close()
+        os.replace(self._temp_path, self._path)
+        self.files[-1].update({
+            'urls': self._urls,
+            'lastmod': _format_lastmod(self._lastmod),
+        })
+        self._handle = None
+
+    def write(self, data, lastmod):
+        if self._handle is not None and (
+                self._urls >= self.max_urls or self._bytes + len(data) > self.max_bytes):
+            self._close()
+        if self._handle is None:
+            self._open()
+        self._handle.write(data)
+        self._urls += 1
+        self._bytes += len(data)
+        if lastmod is not None and (self._lastmod is None or lastmod > self._lastmod):
+            self._lastmod = lastmod
+
+    def finish(self):
+        if self._handle is not None:
+            self._close()
+        return self.files
+
+    def abort(self):
+        if self._handle is not None:
+            self._handle.close()
+            try:
+                os.remove(self._temp_path)
+            except OSError:
+                pass
+            self._handle = None
+
+
+def _value(sitemap, attribute, item):
+    value = getattr(sitemap, attribute, None)
+    return value(item) if callable(value) else value
+
+
+def _iter_items(sitemap, config):
+    items = sitemap.items()
+    if isinstance(items, QuerySet):
+        return items.iterator(chunk_size=config['ITERATOR_CHUNK_SIZE'])
+    return items
+
+
+def _url_entry(location, lastmod, changefreq, priority, alternates):
+    parts = [f'<url><loc>{escape(location)}</loc>']
+    if lastmod:
+        parts.append(f'<lastmod>{lastmod}</lastmod>')
+    if changefreq:
+        parts.append(f'<changefreq>{changefreq}</changefreq>')
+    if priority is not None:
+        parts.append(f'<priority>{float(priority):.1f}</priority>')
+    for hreflang, href in alternates:
+        parts.append(f'<xhtml:link rel="alternate" hreflang={quoteattr(hreflang)} href={quoteattr(href)}/>')
+    parts.append('</url>\n')
+    return ''.join(parts).encode('utf-8')
+
+
+def build_section(name, base_url, languages, config=None):
+    """
+    Bölümü tüm diller için yaz
+
+    Returns:
+        list: [{'name', 'urls', 'lastmod'}] - URL'i olmayan dil için dosya yazılmaz
+    """
+    config = config or get_sitemap_files_settings()
+    sitemap = SECTIONS[name][0]()
+    default_language = settings.LANGUAGE_CODE if settings.LANGUAGE_CODE in languages else languages[0]
+    writers = {language: _ChunkWriter(config['ROOT'], name, language, config) for language in languages}
+    skipped = 0
+
+    try:
+        for item in _iter_items(sitemap, config):
+            # Slug'lar çevrilmiyor; dil öneki i18n_patterns'tan gelir
+            try:
+                locations = {}
+                for language in languages:
+                    with translation.override(language):
+                        locations[language] = base_url + _value(sitemap, 'location', item)
+            except NoReverseMatch:
+                skipped += 1
+                continue
+
+            lastmod = _value(sitemap, 'lastmod', item)
+            formatted = _format_lastmod(lastmod)
+            changefreq = _value(sitemap, 'changefreq', item)
+            priority = _value(sitemap, 'priority', item)
+            alternates = [(language, locations[language]) for language in languages]
+            alternates.append(('x-default', locations[default_language]))
+            for language, writer in writers.items():
+                writer.write(_url_entry(locations[language], formatted, changefreq, priority, alternates), lastmod)
+    except Exception:
+        for writer in writers.values():
+            writer.abort()
+        raise
+
+    if skipped:
+        logger.warning(f"Sitemap bölümü '{name}': {skipped} kaydın URL'i oluşturulamadı, atlandı")
+
+    files = []
+    for writer in writers.values():
+        files.extend(writer.finish())
+    return files
+
+
+def _remove_unlisted(manifest, config):
+    """Manifest'te olmayan eski parça dosyalarını sil (dil kaldırıldı, parça azaldı)"""
+    listed = {entry['name'] for section in manifest['sections'].values() for entry in section['files']}
+    for filename in os.listdir(config['ROOT']):
+        if filename.endswith('.xml.gz') and filename not in listed:
+            try:
+                os.remove(os.path.join(config['ROOT'], filename))
+            except OSError as e:
+                logger.error(f"Eski sitemap dosyası silinemedi ({filename}): {e}")
+
+
+_build_lock = threading.Lock()
+
+
+def _acquire_lock(config, wait):
+    cache = cachetags.get_cache()
+    deadline = time.monotonic() + (config['LOCK_TIMEOUT'] if wait else 0)
+    while True:
+        if cache.add(LOCK_KEY, 1, config['LOCK_TIMEOUT']):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.5)
+
+
+def rebuild(names=None, base_url=None, wait=True):
+    """
+    Bölümleri yeniden yaz, manifest ve index'i güncelle
+
+    Args:
+        names: Bölüm adları (None: hepsi)
+        base_url: Site kök adresi (None: BASE_URL ayarı, yoksa manifest'teki)
+        wait: Başka işlem yazıyorsa bitmesini bekle
+
+    Returns:
+        dict: Güncel manifest (kilit alınamadı / kök adres yoksa None)
+    """
+    config = get_sitemap_files_settings()
+    with _build_lock:
+        if not _acquire_lock(config, wait):
+            logger.info('Sitemap başka bir işlemde yazılıyor, atlandı')
+            return None
+        try:
+            manifest = read_manifest(config)
+            base_url = (base_url or config['BASE_URL'] or (manifest or {}).get('base_url') or '').rstrip('/')
+            if not base_url:
+                logger.error('Sitemap kök adresi bilinmiyor (SITEMAP_FILES BASE_URL)')
+                return None
+
+            if manifest is None or manifest.get('base_url') != base_url:
+                manifest = {'base_url': base_url, 'sections': {}}
+                names = list(SECTIONS)
+            names = list(names or SECTIONS)
+
+            os.makedirs(config['ROOT'], exist_ok=True)
+            languages = get_languages()
+            for name in names:
+                started = time.perf_counter()
+                # Sürüm yazmadan ÖNCE okunur - yazarken gelen değişiklik bölümü tekrar eskitir
+                version = cachetags.version_digest(section_dependencies(name))
+                files = build_section(name, base_url, languages, config)
+                manifest['sections'][name] = {
+                    'version': version,
+                    'languages': languages,
+                    'files': files,
+                    'built_at': timezone.now().isoformat(),
+                    'build_ms': round((time.perf_counter() - started) * 1000),
+                }
+
+            # Artık tanımlı olmayan bölümler
+            for name in list(manifest['sections']):
+                if name not in SECTIONS:
+                    del manifest['sections'][name]
+
+            _write_manifest(manifest, config)
+            _write_index(manifest, config)
+            _remove_unlisted(manifest, config)
+            return manifest
+        finally:
+            cachetags.get_cache().delete(LOCK_KEY)
+
+
+# ========================
+# Arka plan yeniden yazma
+# ========================
+
+_rebuild_lock = threading.Lock()
+_rebuild_pending = set()
+_pending_lock = threading.Lock()
+
+
+def _rebuild_worker():
+    try:
+        while True:
+            with _pending_lock:
+                names = [name for name in SECTIONS if name in _rebuild_pending]
+                _rebuild_pending.clear()
+            if not names:
+                break
+            rebuild(names)
+    except Exception as e:
+        logger.error(f"Sitemap yeniden yazma hatası: {e}")
+    finally:
+        connections.close_all()
+        _rebuild_lock.release()
+    with _pending_lock:
+        again = bool(_rebuild_pending)
+    if again:
+        schedule_rebuild()  # Son turdan sonra gelen değişiklik
+
+
+def schedule_rebuild(names=()):
+    """Bölümleri arka planda yeniden yaz - sürüyorsa bittiğinde bir kez daha çalışır"""
+    with _pending_lock:
+        _rebuild_pending.update(names)
+    if not _rebuild_lock.acquire(blocking=False):
+        return False
+    threading.Thread(target=_rebuild_worker, name='sitemap-rebuild', daemon=True).start()
+    return True
+
+
+def stale_sections(manifest):
+    """Manifest'teki sürümü güncel etiket sürümünden farklı bölümler"""
+    if isinstance(cachetags.get_cache(), DummyCache):
+        return []  # Sürümler saklanmıyor - sadece sinyal/komut ile yenilenir
+    return [
+        name for name in SECTIONS
+        if manifest['sections'].get(name, {}).get('version') != cachetags.version_digest(section_dependencies(name))
+    ]
+
+
+@receiver(cachetags.tags_invalidated, dispatch_uid='sitemap_files_tags_invalidated')
+def _content_changed(sender, tags, **kwargs):
+    config = get_sitemap_files_settings()
+    if not config['REBUILD_ON_CHANGE']:
+        return
+    if not os.path.exists(os.path.join(config['ROOT'], MANIFEST_NAME)):
+        return  # Henüz oluşturulmadı - ilk istek/komut oluşturur
+    names = affected_sections(tags)
+    if names:
+        schedule_rebuild(names)
+
+
+# ========================
+# Sunma
+# ========================
+
+def get_manifest(request):
+    """
+    Sunulacak manifest - yoksa (ilk istek) BASE_URL ile oluşturulur, eski
+    bölümler arka planda yenilenir
+
+    İsteğin Host başlığı sadece DEBUG'da ve BASE_URL boşken kullanılır;
+    production'da istemcinin gönderdiği host manifest'e yazılmaz.
+
+    Returns:
+        dict veya None (başka işlem ilk oluşturmayı yapıyor / kök adres yok)
+    """
+    config = get_sitemap_files_settings()
+    manifest = read_manifest(config)
+
+    base_url = config['BASE_URL']
+    if not base_url and settings.DEBUG:
+        base_url = f"{'https' if request.is_secure() else 'http'}://{request.get_host()}"
+    if not base_url:
+        logger.error('Sitemap kök adresi bilinmiyor (SITEMAP_FILES BASE_URL)')
+        return None
+
+    if manifest is None or manifest.get('base_url') != base_url:
+        return rebuild(base_url=base_url, wait=False)
+
+    if config['REBUILD_ON_CHANGE']:
+        stale = stale_sections(manifest)
+        if stale:
+            schedule_rebuild(stale)
+    return manifest
+
+
+def index_path(config=None):
+    config = config or get_sitemap_files_settings()
+    return os.path.join(config['ROOT'], INDEX_NAME)
+
+
+def file_path(manifest, filename, config=None):
+    """Manifest'te listelenen bölüm dosyasının yolu (yoksa None)"""
+    config = config or get_sitemap_files_settings()
+    for section in manifest['sections'].values():
+        for entry in section['files']:
+            if entry['name'] == filename:
+                return os.path.join(config['ROOT'], filename)
+    return None
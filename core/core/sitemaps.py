@@ -2,11 +2,28 @@
 
 from django.contrib.sitemaps import Sitemap
 from django.urls import reverse
-from django.utils import timezone
-from datetime import timedelta
-from django.core.cache import cache
 from django.db import models
 
+from . import conditional
+
+# Sitemap cache'inin bağlı olduğu modeller (core.cachetags)
+SITEMAP_DEPENDENCIES = [
+    'products.product', 'products.category', 'gallery.gallery',
+    'about.service', 'about.teammember', 'home.carouselslide',
+]
+
+# Statik sayfalar -> sayfada gösterilen içerik (lastmod bunlardan türetilir)
+STATIC_PAGE_MODELS = {
+    'home:home': [
+        'home.carouselslide', 'about.about', 'about.service', 'products.product',
+        'gallery.gallery', 'reviews.review', 'dashboard.mediamention',
+    ],
+    'products:product_list': ['products.product', 'products.category'],
+    'gallery:gallery_list': ['gallery.gallery'],
+    'about:about': ['about.about', 'about.service', 'about.teammember'],
+    'contact:contact': ['core.sitesettings'],
+}
+
 class StaticViewSitemap(Sitemap):
     """
     Statik sayfalar için gelişmiş sitemap
@@ -16,28 +33,16 @@ class StaticViewSitemap(Sitemap):
     protocol = 'https'
 
     def items(self):
-        return [
-            'home:home',
-            'products:product_list',
-            'gallery:gallery_list',
-            'about:about',
-            'contact:contact',
-        ]
+        return list(STATIC_PAGE_MODELS)
 
     def location(self, item):
         return reverse(item)
     
     def lastmod(self, item):
-        # Cache'den last modified zamanını al
-        cache_key = f'static_lastmod_{item}'
-        lastmod = cache.get(cache_key)
-        
-        if lastmod is None:
-            # Varsayılan olarak son 7 gün içinde güncelle
-            lastmod = timezone.now() - timedelta(days=7)
-            cache.set(cache_key, lastmod, 86400)  # 24 saat cache
-        
-        return lastmod
+        # Sayfada gösterilen içeriğin en son güncellenme zamanı (core.conditional)
+        timestamps = [conditional.get_last_modified(label) for label in STATIC_PAGE_MODELS[item]]
+        timestamps = [value for value in timestamps if value is not None]
+        return max(timestamps) if timestamps else None
 
     def priority_map(self, item):
         priorities = {
@@ -0,0 +1,216 @@
+# core/stampede.py
+"""
+Cache stampede koruması: get_or_compute
+
+Pahalı bir değerin süresi dolduğunda tüm worker'ların aynı anda yeniden
+hesaplamasını önler:
+
+    value = stampede.get_or_compute('internal_link_keywords:tr', build, 3600)
+
+    - Tek uçuş: yeniden hesaplamayı cache.add kilidini alan tek worker yapar;
+      diğerleri eski değeri alır, eski değer yoksa kısa süre bekler
+    - XFetch: değer, süresi dolmadan önce hesaplama süresiyle orantılı bir
+      olasılıkla erken yenilenir - yoğun anahtarlar hiç "soğumaz"
+    - TTL'ler jitter ile dağıtılır - aynı anda yazılan anahtarlar aynı anda düşmez
+    - Süresi dolan kayıt STALE_GRACE boyunca cache'te kalır; kilidi alamayan
+      worker'lar bu sürede eski değeri sunar
+    - Yeniden hesaplama süreleri isim bazında metrik kaydına yazılır
+      (compute_cache_stats komutu)
+
+Kayıt (değer, hesaplama süresi, mantıksal bitiş) olarak saklanır; None da
+geçerli bir değerdir.
+"""
+import logging
+import math
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+ENTRY_KEY = 'compute:{key}'  # Ham cache.set değerleriyle karışmasın
+LOCK_KEY = 'compute:lock:{key}'
+METRICS_KEY = 'compute:metrics:{name}'
+METRICS_NAMES_KEY = 'compute:metrics:names'
+
+DEFAULTS = {
+    'CACHE_ALIAS': 'default',
+    'BETA': 1.0,  # XFetch katsayısı - büyüdükçe daha erken yenilenir (0: kapalı)
+    'JITTER': 0.1,  # TTL ±%10 dağıtılır
+    'STALE_GRACE': 60 * 5,  # Süresi dolan değer bu kadar daha sunulabilir
+    'LOCK_TIMEOUT': 30,  # Kilit, hesaplama bu süreyi aşarsa kendiliğinden düşer
+    'WAIT_TIMEOUT': 2.0,  # Eski değer yoksa kilit sahibini bekleme süresi (sn)
+    'POLL_INTERVAL': 0.05,
+    'METRICS': True,
+}
+
+
+def get_stampede_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'CACHE_STAMPEDE', {}))
+    return config
+
+
+def get_cache():
+    return caches[get_stampede_settings()['CACHE_ALIAS']]
+
+
+class uncached:
+    """compute() bu sarmalayıcıyı döndürürse değer kullanılır ama saklanmaz"""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+# ========================
+# Metrikler
+# ========================
+
+def _record(name, compute_ms, reason):
+    cache = get_cache()
+    key = METRICS_KEY.format(name=name)
+    try:
+        metrics = cache.get(key)
+        if metrics is None:
+            metrics = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0, 'reasons': {}}
+            names = cache.get(METRICS_NAMES_KEY) or set()
+            if name not in names:
+                cache.set(METRICS_NAMES_KEY, names | {name}, None)
+        metrics['count'] += 1
+        metrics['total_ms'] += compute_ms
+        metrics['max_ms'] = max(metrics['max_ms'], compute_ms)
+        metrics['last_ms'] = compute_ms
+        metrics['reasons'][reason] = metrics['reasons'].get(reason, 0) + 1
+        cache.set(key, metrics, None)
+    except Exception as e:
+        logger.error(f"Compute metrikleri yazılamadı ({name}): {e}")
+
+
+def get_metrics():
+    """İsim -> {'count', 'total_ms', 'max_ms', 'last_ms', 'reasons'}"""
+    cache = get_cache()
+    names = sorted(cache.get(METRICS_NAMES_KEY) or ())
+    values = cache.get_many([METRICS_KEY.format(name=name) for name in names])
+    return {
+        name: values[METRICS_KEY.format(name=name)]
+        for name in names if METRICS_KEY.format(name=name) in values
+    }
+
+
+def reset_metrics():
+    cache = get_cache()
+    names = cache.get(METRICS_NAMES_KEY) or ()
+    cache.delete_many([METRICS_KEY.format(name=name) for name in names] + [METRICS_NAMES_KEY])
+
+
+# ========================
+# get_or_compute
+# ========================
+
+def jittered(timeout, config=None):
+    config = config or get_stampede_settings()
+    if not timeout or not config['JITTER']:
+        return timeout
+    return max(1, int(timeout * random.uniform(1 - config['JITTER'], 1 + config['JITTER'])))
+
+
+def should_refresh(entry, config, now=None):
+    """XFetch: now - delta * beta * log(rand) >= expiry"""
+    _, delta, expires_at = entry
+    if expires_at is None:
+        return False
+    now = now or time.time()
+    if now >= expires_at:
+        return True
+    beta = config['BETA']
+    if not beta or not delta:
+        return False
+    return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+def _compute_and_store(cache, key, compute, timeout, config, name, reason, stale_key):
+    started = time.perf_counter()
+    value = compute()
+    delta = time.perf_counter() - started
+    if config['METRICS']:
+        _record(name, delta * 1000, reason)
+    if delta > 1:
+        logger.info(f"Yavaş yeniden hesaplama: {name} ({delta * 1000:.0f} ms, {reason})")
+
+    if isinstance(value, uncached):
+        return value.value
+
+    ttl = jittered(timeout, config)
+    expires_at = time.time() + ttl if ttl else None
+    entry = (value, delta, expires_at)
+    physical = ttl + config['STALE_GRACE'] if ttl else None
+    try:
+        entries = {key: entry}
+        if stale_key:
+            entries[stale_key] = entry
+        cache.set_many(entries, physical)
+    except Exception as e:
+        logger.error(f"Hesaplanan değer cache'e yazılamadı ({name}): {e}")
+    return value
+
+
+def get_or_compute(key, compute, timeout, name=None, stale_key=None, cache=None):
+    """
+    Cache'teki değeri döndür; yoksa/eskiyse tek worker'da compute() ile yenile
+
+    Args:
+        key: Cache anahtarı
+        compute: Argümansız fonksiyon - stampede.uncached(v) döndürürse v saklanmaz
+        timeout: Saniye (None: süresiz)
+        name: Metrik adı (varsayılan: key)
+        stale_key: Anahtar sürümlüyse (core.cachetags) sürümsüz yedek anahtar -
+            sürüm değiştikten sonra kilidi alamayan worker'lar buradaki son
+            değeri sunar
+        cache: Cache backend (varsayılan: CACHE_STAMPEDE['CACHE_ALIAS'])
+    """
+    config = get_stampede_settings()
+    cache = cache or get_cache()
+    name = name or key
+    lock_key = LOCK_KEY.format(key=key)
+    key = ENTRY_KEY.format(key=key)
+    if stale_key:
+        stale_key = ENTRY_KEY.format(key=stale_key)
+
+    entry = cache.get(key)
+    if entry is not None:
+        if not should_refresh(entry, config):
+            return entry[0]
+        # Süresi doldu ya da erken yenileme sırası geldi - kilidi alamayan eski değeri sunar
+        if not cache.add(lock_key, 1, config['LOCK_TIMEOUT']):
+            return entry[0]
+        reason = 'expired' if time.time() >= entry[2] else 'early'
+        try:
+            return _compute_and_store(cache, key, compute, timeout, config, name, reason, stale_key)
+        finally:
+            cache.delete(lock_key)
+
+    if cache.add(lock_key, 1, config['LOCK_TIMEOUT']):
+        try:
+            return _compute_and_store(cache, key, compute, timeout, config, name, 'miss', stale_key)
+        finally:
+            cache.delete(lock_key)
+
+    # Başka bir worker hesaplıyor
+    if stale_key:
+        stale = cache.get(stale_key)
+        if stale is not None:
+            return stale[0]
+
+    deadline = time.monotonic() + config['WAIT_TIMEOUT']
+    while time.monotonic() < deadline:
+        time.sleep(config['POLL_INTERVAL'])
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+        if cache.get(lock_key) is None:
+            break  # Kilit sahibi yazamadan bitti (hata) - kendimiz hesaplayalım
+
+    return _compute_and_store(cache, key, compute, timeout, config, name, 'wait_timeout', stale_key)
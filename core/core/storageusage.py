@@ -0,0 +1,216 @@
+# core/storageusage.py
+"""
+Cloudinary depolama kullanımı için stale-while-revalidate cache
+
+cloudinary.api.usage() harici bir HTTPS çağrısıdır; eskiden her 5 dakikada
+bir dashboard sayfası bu çağrıyı bekliyor, aynı anda açık birkaç sekme
+çağrıyı birlikte tetikliyordu. Artık:
+
+    - Son bilinen değer her zaman hemen döner (taze veya bayat)
+    - Değer FRESH_TIMEOUT'tan eskiyse ya da STORAGE_DEPENDENCIES sürümü
+      değiştiyse (medya yükleme/silme) yenileme arka plan thread'inde yapılır
+    - Yenileme tek uçuşludur: süreç içinde tek thread, süreçler arasında
+      cache.add kilidi - aynı anda tek API çağrısı
+    - Hiç değer yoksa (ilk istek / boş cache) çağrı senkron yapılır; kilidi
+      alamayan istekler beklemeden hata değerlerini görür
+    - Her çağrının süresi ve hataları metrik kaydına yazılır; hata olursa son
+      bilinen değer sunulmaya devam eder, RETRY_AFTER sonra tekrar denenir
+
+Zamanlanmış yenileme: `python manage.py refresh_storage_usage` (cron).
+Yerel test için USAGE_FUNCTION ayarı bir stub fonksiyona yönlendirilebilir.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from . import cachetags
+from .utils import build_storage_info, storage_error_info
+
+logger = logging.getLogger(__name__)
+
+# Storage kullanımı medya yüklemeleriyle değişir
+STORAGE_TAG = 'cloudinary.storage'
+STORAGE_DEPENDENCIES = [STORAGE_TAG]
+
+ENTRY_KEY = 'storage_usage:entry'
+METRICS_KEY = 'storage_usage:metrics'
+LOCK_KEY = 'storage_usage:lock'
+
+DEFAULTS = {
+    'USAGE_FUNCTION': 'cloudinary.api.usage',  # Test için stub'a yönlendirilebilir
+    'FRESH_TIMEOUT': 60 * 5,  # Bu süreden eski değer arka planda yenilenir
+    'STALE_TIMEOUT': 60 * 60 * 24,  # Bayat değer en fazla bu kadar sunulur
+    'LOCK_TIMEOUT': 30,  # Tek uçuş kilidi (API zaman aşımından uzun olmalı)
+    'RETRY_AFTER': 60,  # Hatalı çağrıdan sonra yeniden deneme aralığı
+    'BACKGROUND': True,  # False: bayat değer istek içinde yenilenir
+}
+
+_refreshing = threading.Lock()
+
+
+def get_storage_usage_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'STORAGE_USAGE', {}))
+    return config
+
+
+# ========================
+# API çağrısı + metrikler
+# ========================
+
+def _record(latency_ms, error=None):
+    cache = cachetags.get_cache()
+    metrics = cache.get(METRICS_KEY) or {
+        'fetch_count': 0,
+        'error_count': 0,
+        'last_latency_ms': None,
+        'last_success_at': None,
+        'last_error': None,
+        'last_error_at': None,
+    }
+    now = timezone.now()
+    metrics['fetch_count'] += 1
+    metrics['last_latency_ms'] = round(latency_ms, 1)
+    if error is None:
+        metrics['last_success_at'] = now
+    else:
+        metrics['error_count'] += 1
+        metrics['last_error'] = str(error)[:500]
+        metrics['last_error_at'] = now
+    cache.set(METRICS_KEY, metrics, None)
+
+
+def get_metrics():
+    """Son çağrı süresi, hata sayıları ve zamanları - hiç çağrı yoksa None"""
+    return cachetags.get_cache().get(METRICS_KEY)
+
+
+def fetch():
+    """
+    Kullanım API'sini çağır, sonucu sakla
+
+    Hata olursa son bilinen değer korunur.
+
+    Returns:
+        dict | None: Yeni depolama bilgisi - hata olursa None
+    """
+    config = get_storage_usage_settings()
+    # Sürüm çağrıdan ÖNCE okunur - çağrı sırasında gelen yükleme yeni bir yenilemeyi tetikler
+    version = cachetags.version_digest(STORAGE_DEPENDENCIES)
+    started = time.perf_counter()
+    try:
+        usage = import_string(config['USAGE_FUNCTION'])()
+        data = build_storage_info(usage)
+    except Exception as e:
+        latency_ms = (time.perf_counter() - started) * 1000
+        logger.error(f"Cloudinary storage check failed ({latency_ms:.0f} ms): {e}")
+        _record(latency_ms, error=e)
+        _store_failure(config, version)
+        return None
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    _record(latency_ms)
+    logger.info(f"Cloudinary storage kullanımı yenilendi ({latency_ms:.0f} ms)")
+
+    entry = {'data': data, 'version': version, 'fetched_at': time.time()}
+    cachetags.get_cache().set(ENTRY_KEY, entry, config['STALE_TIMEOUT'])
+    return data
+
+
+def _store_failure(config, version):
+    """Son bilinen değeri koru, RETRY_AFTER sonra yeniden denenecek şekilde işaretle"""
+    cache = cachetags.get_cache()
+    entry = cache.get(ENTRY_KEY)
+    data = entry['data'] if entry is not None else storage_error_info()
+    retry_at = time.time() - config['FRESH_TIMEOUT'] + config['RETRY_AFTER']
+    cache.set(ENTRY_KEY, {'data': data, 'version': version, 'fetched_at': retry_at}, config['STALE_TIMEOUT'])
+
+
+def _acquire_lock(config):
+    return cachetags.get_cache().add(LOCK_KEY, 1, config['LOCK_TIMEOUT'])
+
+
+def _release_lock():
+    cachetags.get_cache().delete(LOCK_KEY)
+
+
+def _refresh():
+    if not _refreshing.acquire(blocking=False):
+        return None
+    try:
+        if not _acquire_lock(get_storage_usage_settings()):
+            return None  # Başka bir süreç yeniliyor
+        try:
+            return fetch()
+        finally:
+            _release_lock()
+    finally:
+        _refreshing.release()
+
+
+def refresh_in_background():
+    """Yenilemeyi arka plan thread'inde başlat (zaten yenileniyorsa bir şey yapmaz)"""
+    if _refreshing.locked():
+        return False
+    thread = threading.Thread(target=_refresh, name='storage-usage-refresh', daemon=True)
+    thread.start()
+    return True
+
+
+def refresh():
+    """Senkron yenileme (komut / cron) - başka bir yenileme sürüyorsa None"""
+    return _refresh()
+
+
+# ========================
+# Okuma
+# ========================
+
+def is_fresh(entry, config):
+    if time.time() - entry['fetched_at'] >= config['FRESH_TIMEOUT']:
+        return False
+    return entry['version'] == cachetags.version_digest(STORAGE_DEPENDENCIES)
+
+
+def get_storage_usage():
+    """
+    Depolama bilgisini beklemeden döndür
+
+    Bayat değer 'stale': True ile işaretlenir; hiç değer yoksa ve yenileme
+    başka bir istekte sürüyorsa hata değerleri ('pending': True) döner.
+    """
+    config = get_storage_usage_settings()
+    try:
+        entry = cachetags.get_cache().get(ENTRY_KEY)
+    except Exception as e:
+        logger.error(f"Storage usage cache okunamadı: {e}")
+        entry = None
+
+    if entry is None:
+        data = _refresh()
+        if data is not None:
+            return data
+        entry = cachetags.get_cache().get(ENTRY_KEY)
+        if entry is None:
+            return {**storage_error_info(), 'pending': True}
+        return entry['data']
+
+    if is_fresh(entry, config):
+        return entry['data']
+
+    if config['BACKGROUND']:
+        refresh_in_background()
+    else:
+        data = _refresh()
+        if data is not None:
+            return data
+    return {**entry['data'], 'stale': True}
+
+
+def clear():
+    """Değeri bayat işaretle - sonraki okuma arka planda yeniler"""
+    cachetags.invalidate(STORAGE_TAG)
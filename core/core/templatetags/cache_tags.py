@@ -0,0 +1,23 @@
+# core/templatetags/cache_tags.py
+"""
+Template fragment cache'i için etiket sürümleri
+
+    {% load cache cache_tags %}
+    {% cache_version 'products.product' 'products.category' as products_version %}
+    {% cache 600 home_products LANGUAGE_CODE products_version %}
+        ...
+    {% endcache %}
+
+Bağımlı modeller değişince sürüm değişir ve fragment yeniden render edilir.
+"""
+from django import template
+
+from core import cachetags
+
+register = template.Library()
+
+
+@register.simple_tag
+def cache_version(*dependencies):
+    """Verilen model etiketlerinin ('app_label.modelname') sürüm özeti"""
+    return cachetags.version_digest(dependencies)
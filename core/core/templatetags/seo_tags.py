@@ -3,9 +3,10 @@
 # -*- coding: utf-8 -*-
 from django import template
 from django.utils.safestring import mark_safe
-from django.core.cache import cache
+from core import cachetags
 from django.db.models import Q, Count
 from django.urls import reverse
+from django.utils.translation import get_language
 import re
 import json
 
@@ -54,10 +55,7 @@ def smart_internal_links(content, max_links=5):
     try:
         from products.models import Product, Category
         
-        cache_key = 'internal_link_keywords'
-        keywords = cache.get(cache_key)
-        
-        if keywords is None:
+        def build_keywords():
             keywords = {}
             
             # Product keywords
@@ -70,7 +68,13 @@ def smart_internal_links(content, max_links=5):
             for category in categories:
                 keywords[category['name'].lower()] = reverse('products:category_detail', kwargs={'slug': category['slug']})
             
-            cache.set(cache_key, keywords, 3600)
+            return keywords
+        
+        # Ürün/kategori değişince anahtar yenilenir (core.cachetags)
+        keywords = cachetags.get_or_set(
+            'internal_link_keywords', [Product, Category], build_keywords, 3600,
+            parts=(get_language(),),  # URL'ler dil önekli
+        )
         
         # Link keywords in content
         linked_content = content
@@ -114,6 +118,18 @@ def seo_meta_robots(page_type="default"):
     
     return robots_map.get(page_type, 'index, follow')
 
+@register.simple_tag(takes_context=True)
+def primary_object(context):
+    """
+    Detay view'ının ana nesnesi - tekrar sorgulanmaz (core.identity)
+    Usage: {% primary_object as obj %}
+    """
+    request = context.get('request')
+    if request is None:
+        return None
+    from core.context_processors import get_detail_object
+    return get_detail_object(request)
+
 @register.simple_tag(takes_context=True)
 def canonical_url(context, custom_url=None):
     """Canonical URL"""
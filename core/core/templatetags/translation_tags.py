@@ -1,6 +1,6 @@
 from django import template
 from django.conf import settings
-from core.models import SiteSettings
+from core.singletons import get_admin_translation_settings, get_site_settings
 
 register = template.Library()
 
@@ -9,21 +9,13 @@ def get_available_site_languages(context):
     """Dashboard'da seçilen aktif dilleri getir"""
     request = context['request']
     
-    # Çeviri sistemi aktif mi?
-    try:
-        site_settings = SiteSettings.objects.get()
-        if not site_settings.translation_enabled:
-            return []
-    except SiteSettings.DoesNotExist:
+    # Çeviri sistemi aktif mi? (ayarlar worker içi kopyadan - core.singletons)
+    if not get_site_settings().translation_enabled:
         return []
     
     # Admin ayarlarından dilleri al
     try:
-        from dashboard.models import DashboardTranslationSettings
-        
-        admin_settings = DashboardTranslationSettings.objects.filter(
-            user__is_staff=True
-        ).order_by('-updated_at').first()
+        admin_settings = get_admin_translation_settings()
         
         if admin_settings:
             # Ana dil + ek diller
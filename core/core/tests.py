@@ -0,0 +1,190 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event, Lock
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core import querybudget, storageusage
+from core.ratelimit import SlidingWindowRateLimiter
+
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    'ratelimit': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ratelimit-tests',
+    },
+}
+
+WINDOW = 60
+WINDOW_START = WINDOW * 1000  # Pencere sınırı (unix zamanı)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class SlidingWindowRateLimiterConcurrencyTests(SimpleTestCase):
+    """Aynı kimliğe eşzamanlı istekler - izin verilen istek sayısı kesin olmalı"""
+
+    threads = 16
+    hits_per_thread = 10
+
+    def setUp(self):
+        caches['ratelimit'].clear()
+        self.limiter = SlidingWindowRateLimiter('rl:test', '50/m', cache_alias='ratelimit')
+
+    def hammer(self, now, identifier='1.2.3.4', threads=None, hits_per_thread=None):
+        """Tüm thread'ler aynı anda başlar; izin verilen hit sayısını döndürür"""
+        threads = threads or self.threads
+        hits_per_thread = hits_per_thread or self.hits_per_thread
+        barrier = Barrier(threads)
+
+        def worker():
+            barrier.wait()
+            return sum(1 for _ in range(hits_per_thread) if self.limiter.hit(identifier))
+
+        with mock.patch('core.ratelimit.time') as fake_time:
+            fake_time.time.return_value = now
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                return sum(future.result() for future in [pool.submit(worker) for _ in range(threads)])
+
+    def test_empty_window_allows_exactly_limit(self):
+        allowed = self.hammer(WINDOW_START + 30)
+
+        self.assertEqual(allowed, 50)
+        self.assertEqual(caches['ratelimit'].get('rl:test:1.2.3.4:1000'), self.threads * self.hits_per_thread)
+
+    def test_full_previous_window_blocks_at_boundary(self):
+        self.assertEqual(self.hammer(WINDOW_START - 50, threads=5), 50)
+
+        # Sınırın tam üstünde önceki pencere tam ağırlıkla sayılır
+        self.assertEqual(self.hammer(WINDOW_START), 0)
+
+    def test_previous_window_weighted_by_elapsed_time(self):
+        self.assertEqual(self.hammer(WINDOW_START - 50, threads=5), 50)
+
+        # Pencerenin yarısında önceki 50 istek 25 sayılır - 25 yer kalır
+        self.assertEqual(self.hammer(WINDOW_START + WINDOW // 2), 25)
+
+    def test_identifiers_are_limited_separately(self):
+        self.assertEqual(self.hammer(WINDOW_START + 30, identifier='a'), 50)
+        self.assertEqual(self.hammer(WINDOW_START + 30, identifier='b'), 50)
+
+
+class QueryBudgetTests(TestCase):
+    """Tüm isimli URL'ler test veritabanında bütçe içinde ve 2xx/3xx dönmeli"""
+
+    rows = 200
+
+    def test_all_endpoints_within_budget(self):
+        results, _ = querybudget.run(rows=self.rows)
+
+        # Render süresi makineye bağlı - test sadece durum ve sorgu sayısına bakar
+        failures = [
+            f"{row['name']} ({row['role']}): HTTP {row['status']}, "
+            f"{row['queries']}/{row['budget_queries']} sorgu"
+            for row in results
+            if set(row['over']) - {'ms'}
+        ]
+        self.assertTrue(results)
+        self.assertEqual(failures, [])
+
+
+class StubUsage:
+    """STORAGE_USAGE['USAGE_FUNCTION'] yerine - çağrıları sayar, release'e kadar bekler"""
+
+    lock = Lock()
+    calls = 0
+    used_bytes = 0
+    error = None
+    entered = Event()
+    release = Event()
+
+    @classmethod
+    def reset(cls, used_bytes=1024 ** 3):
+        cls.calls = 0
+        cls.used_bytes = used_bytes
+        cls.error = None
+        cls.entered = Event()
+        cls.release = Event()
+        cls.release.set()
+
+
+def stub_usage():
+    with StubUsage.lock:
+        StubUsage.calls += 1
+    StubUsage.entered.set()
+    StubUsage.release.wait(5)
+    if StubUsage.error is not None:
+        raise StubUsage.error
+    return {'storage': {'usage': StubUsage.used_bytes}}
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'storage-usage-tests'}},
+    STORAGE_USAGE={'USAGE_FUNCTION': 'core.tests.stub_usage'},
+)
+class StorageUsageTests(SimpleTestCase):
+    """Stale-while-revalidate: bayat değer beklemeden döner, yenileme tek uçuşlu"""
+
+    def setUp(self):
+        caches['default'].clear()
+        StubUsage.reset()
+        self.assertEqual(storageusage.fetch()['used_bytes'], 1024 ** 3)
+        StubUsage.reset(used_bytes=2 * 1024 ** 3)
+
+    def wait_for_refresh(self):
+        """Arka plan yenilemesini serbest bırak ve bitmesini bekle"""
+        self.assertTrue(StubUsage.entered.wait(5))
+        StubUsage.release.set()
+        deadline = time.monotonic() + 5
+        while storageusage._refreshing.locked() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(storageusage._refreshing.locked())
+
+    def test_stale_value_served_without_waiting(self):
+        StubUsage.release.clear()
+        storageusage.clear()  # Medya yüklemesi - değer bayat
+
+        started = time.perf_counter()
+        data = storageusage.get_storage_usage()
+
+        # API çağrısı release'e kadar bekliyor - okuma onu beklememeli
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertTrue(data['stale'])
+        self.assertEqual(data['used_bytes'], 1024 ** 3)
+
+        self.wait_for_refresh()
+        data = storageusage.get_storage_usage()
+        self.assertNotIn('stale', data)
+        self.assertEqual(data['used_bytes'], 2 * 1024 ** 3)
+
+    def test_concurrent_readers_trigger_single_fetch(self):
+        StubUsage.release.clear()
+        storageusage.clear()
+        threads = 16
+        barrier = Barrier(threads)
+
+        def reader():
+            barrier.wait()
+            return storageusage.get_storage_usage()
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = [future.result() for future in [pool.submit(reader) for _ in range(threads)]]
+
+        self.assertTrue(all(data['stale'] and data['used_bytes'] == 1024 ** 3 for data in results))
+        self.wait_for_refresh()
+        self.assertEqual(StubUsage.calls, 1)
+
+    def test_failure_keeps_last_value_and_records_error(self):
+        StubUsage.error = RuntimeError('API kapalı')
+
+        self.assertIsNone(storageusage.refresh())
+
+        self.assertEqual(StubUsage.calls, 1)
+        self.assertEqual(storageusage.get_storage_usage()['used_bytes'], 1024 ** 3)
+        metrics = storageusage.get_metrics()
+        self.assertEqual(metrics['fetch_count'], 2)
+        self.assertEqual(metrics['error_count'], 1)
+        self.assertEqual(metrics['last_error'], 'API kapalı')
+        # RETRY_AFTER dolana kadar tekrar denenmez
+        self.assertEqual(StubUsage.calls, 1)
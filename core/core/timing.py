@@ -0,0 +1,237 @@
+# core/timing.py
+"""
+İstek başına zaman ölçümü (Server-Timing)
+
+Örneklenen isteklerde aşağıdaki kırılım toplanır:
+    - db: sorgu sayısı ve süresi (connection.execute_wrapper)
+    - cache: hit/miss sayısı ve süresi (cache backend metodları sarılır)
+    - tpl: template render süresi (sadece en dış render, include'lar tekrar sayılmaz)
+    - view: view çalışma süresi
+    - total: middleware'den itibaren toplam süre
+
+Ölçüm bir contextvar üzerinden yürür; örneklenmeyen isteklerde sarılmış
+cache/template metodlarının maliyeti tek bir contextvar okumasıdır.
+"""
+import contextvars
+import json
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.core.cache import caches
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar('request_timer', default=None)
+_MISSING = object()
+_installed = False
+
+
+class RequestTimer:
+    """Tek bir isteğin ölçüm değerleri"""
+    __slots__ = (
+        'started', 'view_started', 'view_ms', 'total_ms',
+        'db_queries', 'db_ms', 'cache_hits', 'cache_misses', 'cache_ms',
+        'render_ms', 'render_depth', 'cache_depth',
+    )
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.view_ms = 0.0
+        self.total_ms = 0.0
+        self.db_queries = 0
+        self.db_ms = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_ms = 0.0
+        self.render_ms = 0.0
+        self.render_depth = 0
+        self.cache_depth = 0
+
+    def finish(self):
+        now = time.perf_counter()
+        if self.view_started is not None:
+            self.view_ms = (now - self.view_started) * 1000
+        self.total_ms = (now - self.started) * 1000
+
+    def as_dict(self):
+        return {
+            'total_ms': round(self.total_ms, 2),
+            'view_ms': round(self.view_ms, 2),
+            'db_queries': self.db_queries,
+            'db_ms': round(self.db_ms, 2),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'cache_ms': round(self.cache_ms, 2),
+            'render_ms': round(self.render_ms, 2),
+        }
+
+    def server_timing(self):
+        """Server-Timing başlık değeri"""
+        return ', '.join([
+            f'db;dur={self.db_ms:.1f};desc="{self.db_queries} queries"',
+            f'cache;dur={self.cache_ms:.1f};desc="{self.cache_hits} hit {self.cache_misses} miss"',
+            f'tpl;dur={self.render_ms:.1f}',
+            f'view;dur={self.view_ms:.1f}',
+            f'total;dur={self.total_ms:.1f}',
+        ])
+
+
+def get_current_timer():
+    return _current.get()
+
+
+# ========================
+# Hook'lar
+# ========================
+
+def _db_wrapper(execute, sql, params, many, context):
+    timer = _current.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.db_queries += 1
+        timer.db_ms += (time.perf_counter() - start) * 1000
+
+
+def _wrap_cache_get(original):
+    def get(self, key, default=None, version=None, **kwargs):
+        timer = _current.get()
+        if timer is None or timer.cache_depth:
+            return original(self, key, default, version, **kwargs)
+        timer.cache_depth += 1
+        start = time.perf_counter()
+        try:
+            value = original(self, key, _MISSING, version, **kwargs)
+        finally:
+            timer.cache_depth -= 1
+            timer.cache_ms += (time.perf_counter() - start) * 1000
+        if value is _MISSING:
+            timer.cache_misses += 1
+            return default
+        timer.cache_hits += 1
+        return value
+    get.__wrapped__ = original
+    return get
+
+
+def _wrap_cache_get_many(original):
+    def get_many(self, keys, version=None, **kwargs):
+        timer = _current.get()
+        if timer is None or timer.cache_depth:
+            return original(self, keys, version, **kwargs)
+        keys = list(keys)
+        timer.cache_depth += 1
+        start = time.perf_counter()
+        try:
+            values = original(self, keys, version, **kwargs)
+        finally:
+            timer.cache_depth -= 1
+            timer.cache_ms += (time.perf_counter() - start) * 1000
+        timer.cache_hits += len(values)
+        timer.cache_misses += len(keys) - len(values)
+        return values
+    get_many.__wrapped__ = original
+    return get_many
+
+
+def _wrap_cache_write(original):
+    def method(self, *args, **kwargs):
+        timer = _current.get()
+        if timer is None or timer.cache_depth:
+            return original(self, *args, **kwargs)
+        # İç içe çağrılar (örn. BaseCache.set_many -> set) tekrar sayılmaz
+        timer.cache_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            timer.cache_depth -= 1
+            timer.cache_ms += (time.perf_counter() - start) * 1000
+    method.__wrapped__ = original
+    return method
+
+
+def _wrap_template_render(original):
+    def render(self, context):
+        timer = _current.get()
+        if timer is None:
+            return original(self, context)
+        timer.render_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, context)
+        finally:
+            timer.render_depth -= 1
+            if timer.render_depth == 0:
+                timer.render_ms += (time.perf_counter() - start) * 1000
+    render.__wrapped__ = original
+    return render
+
+
+CACHE_WRITE_METHODS = ('set', 'add', 'delete', 'set_many', 'delete_many', 'incr', 'decr', 'touch')
+
+
+def install():
+    """Cache backend sınıflarını ve Template.render'ı bir kez sar"""
+    global _installed
+    if _installed:
+        return
+
+    from django.template.base import Template
+
+    wrapped = set()
+    for alias in caches:
+        backend_class = type(caches[alias])
+        if backend_class in wrapped:
+            continue
+        wrapped.add(backend_class)
+        # Metodlar sınıfın kendi __dict__'inde olmayabilir (BaseCache'ten miras)
+        backend_class.get = _wrap_cache_get(backend_class.get)
+        backend_class.get_many = _wrap_cache_get_many(backend_class.get_many)
+        for name in CACHE_WRITE_METHODS:
+            setattr(backend_class, name, _wrap_cache_write(getattr(backend_class, name)))
+
+    Template.render = _wrap_template_render(Template.render)
+    _installed = True
+
+
+@contextmanager
+def measure():
+    """
+    Blok boyunca ölçüm yap - RequestTimer döndürür
+
+        with measure() as timer:
+            client.get('/')
+        timer.as_dict()
+    """
+    install()
+    timer = RequestTimer()
+    token = _current.set(timer)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_db_wrapper))
+            yield timer
+    finally:
+        _current.reset(token)
+        timer.finish()
+
+
+def log_request(request, response, timer):
+    """url_name bazında yapılandırılmış log satırı"""
+    match = getattr(request, 'resolver_match', None)
+    data = {
+        'url_name': (match.url_name if match is not None else None) or '-',
+        'namespace': match.namespace if match is not None else '',
+        'method': request.method,
+        'path': request.path,
+        'status': response.status_code,
+    }
+    data.update(timer.as_dict())
+    logger.info(json.dumps(data, ensure_ascii=False))
@@ -3,7 +3,6 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib.sitemaps.views import sitemap
 from django.views.generic import TemplateView
 from django.views.decorators.cache import cache_page
 from django.conf.urls.i18n import i18n_patterns
@@ -13,24 +12,6 @@ from dashboard.views import catalog_view
 from django.views.i18n import JavaScriptCatalog
 
 
-# Sitemap'leri güvenli import
-try:
-    from .sitemaps import (
-        StaticViewSitemap, ProductSitemap, CategorySitemap, 
-        GallerySitemap, ServiceSitemap, TeamSitemap, CarouselSitemap
-    )
-    sitemaps = {
-        'static': StaticViewSitemap,
-        'products': ProductSitemap,
-        'categories': CategorySitemap,
-        'gallery': GallerySitemap,
-        'services': ServiceSitemap,
-        'team': TeamSitemap,
-        'carousel': CarouselSitemap,
-    }
-except ImportError:
-    sitemaps = {}
-
 # Dil-bağımsız URL'ler (admin, sitemap, dil değiştirme, API'ler)
 urlpatterns = [
     path(getattr(settings, 'ADMIN_URL_SUFFIX', 'admin/'), admin.site.urls),
@@ -52,12 +33,9 @@ urlpatterns = [
     path('api/cookie-preferences/', views.save_cookie_preferences, name='save_cookie_preferences'),
     path('api/get-cookie-preferences/', views.get_cookie_preferences, name='get_cookie_preferences'),
     
-    # Sitemap
-    path('sitemap.xml', 
-         cache_page(86400)(sitemap) if sitemaps else TemplateView.as_view(
-             template_name="sitemap.xml", content_type="application/xml"),
-         {'sitemaps': sitemaps} if sitemaps else {},
-         name='django.contrib.sitemaps.views.sitemap'),
+    # Sitemap - önceden yazılmış dosyalar (core.sitemapfiles)
+    path('sitemap.xml', views.sitemap_index, name='sitemap_index'),
+    path('sitemaps/<str:filename>', views.sitemap_section, name='sitemap_section'),
     
     path('robots.txt', cache_page(86400)(TemplateView.as_view(
          template_name="robots.txt", content_type="text/plain"))),
@@ -9,65 +9,78 @@ def check_cloudinary_storage():
     """
     Cloudinary depolama kullanımını kontrol eder.
     Returns: dict with usage info
+
+    NOT: Her çağrı Cloudinary API'sine senkron HTTPS isteği yapar. İstek
+    sırasında core.storageusage.get_storage_usage() kullanılmalı.
     """
     try:
         # Cloudinary API'den kullanım bilgilerini al
         usage = cloudinary.api.usage()
-        
-        # Kullanılan alan (bytes cinsinden)
-        used_bytes = usage.get('storage', {}).get('usage', 0)
-        
-        # Paket limiti (settings'den)
-        limit_bytes = settings.CLOUDINARY_STORAGE_LIMIT_BYTES
-        limit_gb = settings.CLOUDINARY_STORAGE_LIMIT_GB
-        
-        # Hesaplamalar
-        used_gb = used_bytes / (1024 ** 3)
-        remaining_bytes = max(0, limit_bytes - used_bytes)
-        remaining_gb = remaining_bytes / (1024 ** 3)
-        usage_percentage = min(100, (used_bytes / limit_bytes) * 100) if limit_bytes > 0 else 0
-        
-        # Uyarı seviyeleri
-        warning_level = 'success'
-        if usage_percentage >= 90:
-            warning_level = 'danger'
-        elif usage_percentage >= 80:
-            warning_level = 'warning'
-        elif usage_percentage >= 60:
-            warning_level = 'info'
-        
-        return {
-            'used_bytes': used_bytes,
-            'used_gb': round(used_gb, 2),
-            'limit_bytes': limit_bytes,
-            'limit_gb': limit_gb,
-            'remaining_bytes': remaining_bytes,
-            'remaining_gb': round(remaining_gb, 2),
-            'usage_percentage': round(usage_percentage, 1),
-            'warning_level': warning_level,
-            'is_warning': usage_percentage >= 80,
-            'is_critical': usage_percentage >= 90,
-        }
+        return build_storage_info(usage)
         
     except Exception as e:
         logger.error(f"Cloudinary storage check failed: {e}")
-        return {
-            'used_bytes': 0,
-            'used_gb': 0,
-            'limit_bytes': settings.CLOUDINARY_STORAGE_LIMIT_BYTES,
-            'limit_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-            'remaining_bytes': settings.CLOUDINARY_STORAGE_LIMIT_BYTES,
-            'remaining_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-            'usage_percentage': 0,
-            'warning_level': 'success',
-            'is_warning': False,
-            'is_critical': False,
-            'error': True
-        }
+        return storage_error_info()
+
+
+def build_storage_info(usage):
+    """usage() yanıtından depolama bilgisi sözlüğü üret"""
+    # Kullanılan alan (bytes cinsinden)
+    used_bytes = usage.get('storage', {}).get('usage', 0)
+    
+    # Paket limiti (settings'den)
+    limit_bytes = settings.CLOUDINARY_STORAGE_LIMIT_BYTES
+    limit_gb = settings.CLOUDINARY_STORAGE_LIMIT_GB
+    
+    # Hesaplamalar
+    used_gb = used_bytes / (1024 ** 3)
+    remaining_bytes = max(0, limit_bytes - used_bytes)
+    remaining_gb = remaining_bytes / (1024 ** 3)
+    usage_percentage = min(100, (used_bytes / limit_bytes) * 100) if limit_bytes > 0 else 0
+    
+    # Uyarı seviyeleri
+    warning_level = 'success'
+    if usage_percentage >= 90:
+        warning_level = 'danger'
+    elif usage_percentage >= 80:
+        warning_level = 'warning'
+    elif usage_percentage >= 60:
+        warning_level = 'info'
+    
+    return {
+        'used_bytes': used_bytes,
+        'used_gb': round(used_gb, 2),
+        'limit_bytes': limit_bytes,
+        'limit_gb': limit_gb,
+        'remaining_bytes': remaining_bytes,
+        'remaining_gb': round(remaining_gb, 2),
+        'usage_percentage': round(usage_percentage, 1),
+        'warning_level': warning_level,
+        'is_warning': usage_percentage >= 80,
+        'is_critical': usage_percentage >= 90,
+    }
+
+
+def storage_error_info():
+    """Kullanım bilgisi alınamadığında gösterilen değerler"""
+    return {
+        'used_bytes': 0,
+        'used_gb': 0,
+        'limit_bytes': settings.CLOUDINARY_STORAGE_LIMIT_BYTES,
+        'limit_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
+        'remaining_bytes': settings.CLOUDINARY_STORAGE_LIMIT_BYTES,
+        'remaining_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
+        'usage_percentage': 0,
+        'warning_level': 'success',
+        'is_warning': False,
+        'is_critical': False,
+        'error': True
+    }
 
 def is_storage_limit_exceeded():
     """Depolama limiti aşıldı mı kontrol eder"""
-    usage_info = check_cloudinary_storage()
+    from .storageusage import get_storage_usage
+    usage_info = get_storage_usage()
     if 'error' in usage_info:
         return False
     return usage_info['usage_percentage'] >= 95  # %95 dolduğunda uyarı
@@ -75,5 +88,6 @@ def is_storage_limit_exceeded():
 
 def get_storage_package_display():
     """Admin panelinde paket bilgilerini göstermek için"""
-    storage_info = check_cloudinary_storage()
+    from .storageusage import get_storage_usage
+    storage_info = get_storage_usage()
     return f"{settings.CLOUDINARY_STORAGE_LIMIT_GB}GB Paket - %{storage_info.get('usage_percentage', 0)} kullanım"
\ No newline at end of file
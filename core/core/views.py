@@ -11,8 +11,12 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_exempt
 import json
+import os
 from django.shortcuts import render
 from django.http import HttpResponseNotFound, HttpResponseServerError, HttpResponseForbidden
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.template import TemplateDoesNotExist
 from django.utils.translation import gettext as _
 from django.utils import timezone
@@ -20,8 +24,10 @@ from django.conf import settings
 import logging
 import random
 from django.views.decorators.csrf import requires_csrf_token
-from django.shortcuts import render, get_object_or_404
+from django.shortcuts import render
 from core.models import LegalPage, CookieConsent
+from core.client_ip import get_client_ip
+from core import conditional, identity, sitemapfiles
 
 from products.models import Product
 from gallery.models import Gallery
@@ -200,7 +206,7 @@ def custom_404_view(request, exception=None):
     - Structured data
     """
     # Logging
-    logger.warning(f'404 Error: {request.path} from IP {request.META.get("REMOTE_ADDR", "")}')
+    logger.warning(f'404 Error: {request.path} from IP {get_client_ip(request)}')
     
     # Arama önerileri için içerik - güvenli try/except blokları
     popular_products = []
@@ -292,7 +298,7 @@ def custom_500_view(request):
     - Sistem durumu
     """
     # Hata logging
-    logger.error(f'500 Error on {request.path} from IP {request.META.get("REMOTE_ADDR", "")}')
+    logger.error(f'500 Error on {request.path} from IP {get_client_ip(request)}')
     
     # Güvenli içerik yükleme
     try:
@@ -331,7 +337,7 @@ def custom_403_view(request, exception=None):
     """
     SEO-friendly 403 hata sayfası
     """
-    logger.warning(f'403 Error: {request.path} from IP {request.META.get("REMOTE_ADDR", "")}')
+    logger.warning(f'403 Error: {request.path} from IP {get_client_ip(request)}')
     
     context = {
         'error_code': '403',
@@ -355,7 +361,7 @@ def custom_400_view(request, exception=None):
     """
     400 Bad Request hata sayfası
     """
-    logger.warning(f'400 Error: {request.path} from IP {request.META.get("REMOTE_ADDR", "")}')
+    logger.warning(f'400 Error: {request.path} from IP {get_client_ip(request)}')
     
     context = {
         'error_code': '400',
@@ -414,9 +420,10 @@ def csrf_failure_view(request, reason=""):
 
 
 
+@conditional.detail(LegalPage, lambda slug: {'slug': slug, 'is_active': True}, timestamp_field='last_updated')
 def legal_page_detail(request, slug):
     """Yasal sayfa detayı"""
-    page = get_object_or_404(LegalPage, slug=slug, is_active=True)
+    page = identity.get_object_or_404(request, LegalPage, slug=slug, is_active=True)
     
     context = {
         'page': page,
@@ -445,11 +452,7 @@ def save_cookie_preferences(request):
             session_key = request.session.session_key
         
         # IP adresini al
-        ip_address = request.META.get('HTTP_X_FORWARDED_FOR')
-        if ip_address:
-            ip_address = ip_address.split(',')[0].strip()
-        else:
-            ip_address = request.META.get('REMOTE_ADDR')
+        ip_address = get_client_ip(request) or None
         
         # Çerez onayını kaydet veya güncelle
         consent, created = CookieConsent.objects.update_or_create(
@@ -539,4 +542,43 @@ def get_cookie_preferences(request):
         return JsonResponse({
             'success': False,
             'error': str(e)
-        }, status=500)
\ No newline at end of file
+        }, status=500)
+
+# ========================
+# Sitemap (core.sitemapfiles) - diskteki dosyalar, ORM'e gidilmez
+# ========================
+
+def _serve_sitemap_file(request, path, content_type):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return HttpResponseNotFound()
+
+    last_modified = int(stat.st_mtime)
+    etag = '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = FileResponse(open(path, 'rb'), content_type=content_type)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, public=True, max_age=60 * 60)
+    return response
+
+
+def sitemap_index(request):
+    """/sitemap.xml - bölüm dosyalarının index'i"""
+    manifest = sitemapfiles.get_manifest(request)
+    if manifest is None:
+        response = HttpResponse(status=503)
+        response['Retry-After'] = 60  # İlk oluşturma başka işlemde sürüyor
+        return response
+    return _serve_sitemap_file(request, sitemapfiles.index_path(), 'application/xml')
+
+
+def sitemap_section(request, filename):
+    """/sitemaps/<bölüm>-<dil>-<n>.xml.gz"""
+    manifest = sitemapfiles.get_manifest(request)
+    path = sitemapfiles.file_path(manifest, filename) if manifest else None
+    if path is None:
+        return HttpResponseNotFound()
+    return _serve_sitemap_file(request, path, 'application/gzip')
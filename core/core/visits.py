@@ -0,0 +1,139 @@
+# core/visits.py
+"""
+Write-behind ziyaret sayacı
+
+- Tekil ziyaretçi, imzalı bir cookie ile ayırt edilir (server-side session
+  oluşturulmaz). Cookie DEDUP_SECONDS boyunca geçerlidir.
+- Her yeni ziyaret cache'teki atomik sayacı artırır (Redis'te INCR).
+- Biriken artışlar flush_visits() ile toplu olarak About.completed_jobs'a
+  yazılır: flush_visit_counters management komutu (cron) veya sayaç
+  FLUSH_THRESHOLD'a ulaştığında tek bir worker tarafından.
+- İstek yolunda hiçbir cache anahtarı silinmez; About cache etiketleri
+  sadece flush sonrası bir kez yenilenir.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from . import cachetags
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = 'visits:pending'
+FLUSH_LOCK_KEY = 'visits:flush_lock'
+COOKIE_SALT = 'core.visits'
+
+DEFAULTS = {
+    'COOKIE_NAME': '_pv',
+    'DEDUP_SECONDS': 60 * 60 * 24,  # Aynı ziyaretçi günde bir kez sayılır
+    'FLUSH_THRESHOLD': 100,  # None: sadece management komutu ile flush
+}
+
+
+def get_visit_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'VISIT_COUNTER', {}))
+    return config
+
+
+def is_counted(request):
+    """Ziyaretçi dedup süresi içinde zaten sayıldı mı?"""
+    config = get_visit_settings()
+    return request.get_signed_cookie(
+        config['COOKIE_NAME'], default=None, salt=COOKIE_SALT,
+        max_age=config['DEDUP_SECONDS'],
+    ) is not None
+
+
+def mark_counted(request, response):
+    """Ziyaretçiyi imzalı cookie ile işaretle"""
+    config = get_visit_settings()
+    response.set_signed_cookie(
+        config['COOKIE_NAME'], '1', salt=COOKIE_SALT,
+        max_age=config['DEDUP_SECONDS'],
+        secure=request.is_secure(), httponly=True, samesite='Lax',
+    )
+
+
+def _increment(key, amount):
+    try:
+        return cache.incr(key, amount)
+    except ValueError:
+        # İlk artış - add() yarışı kaybedilirse incr tekrar denenir
+        if cache.add(key, amount, None):
+            return amount
+        return cache.incr(key, amount)
+
+
+def record_visit():
+    """Ziyareti atomik sayaca ekle, eşik aşıldıysa flush et"""
+    pending = _increment(PENDING_KEY, 1)
+
+    threshold = get_visit_settings()['FLUSH_THRESHOLD']
+    if threshold and pending >= threshold:
+        # Tek worker flush eder (kilit flush_visits içinde); diğerleri saymaya devam eder
+        flush_visits()
+    return pending
+
+
+def get_pending_visits():
+    return cache.get(PENDING_KEY, 0) or 0
+
+
+def _decrement(amount):
+    try:
+        cache.decr(PENDING_KEY, amount)
+    except ValueError:
+        # Sayaç bu arada silinmiş (cache temizlendi / eviction) - düşülecek bir şey yok
+        logger.warning(f"Ziyaret sayacı bulunamadı, {amount} ziyaret düşülemedi")
+
+
+def flush_visits():
+    """
+    Biriken ziyaretleri veritabanına yaz - yazılan sayı kadar sayaç azaltılır,
+    böylece flush sırasında gelen artışlar kaybolmaz
+
+    Aynı anda tek flush çalışır (FLUSH_LOCK_KEY); kilit commit sonrası,
+    sayaç azaltıldıktan sonra bırakılır. Kilit alınamazsa 0 döner.
+
+    Returns:
+        int: Veritabanına yazılan ziyaret sayısı
+    """
+    if not cache.add(FLUSH_LOCK_KEY, True, 60):
+        logger.info("Ziyaret flush'ı zaten çalışıyor")
+        return 0
+    try:
+        flushed = _flush()
+    except Exception:
+        cache.delete(FLUSH_LOCK_KEY)
+        raise
+    # Transaction dışında hemen çalışır; rollback olursa kilit süresi dolunca düşer
+    transaction.on_commit(lambda: cache.delete(FLUSH_LOCK_KEY))
+    return flushed
+
+
+def _flush():
+    pending = get_pending_visits()
+    if pending <= 0:
+        return 0
+
+    from about.models import About
+
+    about_id = About.objects.values_list('pk', flat=True).first()
+    if about_id is None:
+        logger.warning("About modeli bulunamadı, ziyaretler bekletiliyor")
+        return 0
+
+    with transaction.atomic():
+        About.objects.filter(pk=about_id).update(
+            completed_jobs=F('completed_jobs') + pending
+        )
+        transaction.on_commit(lambda: _decrement(pending))
+        # update() sinyal tetiklemez - About cache etiketleri commit sonrası yenilenir
+        cachetags.invalidate(About)
+
+    logger.info(f"{pending} ziyaret veritabanına yazıldı")
+    return pending
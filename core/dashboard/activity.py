@@ -0,0 +1,204 @@
+# dashboard/activity.py
+"""
+Aktivite geçmişi - ActivityEvent olay tablosu
+
+Ürün / yorum / mesaj / kategori oluşturulduğunda tek satırlık olay yazılır;
+aktivite sayfası ve ana sayfa widget'ı kaynak tabloları birleştirmek yerine
+bu tablodan okur:
+
+    page = activity.get_page(types=['review_added'], since=..., cursor=...)
+    page['events'], page['next_cursor']
+
+    - Sadece ekleme: kaynak kayıt sonradan değişse / silinse de olay kalır
+    - Keyset sayfalama: (created_at, id) imleciyle tek sorgu - OFFSET ve
+      COUNT yok, sayfa derinliği maliyeti değiştirmez
+    - Olay, kaynak kayıtla aynı transaction'da yazılır
+    - Mevcut kayıtlar backfill_activity_events komutuyla aktarılır; komut
+      tekrar çalıştırılabilir (kaynak başına tek olay)
+"""
+import base64
+import logging
+from datetime import datetime, timezone as dt_timezone
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'PAGE_SIZE': 20,
+    'WIDGET_SIZE': 8,  # Dashboard ana sayfa "Son Aktiviteler"
+    'BATCH_SIZE': 1000,  # Backfill
+    'MAX_DAYS': 3650,  # Aktivite sayfası ?days= üst sınırı
+}
+
+# Sayfa filtresi (?type=) -> olay tipleri
+TYPE_FILTERS = {
+    'all': None,
+    'products': ['product_added'],
+    'reviews': ['review_added'],
+    'messages': ['message_received'],
+    'categories': ['category_added'],
+}
+
+
+def get_activity_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'DASHBOARD_ACTIVITY', {}))
+    return config
+
+
+# ========================
+# Olay içerikleri
+# ========================
+
+def _product(product):
+    category = product.category.name if product.category_id else '-'
+    return 'product_added', f'Yeni ürün eklendi: {product.name}', f'{category} kategorisine eklendi'
+
+
+def _review(review):
+    return 'review_added', f'{review.rating} yıldızlı yorum alındı', f'{review.name} tarafından'
+
+
+def _message(message):
+    return 'message_received', f'Yeni mesaj: {message.subject}', f'{message.name} tarafından gönderildi'
+
+
+def _category(category):
+    return 'category_added', f'Yeni kategori eklendi: {category.name}', 'Ürün kataloğuna eklendi'
+
+
+# Kaynak model -> (içerik fonksiyonu, backfill için select_related)
+SOURCES = {
+    'products.product': (_product, ('category',)),
+    'reviews.review': (_review, ()),
+    'contact.contact': (_message, ()),
+    'products.category': (_category, ()),
+}
+
+
+def _content_type(model):
+    """ContentType önbelleğinden - record() başına ek sorgu yok"""
+    from django.contrib.contenttypes.models import ContentType
+
+    return ContentType.objects.get_for_model(model)
+
+
+def build_event(instance, content_type, event_model):
+    describe, _ = SOURCES[instance._meta.label_lower]
+    event_type, title, description = describe(instance)
+    return event_model(
+        type=event_type,
+        title=title[:255],
+        description=description[:255],
+        content_type=content_type,
+        object_id=instance.pk,
+        created_at=instance.created_at or timezone.now(),
+    )
+
+
+def record(instance):
+    """Yeni kaynak kayıt için olay yaz (post_save, created=True)"""
+    from .models import ActivityEvent
+
+    if instance._meta.label_lower not in SOURCES:
+        return
+    try:
+        # Savepoint - hata, kaynak kaydın transaction'ını bozmasın
+        with transaction.atomic():
+            build_event(instance, _content_type(type(instance)), ActivityEvent).save()
+    except Exception as e:
+        logger.error(f"Aktivite kaydedilemedi ({instance._meta.label_lower} #{instance.pk}): {e}")
+
+
+def backfill(since=None, batch_size=None):
+    """
+    Mevcut kayıtlardan olay üretir - var olanlar atlanır
+
+    Returns:
+        dict: {model etiketi: taranan kayıt sayısı}
+    """
+    from .models import ActivityEvent
+
+    batch_size = batch_size or get_activity_settings()['BATCH_SIZE']
+
+    scanned = {}
+    for label, (_, related) in SOURCES.items():
+        model = global_apps.get_model(label)
+        content_type = _content_type(model)
+        queryset = model._base_manager.select_related(*related).order_by('pk')
+        if since is not None:
+            queryset = queryset.filter(created_at__gte=since)
+
+        batch, count = [], 0
+        for instance in queryset.iterator(chunk_size=batch_size):
+            batch.append(build_event(instance, content_type, ActivityEvent))
+            count += 1
+            if len(batch) >= batch_size:
+                ActivityEvent.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        if batch:
+            ActivityEvent.objects.bulk_create(batch, ignore_conflicts=True)
+        scanned[label] = count
+    return scanned
+
+
+# ========================
+# Keyset sayfalama
+# ========================
+
+def encode_cursor(event):
+    raw = f'{event.created_at.astimezone(dt_timezone.utc).isoformat()}|{event.pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """(created_at, id) - geçersiz imleçte None (ilk sayfa)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        created_at, pk = raw.rsplit('|', 1)
+        created_at = datetime.fromisoformat(created_at)
+        if timezone.is_naive(created_at):
+            return None
+        return created_at, int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def get_page(types=None, since=None, cursor=None, size=None):
+    """
+    Yeniden eskiye bir sayfa olay - tek sorgu
+
+    Returns:
+        dict: {'events': [...], 'next_cursor': str veya None, 'cursor': str veya None}
+    """
+    from .models import ActivityEvent
+
+    size = size or get_activity_settings()['PAGE_SIZE']
+    queryset = ActivityEvent.objects.all()
+    if types:
+        queryset = queryset.filter(type__in=types)
+    if since is not None:
+        queryset = queryset.filter(created_at__gte=since)
+
+    position = decode_cursor(cursor)
+    if position is not None:
+        created_at, pk = position
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+    else:
+        cursor = None
+
+    events = list(queryset.order_by('-created_at', '-pk')[:size + 1])
+    next_cursor = encode_cursor(events[size - 1]) if len(events) > size else None
+    return {'events': events[:size], 'next_cursor': next_cursor, 'cursor': cursor}
+
+
+def latest(size=None):
+    """Ana sayfa widget'ı için son olaylar"""
+    return get_page(size=size or get_activity_settings()['WIDGET_SIZE'])['events']
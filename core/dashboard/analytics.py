@@ -0,0 +1,276 @@
+# dashboard/analytics.py
+"""
+Dashboard içerik istatistikleri - günlük özet tablo (DailyStats) üzerinden
+
+Grafikler ürün / yorum / mesaj tablolarını ay ay saymak yerine özet
+tablodan tek sorguyla okunur:
+
+    analytics.monthly_series(6)       # son 6 ay (TruncMonth + Sum)
+    analytics.period_series(30)       # son 30 gün, gün gün
+
+    - Kaynak sayım: model başına TEK gruplu sorgu (TruncDay / TruncMonth,
+      yerel saat dilimi) - tüm sayaçlar koşullu Count ile aynı sorguda
+    - Özet tablo save/delete sinyalleriyle, ilgili gün yeniden sayılarak
+      güncellenir (commit sonrası)
+    - bulk_create / queryset.update gibi sinyal üretmeyen işlemlerden sonra
+      rebuild_daily_stats komutu tabloyu baştan (veya aralık için) kurar
+    - Boş günler / aylar seride 0 olarak yer alır
+"""
+import logging
+from datetime import date, datetime, time, timedelta
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDay, TruncMonth
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MONTHS': 6,  # Dashboard ana sayfa grafiği
+    'MAX_PERIOD_DAYS': 366 * 2,  # chart_data_api ?period= üst sınırı
+    'DAILY_PERIOD_LIMIT': 90,  # Bundan uzun dönemler aylık gruplanır
+    'SIGNALS': True,  # Kayıt / silmede özet tabloyu güncelle
+}
+
+# Kaynak model -> {özet alanı: filtre (None: tümü)}
+SOURCES = {
+    'products.product': {
+        'products': None,
+        'active_products': Q(is_active=True),
+    },
+    'reviews.review': {
+        'reviews': None,
+        'approved_reviews': Q(is_approved=True),
+    },
+    'contact.contact': {
+        'messages': None,
+    },
+}
+
+METRICS = [field for fields in SOURCES.values() for field in fields]
+
+DAY = 'day'
+MONTH = 'month'
+
+
+def get_analytics_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'DASHBOARD_ANALYTICS', {}))
+    return config
+
+
+# ========================
+# Tarih yardımcıları
+# ========================
+
+def today():
+    return timezone.localdate()
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def add_months(day, months):
+    """Ayın ilk günü + months ay"""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _midnight(day):
+    """Günün yerel saatle başlangıcı"""
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.date()
+    return value
+
+
+def buckets(start, end, granularity=DAY):
+    """Aralıktaki tüm günler / ay başları"""
+    if granularity == MONTH:
+        current, last = month_start(start), month_start(end)
+        result = []
+        while current <= last:
+            result.append(current)
+            current = add_months(current, 1)
+        return result
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+# ========================
+# Kaynak tablolardan sayım
+# ========================
+
+def source_counts(label, start=None, end=None, granularity=DAY):
+    """
+    Tek modelin gün / ay bazında sayıları - tek gruplu sorgu
+
+    Returns:
+        dict: {gün veya ay başı: {özet alanı: sayı}}
+    """
+    model = global_apps.get_model(label)
+    fields = SOURCES[label]
+    trunc = TruncMonth if granularity == MONTH else TruncDay
+
+    queryset = model._base_manager.all()
+    if start is not None:
+        queryset = queryset.filter(created_at__gte=_midnight(start))
+    if end is not None:
+        queryset = queryset.filter(created_at__lt=_midnight(end + timedelta(days=1)))
+
+    rows = (
+        queryset
+        .annotate(bucket=trunc('created_at', tzinfo=timezone.get_current_timezone()))
+        .values('bucket')
+        .annotate(**{
+            field: Count('pk', filter=condition) if condition is not None else Count('pk')
+            for field, condition in fields.items()
+        })
+        .order_by()
+    )
+    return {_as_date(row.pop('bucket')): row for row in rows}
+
+
+def live_series(start, end, granularity=DAY):
+    """Özet tabloyu kullanmadan, kaynak tablolardan seri (model başına bir sorgu)"""
+    merged = {}
+    for label in SOURCES:
+        for bucket, counts in source_counts(label, start, end, granularity).items():
+            merged.setdefault(bucket, {}).update(counts)
+    return _fill(merged, start, end, granularity)
+
+
+# ========================
+# Özet tablo
+# ========================
+
+def _stats_model():
+    return global_apps.get_model('dashboard.dailystats')
+
+
+def refresh_days(label, days):
+    """Bir modelin verilen günlerdeki sayılarını yeniden hesaplayıp özet tabloya yazar"""
+    days = sorted(set(days))
+    if not days:
+        return
+    DailyStats = _stats_model()
+    fields = SOURCES[label]
+    counts = source_counts(label, days[0], days[-1])
+    for day in days:
+        values = counts.get(day, {})
+        DailyStats.objects.update_or_create(
+            date=day, defaults={field: values.get(field, 0) for field in fields},
+        )
+
+
+def schedule_refresh(instance):
+    """save/delete sinyalinden - commit sonrası ilgili günü yeniden say"""
+    if not get_analytics_settings()['SIGNALS']:
+        return
+    label = instance._meta.label_lower
+    created_at = getattr(instance, 'created_at', None)
+    if label not in SOURCES or created_at is None:
+        return
+    day = _as_date(created_at)
+
+    def refresh():
+        try:
+            refresh_days(label, [day])
+        except Exception as e:
+            logger.error(f"Günlük istatistik güncellenemedi ({label}, {day}): {e}")
+
+    transaction.on_commit(refresh)
+
+
+def rebuild(start=None, end=None):
+    """
+    Özet tabloyu kaynak tablolardan yeniden kurar (aralık verilmezse tamamı)
+
+    Returns:
+        int: yazılan gün sayısı
+    """
+    DailyStats = _stats_model()
+    merged = {}
+    for label in SOURCES:
+        for day, counts in source_counts(label, start, end).items():
+            merged.setdefault(day, {}).update(counts)
+
+    with transaction.atomic():
+        existing = DailyStats.objects.all()
+        if start is not None:
+            existing = existing.filter(date__gte=start)
+        if end is not None:
+            existing = existing.filter(date__lte=end)
+        existing.delete()
+        DailyStats.objects.bulk_create(
+            [DailyStats(date=day, **counts) for day, counts in sorted(merged.items())],
+            batch_size=500,
+        )
+    return len(merged)
+
+
+# ========================
+# Seriler (özet tablodan)
+# ========================
+
+def _fill(values, start, end, granularity):
+    return [
+        dict({field: 0 for field in METRICS}, date=bucket, **values.get(bucket, {}))
+        for bucket in buckets(start, end, granularity)
+    ]
+
+
+def series(start, end, granularity=DAY):
+    """
+    [start, end] aralığı için gün veya ay bazında seri - tek sorgu
+
+    Returns:
+        list: [{'date': gün / ay başı, 'products': .., 'active_products': .., ...}]
+    """
+    from .models import DailyStats
+
+    queryset = DailyStats.objects.filter(date__gte=start, date__lte=end)
+    if granularity == MONTH:
+        rows = (
+            queryset
+            .annotate(bucket=TruncMonth('date'))
+            .values('bucket')
+            .annotate(**{field: Sum(field) for field in METRICS})
+            .order_by()
+        )
+        values = {_as_date(row.pop('bucket')): row for row in rows}
+    else:
+        values = {row.pop('date'): row for row in queryset.values('date', *METRICS)}
+    return _fill(values, start, end, granularity)
+
+
+def monthly_series(months=None):
+    """Son N ay (bu ay dahil)"""
+    months = months or get_analytics_settings()['MONTHS']
+    end = today()
+    start = add_months(month_start(end), -(months - 1))
+    return series(start, end, MONTH)
+
+
+def period_series(days):
+    """
+    Son N gün - DAILY_PERIOD_LIMIT'e kadar gün gün, daha uzunsa aylık
+
+    Returns:
+        str: DAY / MONTH
+        list: series() çıktısı
+    """
+    config = get_analytics_settings()
+    days = max(1, min(int(days), config['MAX_PERIOD_DAYS']))
+    end = today()
+    start = end - timedelta(days=days - 1)
+    granularity = DAY if days <= config['DAILY_PERIOD_LIMIT'] else MONTH
+    return granularity, series(start, end, granularity)
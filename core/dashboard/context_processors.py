@@ -1,10 +1,11 @@
 # dashboard/context_processors.py
 from django.db import OperationalError
-from core.utils import check_cloudinary_storage
-from django.core.cache import cache
+from core import storageusage
+from core.lazycontext import lazy_context
 from django.conf import settings
 import logging
 
+@lazy_context('unread_notifications_count', 'latest_notifications')
 def notification_context(request):
     try:
         from .models import Notification
@@ -33,33 +34,20 @@ def storage_info(request):
     Cloudinary storage bilgilerini sadece dashboard sayfalarına ekler
     """
     if request.path.startswith('/dashboard/'):
-        # Cache'den storage bilgilerini al (5 dakika cache)
-        storage_data = cache.get('cloudinary_storage_info')
-        
-        if storage_data is None:
-            try:
-                storage_data = check_cloudinary_storage()
-                cache.set('cloudinary_storage_info', storage_data, 60 * 5)  # 5 dakika cache
-            except Exception as e:
-                logger.error(f"Storage info error: {e}")
-                storage_data = {
-                    'used_gb': 0,
-                    'limit_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-                    'remaining_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-                    'usage_percentage': 0,
-                    'warning_level': 'success',
-                    'is_warning': False,
-                    'is_critical': False,
-                    'error': True
-                }
-        
-        return {
-            'cloudinary_storage': storage_data,
-            'storage_package_info': {
-                'current_package_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
-                'available_packages': list(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
-                'is_upgradeable': settings.CLOUDINARY_STORAGE_LIMIT_GB < max(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
-            }
-        }
+        return _storage_context(request)
     return {}
 
+
+@lazy_context('cloudinary_storage', 'storage_package_info')
+def _storage_context(request):
+    # Son bilinen değer hemen döner, bayatsa arka planda yenilenir (core.storageusage)
+    storage_data = storageusage.get_storage_usage()
+
+    return {
+        'cloudinary_storage': storage_data,
+        'storage_package_info': {
+            'current_package_gb': settings.CLOUDINARY_STORAGE_LIMIT_GB,
+            'available_packages': list(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
+            'is_upgradeable': settings.CLOUDINARY_STORAGE_LIMIT_GB < max(settings.CLOUDINARY_STORAGE_PACKAGES.keys()),
+        }
+    }
@@ -0,0 +1,247 @@
+# dashboard/inbox.py
+"""
+Dashboard mesaj kutusu - iletişim mesajları için sayfalama, filtre ve toplu işlemler
+
+messages_list ve sonsuz kaydırma endpoint'i (ajax_messages) tüm mesajları
+belleğe almak yerine buradan sayfa sayfa okur:
+
+    filters = inbox.parse_filters(request.GET)
+    page = inbox.get_page(filters, cursor=request.GET.get('cursor'))
+    page['messages'], page['next_cursor']
+
+    - Sıralama: okunmamışlar önce, sonra yeniden eskiye (is_read, -created_at, -id)
+      - contact_read_created_idx index'i ile aynı sıra
+    - Keyset sayfalama: son satırın (is_read, created_at, id) imleciyle tek
+      sorgu - OFFSET ve COUNT yok
+    - Filtreler sunucuda: arama (isim, e-posta, konu, mesaj), durum
+      (okunmamış / okunmuş), tarih aralığı (yerel gün), konu
+    - Sayaçlar tablo başına tek koşullu aggregate sorgusuyla
+    - Okundu işaretleme update() ile - kayıt yüklenmez, sinyal tetiklenmez
+"""
+import base64
+import logging
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'PAGE_SIZE': 25,
+    'MAX_PAGE_SIZE': 100,  # ?size= üst sınırı (JSON endpoint)
+    'MAX_IDS': 500,  # Toplu okundu işaretlemede tek istekteki en fazla id
+}
+
+STATUS_CHOICES = (
+    ('all', 'Tümü'),
+    ('unread', 'Okunmamış'),
+    ('read', 'Okunmuş'),
+)
+
+SEARCH_FIELDS = ('name', 'email', 'subject', 'message')
+
+
+def get_inbox_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'DASHBOARD_INBOX', {}))
+    return config
+
+
+# ========================
+# Filtreler
+# ========================
+
+# Kabul edilen tarih aralığı - dışındaki değerler sınıra çekilir (date.min/max
+# yerel saat -> UTC dönüşümünde, date.max + 1 gün hesaplanırken taşar)
+MIN_DATE = date(1900, 1, 1)
+MAX_DATE = date(9000, 12, 31)
+
+
+def _parse_date(value):
+    try:
+        parsed = date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+    return min(max(parsed, MIN_DATE), MAX_DATE) if parsed else None
+
+
+def parse_filters(params):
+    """GET parametrelerinden normalize filtre sözlüğü - geçersiz değerler yok sayılır"""
+    status = params.get('status', 'all')
+    return {
+        'q': (params.get('q') or '').strip()[:100],
+        'status': status if status in dict(STATUS_CHOICES) else 'all',
+        'date_from': _parse_date(params.get('date_from')),
+        'date_to': _parse_date(params.get('date_to')),
+        'subject': (params.get('subject') or '').strip()[:200],
+    }
+
+
+def filter_query(filters):
+    """Filtreler için querystring (imleç hariç) - sayfa linkleri ve JS için"""
+    from django.utils.http import urlencode
+
+    return urlencode({
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in filters.items()
+        if value and not (key == 'status' and value == 'all')
+    })
+
+
+def _midnight(day):
+    return timezone.make_aware(datetime.combine(day, time.min), timezone.get_current_timezone())
+
+
+def filtered_queryset(filters):
+    from contact.models import Contact
+
+    queryset = Contact.objects.all()
+    if filters['status'] == 'unread':
+        queryset = queryset.filter(is_read=False)
+    elif filters['status'] == 'read':
+        queryset = queryset.filter(is_read=True)
+    if filters['date_from']:
+        queryset = queryset.filter(created_at__gte=_midnight(filters['date_from']))
+    if filters['date_to']:
+        queryset = queryset.filter(created_at__lt=_midnight(filters['date_to'] + timedelta(days=1)))
+    if filters['subject']:
+        queryset = queryset.filter(subject__icontains=filters['subject'])
+    if filters['q']:
+        search = Q()
+        for field in SEARCH_FIELDS:
+            search |= Q(**{f'{field}__icontains': filters['q']})
+        queryset = queryset.filter(search)
+    return queryset
+
+
+# ========================
+# Keyset sayfalama
+# ========================
+
+def encode_cursor(message):
+    raw = f'{int(message.is_read)}|{message.created_at.astimezone(dt_timezone.utc).isoformat()}|{message.pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """(is_read, created_at, id) - geçersiz imleçte None (ilk sayfa)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        is_read, created_at, pk = raw.split('|')
+        created_at = datetime.fromisoformat(created_at)
+        if timezone.is_naive(created_at) or is_read not in ('0', '1'):
+            return None
+        return is_read == '1', created_at, int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _after(is_read, created_at, pk):
+    """(is_read ASC, created_at DESC, id DESC) sırasında imleçten sonraki satırlar"""
+    later = Q(is_read=is_read) & (Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+    if not is_read:
+        later |= Q(is_read=True)
+    return later
+
+
+def get_page(filters, cursor=None, size=None):
+    """
+    Filtrelenmiş mesajlardan bir sayfa - tek sorgu
+
+    Returns:
+        dict: {'messages': [...], 'next_cursor': str veya None, 'cursor': str veya None}
+    """
+    config = get_inbox_settings()
+    size = max(1, min(size or config['PAGE_SIZE'], config['MAX_PAGE_SIZE']))
+
+    queryset = filtered_queryset(filters)
+    position = decode_cursor(cursor)
+    if position is not None:
+        queryset = queryset.filter(_after(*position))
+    else:
+        cursor = None
+
+    messages = list(queryset.order_by('is_read', '-created_at', '-pk')[:size + 1])
+    next_cursor = encode_cursor(messages[size - 1]) if len(messages) > size else None
+    return {'messages': messages[:size], 'next_cursor': next_cursor, 'cursor': cursor}
+
+
+def serialize(message):
+    """JSON endpoint için mesaj"""
+    return {
+        'id': message.pk,
+        'name': message.name,
+        'email': message.email,
+        'subject': message.subject,
+        'created_at': timezone.localtime(message.created_at).isoformat(),
+        'is_read': message.is_read,
+    }
+
+
+# ========================
+# Sayaçlar
+# ========================
+
+def get_counts():
+    """
+    Mesaj ve yorum sayaçları - tablo başına tek koşullu aggregate
+
+    Returns:
+        dict: total_messages, unread_count, total_reviews, pending_reviews,
+              approved_reviews, avg_rating
+    """
+    from contact.models import Contact
+    from reviews.models import Review
+
+    message_stats = Contact.objects.aggregate(
+        total_messages=Count('pk'),
+        unread_count=Count('pk', filter=Q(is_read=False)),
+    )
+    review_stats = Review.objects.aggregate(
+        total_reviews=Count('pk'),
+        pending_reviews=Count('pk', filter=Q(is_approved=False)),
+        approved_reviews=Count('pk', filter=Q(is_approved=True)),
+        avg_rating=Avg('rating', filter=Q(is_approved=True)),
+    )
+    counts = {**message_stats, **review_stats}
+    counts['avg_rating'] = round(counts['avg_rating'] or 0, 1)
+    return counts
+
+
+# ========================
+# Okundu işaretleme
+# ========================
+
+def parse_ids(values):
+    """POST'tan gelen id listesi ('1,2,3' veya tekrarlı alan) - geçersizler atlanır"""
+    ids = []
+    for value in values:
+        for part in str(value).split(','):
+            part = part.strip()
+            if part.isdigit():
+                ids.append(int(part))
+    return list(dict.fromkeys(ids))[:get_inbox_settings()['MAX_IDS']]
+
+
+def mark_read(ids=None, filters=None):
+    """
+    Mesajları okundu işaretle - tek UPDATE
+
+    ids verilirse sadece onlar, filters verilirse filtreye uyan tüm mesajlar,
+    ikisi de yoksa tüm okunmamışlar.
+
+    Returns:
+        int: güncellenen mesaj sayısı
+    """
+    from contact.models import Contact
+
+    queryset = filtered_queryset(filters) if filters else Contact.objects.all()
+    if ids is not None:
+        if not ids:
+            return 0
+        queryset = queryset.filter(pk__in=ids)
+    return queryset.filter(is_read=False).update(is_read=True)
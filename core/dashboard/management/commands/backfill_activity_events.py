@@ -0,0 +1,42 @@
+# dashboard/management/commands/backfill_activity_events.py
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from dashboard import activity
+from dashboard.models import ActivityEvent
+
+
+class Command(BaseCommand):
+    help = 'Mevcut ürün / yorum / mesaj / kategori kayıtlarından aktivite olaylarını oluşturur'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Sadece son N günde oluşturulan kayıtlar (varsayılan: tümü)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Toplu yazma boyutu (varsayılan: DASHBOARD_ACTIVITY BATCH_SIZE)',
+        )
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options['days']) if options['days'] else None
+
+        self.stdout.write(self.style.SUCCESS('🕒 Aktivite Geçmişi'))
+        before = ActivityEvent.objects.count()
+        started = time.perf_counter()
+        scanned = activity.backfill(since=since, batch_size=options['batch_size'])
+        elapsed = (time.perf_counter() - started) * 1000
+        created = ActivityEvent.objects.count() - before
+
+        for label, count in scanned.items():
+            self.stdout.write(f'   {label:<20} {count:>8} kayıt tarandı')
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {created} yeni olay ({before + created} toplam, {elapsed:.0f} ms)'
+        ))
@@ -0,0 +1,81 @@
+# dashboard/management/commands/rebuild_daily_stats.py
+
+import time
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from dashboard import analytics
+
+
+class Command(BaseCommand):
+    help = 'Günlük istatistik özet tablosunu (DailyStats) kaynak tablolardan yeniden kurar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Sadece son N gün (varsayılan: tümü)',
+        )
+        parser.add_argument(
+            '--since',
+            help='Bu tarihten itibaren (YYYY-AA-GG)',
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Yazmadan, özet tabloyu kaynak tablolarla aylık karşılaştır',
+        )
+
+    def handle(self, *args, **options):
+        start = None
+        if options['since']:
+            try:
+                start = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError(f"Geçersiz tarih: {options['since']}")
+        elif options['days']:
+            start = analytics.today() - timedelta(days=options['days'] - 1)
+
+        if options['check']:
+            self._check(start)
+            return
+
+        self.stdout.write(self.style.SUCCESS('📊 Günlük İstatistikler'))
+        started = time.perf_counter()
+        count = analytics.rebuild(start=start)
+        elapsed = (time.perf_counter() - started) * 1000
+        scope = f'{start} - bugün' if start else 'tüm kayıtlar'
+        self.stdout.write(self.style.SUCCESS(f'✅ {count} gün yazıldı ({scope}, {elapsed:.0f} ms)'))
+
+    def _check(self, start):
+        from dashboard.models import DailyStats
+
+        end = analytics.today()
+        if start is None:
+            # En eski kayıt - özet tabloda veya kaynak tablolarda
+            firsts = [DailyStats.objects.aggregate(first=Min('date'))['first']]
+            for label in analytics.SOURCES:
+                first = apps.get_model(label)._base_manager.aggregate(first=Min('created_at'))['first']
+                firsts.append(timezone.localdate(first) if first else None)
+            start = min((first for first in firsts if first), default=end)
+
+        rollup = analytics.series(start, end, analytics.MONTH)
+        live = analytics.live_series(start, end, analytics.MONTH)
+        mismatches = 0
+        for stored, actual in zip(rollup, live):
+            if stored == actual:
+                continue
+            mismatches += 1
+            diff = ', '.join(
+                f'{field}: {stored[field]} != {actual[field]}'
+                for field in analytics.METRICS if stored[field] != actual[field]
+            )
+            self.stdout.write(self.style.ERROR(f"❌ {stored['date']:%Y-%m}: {diff}"))
+
+        if mismatches:
+            raise CommandError(f'{mismatches} ay tutarsız - komutu --check olmadan çalıştırın')
+        self.stdout.write(self.style.SUCCESS(f'✅ Özet tablo güncel ({start} - {end})'))
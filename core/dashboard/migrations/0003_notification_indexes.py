@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_delete_businesssettings'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['is_read', '-created_at'], name='dashboard_notif_read_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:20
+
+from datetime import datetime
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+# dashboard.analytics.SOURCES'un bu migration anındaki kopyası
+SOURCES = {
+    'products.Product': {
+        'products': None,
+        'active_products': Q(is_active=True),
+    },
+    'reviews.Review': {
+        'reviews': None,
+        'approved_reviews': Q(is_approved=True),
+    },
+    'contact.Contact': {
+        'messages': None,
+    },
+}
+
+
+def backfill_daily_stats(apps, schema_editor):
+    """Mevcut kayıtları yerel gün bazında say - model başına tek gruplu sorgu"""
+    tzinfo = timezone.get_current_timezone()
+    merged = {}
+    for label, fields in SOURCES.items():
+        rows = (
+            apps.get_model(label)._base_manager
+            .annotate(day=TruncDay('created_at', tzinfo=tzinfo))
+            .values('day')
+            .annotate(**{
+                field: Count('pk', filter=condition) if condition is not None else Count('pk')
+                for field, condition in fields.items()
+            })
+            .order_by()
+        )
+        for row in rows:
+            day = row.pop('day')
+            if isinstance(day, datetime):
+                day = (timezone.localtime(day, tzinfo) if timezone.is_aware(day) else day).date()
+            merged.setdefault(day, {}).update(row)
+
+    DailyStats = apps.get_model('dashboard', 'DailyStats')
+    DailyStats.objects.bulk_create(
+        [DailyStats(date=day, **counts) for day, counts in sorted(merged.items())],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0003_notification_indexes'),
+        ('products', '0006_product_indexes'),
+        ('reviews', '0002_review_indexes'),
+        ('contact', '0002_contact_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='Tarih')),
+                ('products', models.PositiveIntegerField(default=0, verbose_name='Ürün')),
+                ('active_products', models.PositiveIntegerField(default=0, verbose_name='Aktif Ürün')),
+                ('reviews', models.PositiveIntegerField(default=0, verbose_name='Yorum')),
+                ('approved_reviews', models.PositiveIntegerField(default=0, verbose_name='Onaylı Yorum')),
+                ('messages', models.PositiveIntegerField(default=0, verbose_name='Mesaj')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Güncelleme Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Günlük İstatistik',
+                'verbose_name_plural': 'Günlük İstatistikler',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.RunPython(backfill_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.4 on 2026-10-18 15:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+BATCH_SIZE = 1000
+
+
+# dashboard.activity.SOURCES'un bu migration anındaki kopyası
+def _product(product):
+    category = product.category.name if product.category_id else '-'
+    return 'product_added', f'Yeni ürün eklendi: {product.name}', f'{category} kategorisine eklendi'
+
+
+def _review(review):
+    return 'review_added', f'{review.rating} yıldızlı yorum alındı', f'{review.name} tarafından'
+
+
+def _message(message):
+    return 'message_received', f'Yeni mesaj: {message.subject}', f'{message.name} tarafından gönderildi'
+
+
+def _category(category):
+    return 'category_added', f'Yeni kategori eklendi: {category.name}', 'Ürün kataloğuna eklendi'
+
+
+SOURCES = {
+    ('products', 'Product'): (_product, ('category',)),
+    ('reviews', 'Review'): (_review, ()),
+    ('contact', 'Contact'): (_message, ()),
+    ('products', 'Category'): (_category, ()),
+}
+
+
+def backfill_activity_events(apps, schema_editor):
+    """Mevcut kayıtlardan kaynak başına bir olay üret"""
+    ActivityEvent = apps.get_model('dashboard', 'ActivityEvent')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    for (app_label, model_name), (describe, related) in SOURCES.items():
+        model = apps.get_model(app_label, model_name)
+        content_type, _ = ContentType.objects.get_or_create(
+            app_label=app_label, model=model_name.lower(),
+        )
+        batch = []
+        for instance in model._base_manager.select_related(*related).order_by('pk').iterator(chunk_size=BATCH_SIZE):
+            event_type, title, description = describe(instance)
+            batch.append(ActivityEvent(
+                type=event_type,
+                title=title[:255],
+                description=description[:255],
+                content_type=content_type,
+                object_id=instance.pk,
+                created_at=instance.created_at or timezone.now(),
+            ))
+            if len(batch) >= BATCH_SIZE:
+                ActivityEvent.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        if batch:
+            ActivityEvent.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('dashboard', '0004_dailystats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('product_added', 'Ürün Eklendi'), ('review_added', 'Yorum Alındı'), ('message_received', 'Mesaj Alındı'), ('category_added', 'Kategori Eklendi')], max_length=30, verbose_name='Tip')),
+                ('title', models.CharField(max_length=255, verbose_name='Başlık')),
+                ('description', models.CharField(blank=True, max_length=255, verbose_name='Açıklama')),
+                ('object_id', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(verbose_name='Tarih')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Aktivite',
+                'verbose_name_plural': 'Aktiviteler',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['created_at', 'type'], name='dashboard_activity_time_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id', 'type'), name='dashboard_activity_source_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_activity_events, migrations.RunPython.noop),
+    ]
@@ -174,6 +174,10 @@ class Notification(models.Model):
         verbose_name = 'Bildirim'
         verbose_name_plural = 'Bildirimler'
         ordering = ['-created_at']
+        indexes = [
+            # Okunmamış bildirim rozeti ve son bildirimler
+            models.Index(fields=['is_read', '-created_at'], name='dashboard_notif_read_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.get_notification_type_display()}"
@@ -188,6 +192,96 @@ class Notification(models.Model):
             redirect_url=redirect_url
         )
 
+class DailyStats(models.Model):
+    """
+    Günlük içerik sayıları - dashboard grafikleri için özet tablo
+
+    Ürün / yorum / mesaj kayıtlarından (oluşturulma gününe göre, yerel saat)
+    türetilir; save/delete sinyalleriyle güncellenir (dashboard.analytics),
+    rebuild_daily_stats komutuyla baştan hesaplanır.
+    """
+    date = models.DateField('Tarih', unique=True)
+    products = models.PositiveIntegerField('Ürün', default=0)
+    active_products = models.PositiveIntegerField('Aktif Ürün', default=0)
+    reviews = models.PositiveIntegerField('Yorum', default=0)
+    approved_reviews = models.PositiveIntegerField('Onaylı Yorum', default=0)
+    messages = models.PositiveIntegerField('Mesaj', default=0)
+    updated_at = models.DateTimeField('Güncelleme Tarihi', auto_now=True)
+
+    class Meta:
+        verbose_name = 'Günlük İstatistik'
+        verbose_name_plural = 'Günlük İstatistikler'
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.date}: {self.products} ürün, {self.reviews} yorum, {self.messages} mesaj"
+
+
+class ActivityEvent(models.Model):
+    """
+    Aktivite geçmişi - sadece ekleme yapılan olay tablosu
+
+    Ürün / yorum / mesaj / kategori oluşturulduğunda sinyalle yazılır
+    (dashboard.activity); mevcut kayıtlar backfill_activity_events komutuyla
+    aktarılır. Başlık ve açıklama olay anındaki haliyle saklanır.
+    """
+    TYPE_CHOICES = (
+        ('product_added', 'Ürün Eklendi'),
+        ('review_added', 'Yorum Alındı'),
+        ('message_received', 'Mesaj Alındı'),
+        ('category_added', 'Kategori Eklendi'),
+    )
+
+    # Tip -> (ikon, renk)
+    DISPLAY = {
+        'product_added': ('fas fa-plus', 'primary'),
+        'review_added': ('fas fa-star', 'success'),
+        'message_received': ('fas fa-envelope', 'info'),
+        'category_added': ('fas fa-tags', 'info'),
+    }
+
+    type = models.CharField('Tip', max_length=30, choices=TYPE_CHOICES)
+    title = models.CharField('Başlık', max_length=255)
+    description = models.CharField('Açıklama', max_length=255, blank=True)
+
+    # Olayın kaynağı
+    content_type = models.ForeignKey('contenttypes.ContentType', on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+
+    # Kaynak kaydın oluşturulma zamanı
+    created_at = models.DateTimeField('Tarih')
+
+    class Meta:
+        verbose_name = 'Aktivite'
+        verbose_name_plural = 'Aktiviteler'
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # Zaman sıralı keyset sayfalama + tip filtresi
+            models.Index(fields=['created_at', 'type'], name='dashboard_activity_time_idx'),
+        ]
+        constraints = [
+            # Backfill tekrar çalıştırılabilsin - kaynak başına tek olay
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id', 'type'], name='dashboard_activity_source_uniq',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_type_display()}: {self.title}"
+
+    @property
+    def time(self):
+        return self.created_at
+
+    @property
+    def icon(self):
+        return self.DISPLAY.get(self.type, ('fas fa-bell', 'primary'))[0]
+
+    @property
+    def color(self):
+        return self.DISPLAY.get(self.type, ('fas fa-bell', 'primary'))[1]
+
+
 class DashboardTranslationSettings(models.Model):
     """Dashboard çeviri ayarları - Constants kullanarak optimize edilmiş"""
     
@@ -1,10 +1,11 @@
 # dashboard/signals.py - yeni dosya oluşturun
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from contact.models import Contact
 from reviews.models import Review
-from products.models import Product
+from products.models import Category, Product
 from .models import MediaMention
+from . import activity, analytics
 from .utils import create_message_notification, create_review_notification, create_product_notification
 
 @receiver(post_save, sender=Contact)
@@ -23,4 +24,25 @@ def create_review_notification_signal(sender, instance, created, **kwargs):
 def create_product_notification_signal(sender, instance, created, **kwargs):
     """Yeni ürün eklendiğinde bildirim oluştur"""
     if created:
-        create_product_notification(instance)
\ No newline at end of file
+        create_product_notification(instance)
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Review)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Contact)
+@receiver(post_delete, sender=Review)
+@receiver(post_delete, sender=Product)
+def update_daily_stats_signal(sender, instance, **kwargs):
+    """Günlük istatistik özetini güncelle (kaydın oluşturulduğu gün)"""
+    analytics.schedule_refresh(instance)
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_save, sender=Review)
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Category)
+def record_activity_signal(sender, instance, created, **kwargs):
+    """Yeni kayıt için aktivite geçmişine olay ekle"""
+    if created:
+        activity.record(instance)
@@ -117,6 +117,10 @@ ajax_patterns = [
     path('ajax/gallery/list/', views.gallery_list, name='ajax_gallery_list'),
     path('ajax/gallery/edit/<int:pk>/', views.gallery_edit, name='ajax_gallery_edit'),
     
+    # AJAX Message endpoints (sonsuz kaydırma, okundu işaretleme)
+    path('ajax/messages/', views.messages_api, name='ajax_messages'),
+    path('ajax/messages/mark-read/', views.messages_mark_read, name='ajax_messages_mark_read'),
+    
     # AJAX Product endpoints  
     path('ajax/products/edit/<int:pk>/', views.product_edit, name='ajax_product_edit'),
     
@@ -21,13 +21,13 @@ from home.models import CarouselSlide
 from products.models import Category, Product
 from reviews.models import Review
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import Count
+from django.db.models import Count, Q
 from django.contrib.auth.views import LogoutView
 from django.contrib.auth.decorators import login_required
 from django.contrib.admin.views.decorators import staff_member_required
 from django.views.decorators.cache import never_cache
 from django.db import transaction
-from .forms import ProfileForm, BusinessSettingsForm, CustomPasswordChangeForm
+from .forms import ProfileForm, BusinessSettingsForm, CustomPasswordChangeForm, CustomUserCreationForm, CustomUserChangeForm
 
 
 from django.http import JsonResponse
@@ -35,7 +35,7 @@ from django.template.loader import render_to_string
 from django.views import View
 from django.http import JsonResponse
 from django.contrib.admin.views.decorators import staff_member_required
-from core.utils import check_cloudinary_storage
+from core.client_ip import get_client_ip
 
 from axes.decorators import axes_dispatch
 from axes.helpers import get_failure_limit
@@ -76,12 +76,6 @@ def dashboard_login(request):
     was_limited = getattr(request, 'limited', False)
     
     # IP adresini al
-    def get_client_ip(request):
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR')
-    
     ip_address = get_client_ip(request)
     
     # Başarısız deneme sayısını kontrol et
@@ -159,140 +153,68 @@ def dashboard_login(request):
 # Dashboard Ana Sayfa
 @staff_member_required(login_url='dashboard:dashboard_login')
 def dashboard_home(request):
-    from django.db.models import Count, Q
-    from django.utils import timezone
-    from datetime import datetime, timedelta
     from core.models import SiteSettings
+    from . import activity, analytics
     
-    site_settings = SiteSettings.get_current()
-    
-    # Temel istatistikler
-    categories = Category.objects.annotate(product_count=Count('product')).order_by('name')
-    rating_counts = Review.objects.values('rating').annotate(count=Count('rating')).order_by('rating')
-    rating_dict = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for item in rating_counts:
-        rating_dict[item['rating']] = item['count']
-    
-    # Son 30 günün aktiviteleri
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    recent_activities = []
-    
-    # Son eklenen ürünler
-    recent_products = Product.objects.filter(created_at__gte=thirty_days_ago).order_by('-created_at')[:3]
-    for product in recent_products:
-        recent_activities.append({
-            'type': 'product_added',
-            'title': f'Yeni ürün eklendi: {product.name}',
-            'description': f'{product.category.name} kategorisine eklendi',
-            'time': product.created_at,
-            'icon': 'fas fa-plus',
-            'color': 'primary'
+    # Ajax bildirim kontrolü - sadece iki EXISTS sorgusu
+    if request.GET.get('ajax'):
+        return JsonResponse({
+            'has_new_notifications': Contact.objects.filter(is_read=False).exists() or Review.objects.filter(is_approved=False).exists()
         })
     
-    # Son yorumlar
-    recent_reviews = Review.objects.filter(created_at__gte=thirty_days_ago).order_by('-created_at')[:3]
-    for review in recent_reviews:
-        recent_activities.append({
-            'type': 'review_added',
-            'title': f'{review.rating} yıldızlı yorum alındı',
-            'description': f'{review.name} tarafından',
-            'time': review.created_at,
-            'icon': 'fas fa-star',
-            'color': 'success'
-        })
+    site_settings = SiteSettings.get_current()
     
-    # Son mesajlar
-    recent_messages = Contact.objects.filter(created_at__gte=thirty_days_ago).order_by('-created_at')[:2]
-    for message in recent_messages:
-        recent_activities.append({
-            'type': 'message_received',
-            'title': f'Yeni mesaj: {message.subject}',
-            'description': f'{message.name} tarafından gönderildi',
-            'time': message.created_at,
-            'icon': 'fas fa-envelope',
-            'color': 'info'
-        })
+    # Temel istatistikler - model başına tek sorgu
+    categories = Category.objects.annotate(product_count=Count('product')).order_by('name')
+    product_stats = Product.objects.aggregate(
+        total=Count('pk'),
+        low_stock=Count('pk', filter=Q(stock__lte=5, stock__isnull=False)),
+    )
+    review_stats = Review.objects.aggregate(
+        total=Count('pk'),
+        pending=Count('pk', filter=Q(is_approved=False)),
+        **{f'rating_{rating}': Count('pk', filter=Q(rating=rating)) for rating in range(1, 6)}
+    )
+    rating_dict = {rating: review_stats[f'rating_{rating}'] for rating in range(1, 6)}
+    unread_messages = Contact.objects.filter(is_read=False).count()
     
-    # Aktiviteleri tarihe göre sırala
-    recent_activities.sort(key=lambda x: x['time'], reverse=True)
-    recent_activities = recent_activities[:8]
+    # Son aktiviteler - olay tablosundan tek sorgu
+    recent_activities = activity.latest()
     
     categories_with_counts = Category.objects.annotate(
         product_count=Count('product', filter=Q(product__is_active=True))
     ).filter(product_count__gt=0).order_by('-product_count')
     
-    # Aylık istatistikler (son 6 ay)
-    monthly_stats = []
-    now = timezone.now()
-    
-    for i in range(6):
-        # Her ayın başını hesapla
-        if i == 0:
-            month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        else:
-            year = now.year
-            month = now.month - i
-            if month <= 0:
-                month += 12
-                year -= 1
-            month_start = datetime(year, month, 1, tzinfo=now.tzinfo)
-        
-        # Ayın sonu
-        if month_start.month == 12:
-            month_end = month_start.replace(year=month_start.year + 1, month=1)
-        else:
-            month_end = month_start.replace(month=month_start.month + 1)
-        
-        # O aydaki veriler
-        products_count = Product.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end,
-            is_active=True
-        ).count()
-        
-        reviews_count = Review.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).count()
-        
-        messages_count = Contact.objects.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).count()
-        
-        monthly_stats.append({
-            'month': month_start.strftime('%B'),
-            'month_short': month_start.strftime('%b'),
-            'products': products_count,
-            'reviews': reviews_count,
-            'messages': messages_count,
-            'year': month_start.year
-        })
-    
-    monthly_stats.reverse()
-    
-    # Debug çıktısı
-    print(f"Monthly stats count: {len(monthly_stats)}")
-    for stat in monthly_stats:
-        print(f"{stat['month_short']}: {stat['products']} products, {stat['reviews']} reviews, {stat['messages']} messages")
+    # Aylık istatistikler (son 6 ay) - günlük özet tablodan tek sorgu
+    monthly_stats = [
+        {
+            'month': stat['date'].strftime('%B'),
+            'month_short': stat['date'].strftime('%b'),
+            'products': stat['active_products'],
+            'reviews': stat['reviews'],
+            'messages': stat['messages'],
+            'year': stat['date'].year,
+        }
+        for stat in analytics.monthly_series()
+    ]
     
     context = {
-        'total_products': Product.objects.count(),
+        'total_products': product_stats['total'],
         'total_categories': Category.objects.count(),
-        'total_reviews': Review.objects.count(),
+        'total_reviews': review_stats['total'],
         'total_media_mentions': MediaMention.objects.count(),
-        'recent_products': Product.objects.order_by('-created_at')[:5],
+        'recent_products': Product.objects.select_related('category').order_by('-created_at')[:5],
         'recent_reviews': Review.objects.order_by('-created_at')[:5],
-        'unread_messages': Contact.objects.filter(is_read=False).count(),
+        'unread_messages': unread_messages,
         'categories': categories,
         'rating_counts': rating_dict,
         'recent_activities': recent_activities,
         'monthly_stats': monthly_stats,
-        'low_stock_products': Product.objects.filter(stock__lte=5, stock__isnull=False).count(),
-        'pending_reviews': Review.objects.filter(is_approved=False).count(),
+        'low_stock_products': product_stats['low_stock'],
+        'pending_reviews': review_stats['pending'],
         'recent_unread_messages': Contact.objects.filter(is_read=False).order_by('-created_at')[:3],
         'recent_unapproved_reviews': Review.objects.filter(is_approved=False).order_by('-created_at')[:3],
-        'has_notifications': Contact.objects.filter(is_read=False).exists() or Review.objects.filter(is_approved=False).exists(),
+        'has_notifications': bool(unread_messages or review_stats['pending']),
         'categories_with_counts': categories_with_counts,
         'translation_enabled': site_settings.translation_enabled,
         'activities_url': reverse('dashboard:activities_list'),
@@ -328,11 +250,6 @@ def dashboard_home(request):
         ]
     }
     
-    if request.GET.get('ajax'):
-        return JsonResponse({
-            'has_new_notifications': Contact.objects.filter(is_read=False).exists() or Review.objects.filter(is_approved=False).exists()
-        })
-    
     return render(request, 'dashboard/index.html', context)
 
 
@@ -340,64 +257,32 @@ def dashboard_home(request):
 
 @staff_member_required(login_url='dashboard:dashboard_login')
 def chart_data_api(request, chart_id):
-    from django.http import JsonResponse
-    from django.utils import timezone
-    from datetime import datetime, timedelta
-    
-    period = int(request.GET.get('period', 7))
-    end_date = timezone.now()
+    """
+    Grafik verisi - günlük özet tablodan tek sorgu (dashboard.analytics)
+
+    ?period=N: son N gün (uzun dönemler aylık gruplanır); verilmezse ana
+    sayfa grafiğiyle aynı aylık seri.
+    """
+    from . import analytics
     
     if chart_id == 'monthlyChart':
-        # Period'a göre aylık istatistikler
-        monthly_stats = []
-        
-        for i in range(6):  # Son 6 ay
-            if i == 0:
-                month_start = end_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            else:
-                year = end_date.year
-                month = end_date.month - i
-                if month <= 0:
-                    month += 12
-                    year -= 1
-                month_start = datetime(year, month, 1, tzinfo=end_date.tzinfo)
-            
-            if month_start.month == 12:
-                month_end = month_start.replace(year=month_start.year + 1, month=1)
-            else:
-                month_end = month_start.replace(month=month_start.month + 1)
-            
-            products_count = Product.objects.filter(
-                created_at__gte=month_start,
-                created_at__lt=month_end,
-                is_active=True
-            ).count()
-            
-            reviews_count = Review.objects.filter(
-                created_at__gte=month_start,
-                created_at__lt=month_end
-            ).count()
-            
-            messages_count = Contact.objects.filter(
-                created_at__gte=month_start,
-                created_at__lt=month_end
-            ).count()
-            
-            monthly_stats.append({
-                'month_short': month_start.strftime('%b'),
-                'products': products_count,
-                'reviews': reviews_count,
-                'messages': messages_count
-            })
-        
-        monthly_stats.reverse()
+        period = request.GET.get('period')
+        if period is None:
+            granularity, stats = analytics.MONTH, analytics.monthly_series()
+        else:
+            try:
+                granularity, stats = analytics.period_series(int(period))
+            except ValueError:
+                return JsonResponse({'error': 'Invalid period'}, status=400)
         
+        label_format = '%b' if granularity == analytics.MONTH else '%d.%m'
         return JsonResponse({
-            'labels': [stat['month_short'] for stat in monthly_stats],
+            'labels': [stat['date'].strftime(label_format) for stat in stats],
+            'granularity': granularity,
             'datasets': [
                 {
                     'label': 'Ürünler',
-                    'data': [stat['products'] for stat in monthly_stats],
+                    'data': [stat['active_products'] for stat in stats],
                     'borderColor': 'rgba(102, 126, 234, 1)',
                     'backgroundColor': 'rgba(102, 126, 234, 0.1)',
                     'tension': 0.4,
@@ -409,7 +294,7 @@ def chart_data_api(request, chart_id):
                 },
                 {
                     'label': 'Yorumlar',
-                    'data': [stat['reviews'] for stat in monthly_stats],
+                    'data': [stat['reviews'] for stat in stats],
                     'borderColor': 'rgba(17, 153, 142, 1)',
                     'backgroundColor': 'rgba(17, 153, 142, 0.1)',
                     'tension': 0.4,
@@ -421,7 +306,7 @@ def chart_data_api(request, chart_id):
                 },
                 {
                     'label': 'Mesajlar',
-                    'data': [stat['messages'] for stat in monthly_stats],
+                    'data': [stat['messages'] for stat in stats],
                     'borderColor': 'rgba(255, 193, 7, 1)',
                     'backgroundColor': 'rgba(255, 193, 7, 0.1)',
                     'tension': 0.4,
@@ -640,100 +525,89 @@ from django.shortcuts import render, redirect, get_object_or_404
 
 @staff_member_required(login_url='dashboard:dashboard_login')
 def messages_list(request):
-    # Toplu okundu işaretleme kontrolü
-    if request.method == 'POST' and 'mark_all_read' in request.POST:
-        unread_count = Contact.objects.filter(is_read=False).update(is_read=True)
-        messages.success(request, f'{unread_count} mesaj okundu olarak işaretlendi.')
-        return redirect('dashboard:dashboard_messages')
-    
-    # Tek mesaj okundu işaretleme
-    if request.method == 'POST' and 'mark_read' in request.POST:
-        message_id = request.POST.get('mark_read')
-        try:
-            message = Contact.objects.get(id=message_id, is_read=False)
-            message.is_read = True
-            message.save()
-            messages.success(request, 'Mesaj okundu olarak işaretlendi.')
-        except Contact.DoesNotExist:
-            messages.error(request, 'Mesaj bulunamadı.')
-        return redirect('dashboard:dashboard_messages')
-    
-    # Mesajları getir - okunmamışlar önce
-    contact_messages = Contact.objects.all().order_by('is_read', '-created_at')
-    customer_reviews = Review.objects.all().order_by('-created_at')
+    """Mesaj kutusu - filtreli, imleç tabanlı sayfalama (dashboard.inbox)"""
+    from . import inbox
     
-    # İstatistikler
-    unread_count = Contact.objects.filter(is_read=False).count()
-    pending_reviews = Review.objects.filter(is_approved=False).count()  # Doğru hesaplama
-    approved_reviews = Review.objects.filter(is_approved=True).count()
-    
-    # Ortalama puan hesaplama
-    reviews_with_rating = Review.objects.filter(is_approved=True)
-    avg_rating = reviews_with_rating.aggregate(
-        avg_rating=models.Avg('rating')
-    )['avg_rating'] or 0
-    
-    # GET parametresi ile mesaj okundu olarak işaretlenebilir
-    # Mesaj detayı görüntülendiğinde otomatik okundu işaretle
-    if request.method == 'GET' and 'view_message' in request.GET:
-        message_id = request.GET.get('view_message')
-        try:
-            message = Contact.objects.get(id=message_id, is_read=False)
-            message.is_read = True
-            message.save()
-        except Contact.DoesNotExist:
-            pass
-
-    # Manuel okundu işaretleme
-    if request.method == 'POST' and 'mark_single_read' in request.POST:
-        message_id = request.POST.get('mark_single_read')
-        try:
-            message = Contact.objects.get(id=message_id, is_read=False)
-            message.is_read = True
-            message.save()
-            messages.success(request, 'Mesaj okundu olarak işaretlendi.')
-            return redirect('dashboard:dashboard_messages')
-        except Contact.DoesNotExist:
-            pass
+    filters = inbox.parse_filters(request.GET)
+    filter_query = inbox.filter_query(filters)
+    
+    # Okundu işaretleme - tek UPDATE, kayıt yüklenmez
+    if request.method == 'POST':
+        if 'mark_all_read' in request.POST:
+            count = inbox.mark_read()
+            messages.success(request, f'{count} mesaj okundu olarak işaretlendi.')
+        elif 'mark_selected_read' in request.POST:
+            count = inbox.mark_read(ids=inbox.parse_ids(request.POST.getlist('message_ids')))
+            messages.success(request, f'{count} mesaj okundu olarak işaretlendi.')
+        else:
+            message_id = request.POST.get('mark_read') or request.POST.get('mark_single_read')
+            if inbox.mark_read(ids=inbox.parse_ids([message_id or ''])):
+                messages.success(request, 'Mesaj okundu olarak işaretlendi.')
+            else:
+                messages.error(request, 'Mesaj bulunamadı.')
+        url = reverse('dashboard:dashboard_messages')
+        return redirect(f'{url}?{filter_query}' if filter_query else url)
     
-    # Toplu okundu işaretleme
-    if request.POST.get('mark_all_read'):
-        Contact.objects.filter(is_read=False).update(is_read=True)
-        messages.success(request, 'Tüm mesajlar okundu olarak işaretlendi.')
-        return redirect('dashboard:dashboard_messages')
+    page = inbox.get_page(filters, cursor=request.GET.get('cursor'))
     
     context = {
-        'contact_messages': contact_messages,
-        'customer_reviews': customer_reviews,
-        'unread_count': unread_count,
-        'pending_reviews': pending_reviews,
-        'approved_reviews': approved_reviews,
-        'avg_rating': round(avg_rating, 1),
-
-        # Table için gerekli header ve row verileri
-        'contact_table_headers': [
-            {'title': 'İsim', 'icon': 'fas fa-user'},
-            {'title': 'Konu', 'icon': 'fas fa-envelope'},
-            {'title': 'E-posta', 'icon': 'fas fa-at'},
-            {'title': 'Tarih', 'width': '120px'},
-            {'title': 'Durum', 'width': '100px', 'class': 'text-center'},
-            {'title': 'İşlemler', 'width': '150px', 'class': 'text-center'},
-        ],
-
-        'contact_table_rows': [
-            {
-                'id': message.id,
-                'name': message.name,
-                'subject': message.subject,
-                'email': message.email,
-                'created_at': message.created_at,
-                'is_read': message.is_read,
-            }
-            for message in contact_messages
-        ]
+        'contact_messages': page['messages'],
+        'next_cursor': page['next_cursor'],
+        'is_first_page': page['cursor'] is None,
+        'filters': filters,
+        'filter_query': filter_query,
+        'status_choices': inbox.STATUS_CHOICES,
+        'messages_api_url': reverse('dashboard:ajax_messages'),
+        'mark_read_url': reverse('dashboard:ajax_messages_mark_read'),
+        **inbox.get_counts(),
     }
     return render(request, 'dashboard/messages/list.html', context)
 
+
+@staff_member_required(login_url='dashboard:dashboard_login')
+def messages_api(request):
+    """Mesaj kutusu sonsuz kaydırma - sonraki sayfa JSON olarak"""
+    from . import inbox
+    
+    filters = inbox.parse_filters(request.GET)
+    try:
+        size = int(request.GET.get('size', 0)) or None
+    except ValueError:
+        size = None
+    page = inbox.get_page(filters, cursor=request.GET.get('cursor'), size=size)
+    
+    return JsonResponse({
+        'success': True,
+        'results': [inbox.serialize(message) for message in page['messages']],
+        'rows_html': render_to_string('dashboard/messages/message_rows.html', {
+            'contact_messages': page['messages'],
+        }, request=request),
+        'modals_html': render_to_string('dashboard/messages/message_modals.html', {
+            'contact_messages': page['messages'],
+        }, request=request),
+        'next_cursor': page['next_cursor'],
+    })
+
+
+@staff_member_required(login_url='dashboard:dashboard_login')
+def messages_mark_read(request):
+    """Mesajları okundu işaretle (ids: '1,2,3' veya tekrarlı alan) - JSON"""
+    from . import inbox
+    
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Geçersiz istek'}, status=405)
+    
+    ids = inbox.parse_ids(request.POST.getlist('ids'))
+    if not ids:
+        return JsonResponse({'success': False, 'error': 'Mesaj seçilmedi'}, status=400)
+    
+    updated = inbox.mark_read(ids=ids)
+    return JsonResponse({
+        'success': True,
+        'updated': updated,
+        'unread_count': Contact.objects.filter(is_read=False).count(),
+    })
+
 # Yorum durumu değiştirme view'ını ekle
 @staff_member_required(login_url='dashboard:dashboard_login')
 def review_status_toggle(request, id):
@@ -833,14 +707,18 @@ def gallery_list(request):
     else:
         galleries = galleries.order_by('-order', '-created_at')
     
-    # İstatistikleri hesapla
-    total_count = Gallery.objects.count()
-    active_count = Gallery.objects.filter(is_active=True).count()
-    featured_count = Gallery.objects.filter(is_featured=True).count()
-    
-    # Son 7 günde eklenen öğe sayısı
+    # İstatistikleri hesapla - tek sorgu (son 7 günde eklenenler dahil)
     seven_days_ago = timezone.now() - timedelta(days=7)
-    recent_count = Gallery.objects.filter(created_at__gte=seven_days_ago).count()
+    stats = Gallery.objects.aggregate(
+        total=Count('pk'),
+        active=Count('pk', filter=Q(is_active=True)),
+        featured=Count('pk', filter=Q(is_featured=True)),
+        recent=Count('pk', filter=Q(created_at__gte=seven_days_ago)),
+    )
+    total_count = stats['total']
+    active_count = stats['active']
+    featured_count = stats['featured']
+    recent_count = stats['recent']
     
     # Media type options for form
     media_type_options = [
@@ -1213,13 +1091,16 @@ def media_mentions_list(request):
         )
         enabled_languages = user_translation_settings.get_all_languages()
     
-    # CACHE'i önlemek için fresh queryset al
-    mentions = MediaMention.objects.select_related().all().order_by('-publish_date')
+    mentions = MediaMention.objects.all().order_by('-publish_date')
     
-    # ✅ İSTATİSTİKLERİ HESAPLA
-    total_mentions = mentions.count()
-    active_mentions_count = mentions.filter(is_active=True).count()
-    inactive_mentions_count = mentions.filter(is_active=False).count()
+    # ✅ İSTATİSTİKLERİ HESAPLA - tek sorgu
+    stats = MediaMention.objects.aggregate(
+        total=Count('pk'),
+        active=Count('pk', filter=Q(is_active=True)),
+    )
+    total_mentions = stats['total']
+    active_mentions_count = stats['active']
+    inactive_mentions_count = total_mentions - active_mentions_count
     
     form = MediaMentionFormWithTranslation(
         translation_enabled=translation_enabled,
@@ -1229,21 +1110,18 @@ def media_mentions_list(request):
     
     mentions_with_translations = []
     for mention in mentions:
-        # Database'den fresh data çek
-        fresh_mention = MediaMention.objects.get(pk=mention.pk)
-        
         mention_data = {
-            'object': fresh_mention,
+            'object': mention,
             'translations': {}
         }
 
-        # Her dil için çeviri verilerini AL - FRESH DATA
+        # Her dil için çeviri verilerini al
         for lang in enabled_languages:
             if lang != 'tr':
                 mention_data['translations'][lang] = {
-                    'title': getattr(fresh_mention, f'title_{lang}', ''),
-                    'source': getattr(fresh_mention, f'source_{lang}', ''),
-                    'description': getattr(fresh_mention, f'description_{lang}', ''),
+                    'title': getattr(mention, f'title_{lang}', ''),
+                    'source': getattr(mention, f'source_{lang}', ''),
+                    'description': getattr(mention, f'description_{lang}', ''),
                 }
 
         mentions_with_translations.append(mention_data)
@@ -2421,7 +2299,7 @@ def review_delete(request, pk):
 @staff_member_required(login_url='dashboard:dashboard_login')
 def category_products(request, category_id):
     category = get_object_or_404(Category, id=category_id)
-    products = Product.objects.filter(category=category)
+    products = Product.objects.filter(category=category).select_related('category')
     categories = Category.objects.all()
     form = ProductForm()  # Yeni ürün eklemek için boş form
     
@@ -2828,9 +2706,6 @@ def team_member_list(request):
     total_members = team_members.count()
     active_members = team_members.filter(is_active=True).count()
     
-    # Pozisyon sayısı (unique pozisyonlar)
-    positions_count = team_members.values('position').distinct().count()
-    
     # Ortalama sıralama
     avg_order_result = team_members.aggregate(avg_order=Avg('order'))
     avg_order = round(avg_order_result['avg_order'] or 0, 1)
@@ -2852,6 +2727,9 @@ def team_member_list(request):
         
         team_members_with_translations.append(member_data)
     
+    # Pozisyon sayısı (unique pozisyonlar) - üyeler zaten yüklendi, ayrı sorgu gerekmez
+    positions_count = len({member.position for member in team_members})
+    
     context = {
         'team_members': team_members,
         'team_members_with_translations': team_members_with_translations,
@@ -3318,97 +3196,31 @@ def user_toggle_status(request, user_id):
 
 @staff_member_required(login_url='dashboard:dashboard_login')
 def activities_list(request):
-    from django.utils import timezone
-    from datetime import datetime, timedelta
-    import json
+    """Aktivite geçmişi - ActivityEvent tablosundan keyset sayfalama (dashboard.activity)"""
+    from datetime import timedelta
+    from . import activity
     
     # Filtreleme parametreleri
-    days = int(request.GET.get('days', 30))  # Son kaç gün
-    activity_type = request.GET.get('type', 'all')  # Aktivite türü
-    
-    # Tarih aralığı
-    end_date = timezone.now()
-    start_date = end_date - timedelta(days=days)
-    
-    # Tüm aktiviteleri topla
-    all_activities = []
-    
-    # Ürün aktiviteleri
-    if activity_type in ['all', 'products']:
-        products = Product.objects.filter(created_at__gte=start_date).order_by('-created_at')
-        for product in products:
-            all_activities.append({
-                'type': 'product_added',
-                'title': f'Yeni ürün eklendi: {product.name}',
-                'description': f'{product.category.name} kategorisine eklendi',
-                'time': product.created_at,
-                'icon': 'fas fa-plus',
-                'color': 'primary',
-                'model': 'Product',
-                'object_id': product.id
-            })
-    
-    # Yorum aktiviteleri
-    if activity_type in ['all', 'reviews']:
-        reviews = Review.objects.filter(created_at__gte=start_date).order_by('-created_at')
-        for review in reviews:
-            all_activities.append({
-                'type': 'review_added',
-                'title': f'{review.rating} yıldızlı yorum alındı',
-                'description': f'{review.name} tarafından',
-                'time': review.created_at,
-                'icon': 'fas fa-star',
-                'color': 'success' if review.is_approved else 'warning',
-                'model': 'Review',
-                'object_id': review.id
-            })
-    
-    # Mesaj aktiviteleri
-    if activity_type in ['all', 'messages']:
-        messages = Contact.objects.filter(created_at__gte=start_date).order_by('-created_at')
-        for message in messages:
-            all_activities.append({
-                'type': 'message_received',
-                'title': f'Yeni mesaj: {message.subject}',
-                'description': f'{message.name} tarafından gönderildi',
-                'time': message.created_at,
-                'icon': 'fas fa-envelope',
-                'color': 'info' if message.is_read else 'danger',
-                'model': 'Contact',
-                'object_id': message.id
-            })
-    
-    # Kategori aktiviteleri
-    if activity_type in ['all', 'categories']:
-        categories = Category.objects.filter(created_at__gte=start_date).order_by('-created_at')
-        for category in categories:
-            all_activities.append({
-                'type': 'category_added',
-                'title': f'Yeni kategori eklendi: {category.name}',
-                'description': f'Toplam {category.product_set.count()} ürün içeriyor',
-                'time': category.created_at,
-                'icon': 'fas fa-tags',
-                'color': 'info',
-                'model': 'Category',
-                'object_id': category.id
-            })
-    
-    # Aktiviteleri tarihe göre sırala
-    all_activities.sort(key=lambda x: x['time'], reverse=True)
-    
-    # Sayfalama
-    paginator = Paginator(all_activities, 20)
-    page = request.GET.get('page')
     try:
-        activities = paginator.page(page)
-    except PageNotAnInteger:
-        activities = paginator.page(1)
-    except EmptyPage:
-        activities = paginator.page(paginator.num_pages)
+        days = int(request.GET.get('days', 30))  # Son kaç gün
+    except ValueError:
+        days = 30
+    days = max(1, min(days, activity.get_activity_settings()['MAX_DAYS']))
+    activity_type = request.GET.get('type', 'all')  # Aktivite türü
+    if activity_type not in activity.TYPE_FILTERS:
+        activity_type = 'all'
+    
+    # Tek sorgu: (created_at, id) imlecinden sonraki sayfa
+    page = activity.get_page(
+        types=activity.TYPE_FILTERS[activity_type],
+        since=timezone.now() - timedelta(days=days),
+        cursor=request.GET.get('cursor'),
+    )
     
     context = {
-        'activities': activities,
-        'total_activities': len(all_activities),
+        'activities': page['events'],
+        'next_cursor': page['next_cursor'],
+        'is_first_page': page['cursor'] is None,
         'days': days,
         'activity_type': activity_type,
         'activity_types': [
@@ -3710,7 +3522,7 @@ def pdf_catalog_management(request):
     """PDF Katalog Yönetimi Sayfası"""
     from core.models import SiteSettings
     
-    site_settings = SiteSettings.get_current()
+    site_settings = SiteSettings.get_current(cached=False)  # Değiştirilip kaydediliyor
     
     if request.method == 'POST':
         action = request.POST.get('action')
@@ -3981,7 +3793,7 @@ def business_settings(request):
     """Site ayarları düzenleme - SiteSettings kullanarak"""
     from core.models import SiteSettings
     
-    settings_obj = SiteSettings.get_current()
+    settings_obj = SiteSettings.get_current(cached=False)  # Form instance'ı
     
     if request.method == 'POST':
         form = BusinessSettingsForm(request.POST, request.FILES, instance=settings_obj)
@@ -4018,13 +3830,13 @@ def business_settings(request):
     })
     
     
-from core.utils import check_cloudinary_storage
+from core import storageusage
 
 def dashboard_index(request):
     # Mevcut kodlar...
     
-    # Cloudinary alan kullanımı
-    storage_info = check_cloudinary_storage()
+    # Cloudinary alan kullanımı (stale-while-revalidate cache)
+    storage_info = storageusage.get_storage_usage()
     
     context = {
         # Mevcut context...
@@ -4037,5 +3849,5 @@ def dashboard_index(request):
 @staff_member_required
 def storage_info_api(request):
     """Storage bilgilerini JSON olarak döner"""
-    storage_info = check_cloudinary_storage()
+    storage_info = storageusage.get_storage_usage()
     return JsonResponse(storage_info)
\ No newline at end of file
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0005_alter_gallery_cropped_image'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(fields=['is_active', 'media_type', 'order', '-created_at'], name='gallery_act_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', '-created_at'], name='gallery_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gallery',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_featured', True)), fields=['order', '-created_at'], name='gallery_featured_idx'),
+        ),
+    ]
@@ -53,6 +53,17 @@ class Gallery(AutoOrderMixin, SEOImageMixin, models.Model):
         verbose_name = "Galeri"
         verbose_name_plural = "Galeri"
         ordering = ['order', '-created_at']
+        indexes = [
+            # Resim / video sayfaları, ilgili öğeler
+            models.Index(fields=['is_active', 'media_type', 'order', '-created_at'], name='gallery_act_type_idx'),
+            # Galeri listesi, sitemap - sadece aktif öğeler
+            models.Index(fields=['order', '-created_at'], name='gallery_active_order_idx', condition=models.Q(is_active=True)),
+            # Öne çıkanlar (ana sayfa, galeri listesi)
+            models.Index(
+                fields=['order', '-created_at'], name='gallery_featured_idx',
+                condition=models.Q(is_active=True, is_featured=True),
+            ),
+        ]
 
     
 
@@ -1,8 +1,10 @@
 # gallery/views.py
-from django.shortcuts import render, get_object_or_404
+from django.shortcuts import render
 from django.core.paginator import Paginator
+from core import conditional, identity
 from .models import Gallery
 
+@conditional.listing(Gallery)
 def gallery_list(request):
     """Tüm galeri öğeleri listesi"""
     gallery_items = Gallery.objects.filter(is_active=True).order_by('order', '-created_at')
@@ -36,6 +38,7 @@ def gallery_list(request):
     
     return render(request, 'gallery/gallery_list.html', context)
 
+@conditional.listing(Gallery)
 def gallery_images(request):
     """Sadece resim galerisi"""
     gallery_items = Gallery.objects.filter(
@@ -60,6 +63,7 @@ def gallery_images(request):
     
     return render(request, 'gallery/gallery_images.html', context)
 
+@conditional.listing(Gallery)
 def gallery_videos(request):
     """Sadece video galerisi"""
     gallery_items = Gallery.objects.filter(
@@ -84,9 +88,12 @@ def gallery_videos(request):
     
     return render(request, 'gallery/gallery_videos.html', context)
 
+@conditional.detail(
+    Gallery, lambda slug: {'slug': slug, 'is_active': True}, dependencies=[Gallery],  # Önceki/sonraki öğeler
+)
 def gallery_detail(request, slug):
     """Galeri öğesi detay sayfası"""
-    gallery_item = get_object_or_404(Gallery, slug=slug, is_active=True)
+    gallery_item = identity.get_object_or_404(request, Gallery, slug=slug, is_active=True)
     
     # İlgili diğer öğeler (aynı medya tipinden)
     related_items = Gallery.objects.filter(
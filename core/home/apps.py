@@ -10,4 +10,5 @@ class HomeConfig(AppConfig):
         try:
             import home.translation  # Translation dosyasını import et
         except ImportError:
-            pass
\ No newline at end of file
+            pass
+        import home.sections  # Bölüm cache warmup sinyali
\ No newline at end of file
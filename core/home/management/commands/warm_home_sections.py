@@ -0,0 +1,46 @@
+# home/management/commands/warm_home_sections.py
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from home import sections
+
+
+class Command(BaseCommand):
+    help = 'Ana sayfa bölüm fragment\'larını aktif diller için önceden oluşturur'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--language',
+            action='append',
+            default=[],
+            help='Sadece bu dil (birden fazla verilebilir, varsayılan: site aktif dilleri)',
+        )
+        parser.add_argument(
+            '--section',
+            action='append',
+            default=[],
+            help=f"Sadece bu bölüm ({', '.join(sections.HOME_SECTIONS)})",
+        )
+
+    def handle(self, *args, **options):
+        unknown = [name for name in options['section'] if name not in sections.HOME_SECTIONS]
+        if unknown:
+            raise CommandError(f"Bilinmeyen bölüm: {', '.join(unknown)}")
+
+        languages = options['language'] or sections.get_warm_languages()
+        names = options['section'] or list(sections.HOME_SECTIONS)
+
+        self.stdout.write(self.style.SUCCESS('🔥 Ana Sayfa Bölüm Warmup'))
+        self.stdout.write(f"🌐 Diller: {', '.join(languages)}")
+        self.stdout.write(f'🧩 Bölümler: {len(names)}')
+
+        started = time.perf_counter()
+        results = sections.warm(languages=languages, names=names)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        for language, count in results.items():
+            style = self.style.SUCCESS if count == len(names) else self.style.WARNING
+            self.stdout.write(style(f'   {language}: {count}/{len(names)} bölüm hazır'))
+        self.stdout.write(f'⏱️  {elapsed:.0f} ms')
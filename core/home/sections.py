@@ -0,0 +1,259 @@
+# home/sections.py
+"""
+Ana sayfa bölümleri için sürümlü fragment cache'i
+
+templates/home/sections/* her biri ayrı cache'lenir:
+
+    {% load home_sections %}
+    {% home_section 'products_preview' %}
+
+Anahtar: bölüm adı + aktif dil + bağımlı modellerin etiket sürümü
+(core.cachetags). Bölümün queryset'leri sadece fragment cache'te yoksa
+oluşturulur; ürün kaydedildiğinde sadece ürünlere bağlı bölümler yeniden
+render edilir. Yeniden hesaplama core.stampede ile tek worker'da yapılır.
+
+İçerik değişince (tags_invalidated) etkilenen bölümler tüm aktif diller için
+arka planda yeniden oluşturulur: warm() / `python manage.py warm_home_sections`.
+
+Bölüm template'leri isteğe özel değer (CSRF, nonce, kullanıcı) İÇERMEMELİ.
+"""
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache.backends.dummy import DummyCache
+from django.db import connections
+from django.dispatch import receiver
+from django.template.loader import get_template
+from django.utils import translation
+from django.utils.safestring import mark_safe
+
+from core import cachetags
+from core.singletons import get_about
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': True,
+    'TIMEOUT': 60 * 60,
+    'WARM_ON_CHANGE': True,  # İçerik değişince aktif diller için arka planda yeniden oluştur
+}
+
+# Site ayarları (telefon, WhatsApp, site adı) kullanan bölümler
+SITE_SETTINGS = 'core.sitesettings'
+
+
+def get_section_cache_settings():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'HOME_SECTION_CACHE', {}))
+    return config
+
+
+# ========================
+# Bölüm context'leri - sadece cache miss'te çağrılır
+# ========================
+
+def _company_info():
+    about = get_about()
+    if about is None:
+        return {}
+    return {
+        'years_experience': about.years_experience,
+        'completed_jobs': about.completed_jobs,
+        'happy_customers': about.happy_customers,
+        'total_services': about.total_services,
+        'customer_satisfaction': about.customer_satisfaction,
+    }
+
+
+def _carousel_context():
+    from .models import CarouselSlide
+    return {
+        'carousel_slides': CarouselSlide.objects.filter(is_active=True).order_by('order')[:5],
+        'company_info': _company_info(),
+    }
+
+
+def _about_context():
+    return {'about': get_about(), 'company_info': _company_info()}
+
+
+def _services_context():
+    from about.models import Service
+    return {'services': Service.objects.filter(is_active=True).order_by('order')[:6]}
+
+
+def _statistics_context():
+    return {'company_info': _company_info()}
+
+
+def _products_context():
+    from products.models import Product
+    return {
+        'featured_products': Product.objects.filter(
+            is_active=True, is_featured=True
+        ).select_related('category').order_by('-created_at')[:9],
+    }
+
+
+def _gallery_context():
+    from gallery.models import Gallery
+    # Featured galeri - hem resim hem video
+    return {
+        'latest_images': Gallery.objects.filter(
+            is_active=True, is_featured=True
+        ).order_by('order', '-created_at')[:10],
+    }
+
+
+def _reviews_context():
+    from reviews.models import Review
+    return {'approved_reviews': Review.objects.filter(is_approved=True).order_by('-created_at')[:10]}
+
+
+def _media_mentions_context():
+    from dashboard.models import MediaMention
+    return {'media_mentions': MediaMention.objects.filter(is_active=True).order_by('-publish_date')[:6]}
+
+
+def _empty_context():
+    return {}
+
+
+# Bölüm adı -> (template, bağımlılıklar, context fonksiyonu) - ana sayfa sırasıyla
+HOME_SECTIONS = {
+    'carousel': ('home/sections/carousel.html', ['home.carouselslide', 'about.about', SITE_SETTINGS], _carousel_context),
+    'about_preview': ('home/sections/about_preview.html', ['about.about', SITE_SETTINGS], _about_context),
+    'services_grid': ('home/sections/services_grid.html', ['about.service', SITE_SETTINGS], _services_context),
+    'statistics': ('home/sections/statistics.html', ['about.about'], _statistics_context),
+    'products_preview': ('home/sections/products_preview.html', ['products.product', 'products.category'], _products_context),
+    'gallery_preview': ('home/sections/gallery_preview.html', ['gallery.gallery'], _gallery_context),
+    'reviews': ('home/sections/reviews.html', ['reviews.review'], _reviews_context),
+    'media_mentions': ('home/sections/media_mentions.html', ['dashboard.mediamention'], _media_mentions_context),
+    'cta_section': ('home/sections/cta_section.html', [SITE_SETTINGS], _empty_context),
+}
+
+
+def section_tags():
+    return set().union(*(cachetags.to_tags(dependencies) for _, dependencies, _ in HOME_SECTIONS.values()))
+
+
+# ========================
+# Render
+# ========================
+
+def _render(name, context=None, request=None):
+    template_name, _, build_context = HOME_SECTIONS[name]
+    extra = build_context()
+    if context is None:
+        return get_template(template_name).render(extra, request)
+    # {% include %} gibi: dış context (context processor'lar dahil) + bölüm değerleri
+    template = context.template.engine.get_template(template_name)
+    with context.push(extra):
+        return template.render(context)
+
+
+def render_section(name, context=None, request=None):
+    """
+    Bölümü cache'ten döndür, yoksa render edip sakla
+
+    Args:
+        name: HOME_SECTIONS anahtarı
+        context: Template tag'den çağrılırken dış context
+        request: context yoksa (warmup) RequestContext için istek
+    """
+    config = get_section_cache_settings()
+    if not config['ENABLED']:
+        return mark_safe(_render(name, context, request))
+
+    _, dependencies, _ = HOME_SECTIONS[name]
+    language = translation.get_language() or settings.LANGUAGE_CODE
+    html = cachetags.get_or_set(
+        f'home_section:{name}', dependencies,
+        lambda: _render(name, context, request), config['TIMEOUT'],
+        parts=(language,),
+    )
+    return mark_safe(html)
+
+
+# ========================
+# Warmup
+# ========================
+
+def _warm_request(language):
+    from django.contrib.auth.models import AnonymousUser
+    from django.test import RequestFactory
+
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != '*' and not host.startswith('.')]
+    request = RequestFactory().get(f'/{language}/', HTTP_HOST=hosts[0] if hosts else 'localhost')
+    request.user = AnonymousUser()
+    request.LANGUAGE_CODE = language
+    return request
+
+
+def get_warm_languages():
+    from core.context_processors import get_site_enabled_languages
+
+    available = {code for code, _ in settings.LANGUAGES}
+    return [code for code in get_site_enabled_languages() if code in available] or [settings.LANGUAGE_CODE]
+
+
+def warm(languages=None, names=None):
+    """
+    Bölümleri verilen diller için önceden oluştur (cache'te olanlar atlanır)
+
+    Returns:
+        dict: dil -> render edilen/okunan bölüm sayısı
+    """
+    names = names or list(HOME_SECTIONS)
+    results = {}
+    for language in languages or get_warm_languages():
+        with translation.override(language):
+            request = _warm_request(language)
+            count = 0
+            for name in names:
+                try:
+                    render_section(name, request=request)
+                    count += 1
+                except Exception as e:
+                    logger.error(f"Ana sayfa bölümü oluşturulamadı ({name}, {language}): {e}")
+            results[language] = count
+    return results
+
+
+_warm_lock = threading.Lock()
+_warm_pending = threading.Event()
+
+
+def _warm_worker():
+    try:
+        while _warm_pending.is_set():
+            _warm_pending.clear()
+            warm()
+    except Exception as e:
+        logger.error(f"Ana sayfa warmup hatası: {e}")
+    finally:
+        connections.close_all()
+        _warm_lock.release()
+    if _warm_pending.is_set():
+        schedule_warmup()  # Son turdan sonra gelen değişiklik
+
+
+def schedule_warmup():
+    """Warmup'ı arka planda başlat - sürüyorsa bittiğinde bir kez daha çalıştırılır"""
+    _warm_pending.set()
+    if not _warm_lock.acquire(blocking=False):
+        return False
+    threading.Thread(target=_warm_worker, name='home-section-warmup', daemon=True).start()
+    return True
+
+
+@receiver(cachetags.tags_invalidated, dispatch_uid='home_sections_tags_invalidated')
+def _content_changed(sender, tags, **kwargs):
+    config = get_section_cache_settings()
+    if not config['ENABLED'] or not config['WARM_ON_CHANGE']:
+        return
+    if isinstance(cachetags.get_cache(), DummyCache):
+        return  # Geliştirme ortamı - saklanamayan fragment'ları render etmeye gerek yok
+    if section_tags().intersection(tags):
+        schedule_warmup()
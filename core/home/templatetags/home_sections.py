@@ -0,0 +1,15 @@
+# home/templatetags/home_sections.py
+from django import template
+
+from home.sections import render_section
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def home_section(context, name):
+    """
+    Ana sayfa bölümünü fragment cache'ten render et (home.sections)
+    Kullanım: {% home_section 'products_preview' %}
+    """
+    return render_section(name, context)
@@ -1,20 +1,21 @@
 # home/views.py - UPDATED VERSION
 from django.shortcuts import render
-from django.utils import translation
 from .models import CarouselSlide
-from about.models import About, Service, TeamMember
-from products.models import Product
-from gallery.models import Gallery
-from dashboard.models import MediaMention
-from reviews.models import Review
+from about.models import About
+from core import cachetags, conditional
+from core.singletons import get_about
+from .sections import HOME_SECTIONS
 
+# Ana sayfa bölümlerinin gösterdiği tüm içerik (home.sections)
+HOME_DEPENDENCIES = sorted({tag for _, dependencies, _ in HOME_SECTIONS.values() for tag in dependencies})
+
+@conditional.listing(CarouselSlide, dependencies=HOME_DEPENDENCIES)
 def home(request):
     """Ana sayfa view'ı - Featured Gallery düzeltmesi"""
     
-    # About bilgilerini çek veya varsayılan oluştur
-    try:
-        about = About.objects.get(pk=1)
-    except About.DoesNotExist:
+    # About bilgilerini çek (worker içi kopya) veya varsayılan oluştur
+    about = get_about()
+    if about is None:
         # Eğer About objesi yoksa varsayılan değerlerle oluştur
         about = About.objects.create(
             title='Hakkımızda',
@@ -29,41 +30,22 @@ def home(request):
             customer_satisfaction=100,
         )
     
-    # Context hazırla
+    # Bölüm queryset'leri home.sections'ta - sadece fragment cache'te yoksa çalışır
     context = {
-        # Ana carousel
-        'carousel_slides': CarouselSlide.objects.filter(is_active=True).order_by('order')[:5],
-        
         # ABOUT BİLGİLERİ
         'about': about,
-        'company_info': {
-            'years_experience': about.years_experience,
-            'completed_jobs': about.completed_jobs,
-            'happy_customers': about.happy_customers,
-            'total_services': about.total_services,
-            'customer_satisfaction': about.customer_satisfaction,
-        },
-        
-        # ✅ FEATURED GALERİ - HEM RESİM HEM VİDEO
-        'latest_images': Gallery.objects.filter(
-            is_active=True, 
-            is_featured=True
-        ).order_by('order', '-created_at')[:10],
-        
-        # Ürünler
-        'featured_products': Product.objects.filter(is_active=True, is_featured=True).order_by('-created_at')[:9],
-        
-        # Basın haberleri
-        'media_mentions': MediaMention.objects.filter(is_active=True).order_by('-publish_date')[:6],
         
-        # Yorumlar
-        'approved_reviews': Review.objects.filter(is_approved=True).order_by('-created_at')[:10],
-        
-        # Hizmetler
-        'services': Service.objects.filter(is_active=True).order_by('order')[:6],
-        
-        # Ekip
-        'team_members': TeamMember.objects.filter(is_active=True).order_by('order')[:6],
+        # Sosyal paylaşım görseli (ilk carousel slaytı)
+        'og_image_url': cachetags.get_or_set(
+            'home_og_image', [CarouselSlide], _first_slide_image_url, 60 * 60,
+        ),
     }
     
-    return render(request, 'home/index.html', context)
\ No newline at end of file
+    return render(request, 'home/index.html', context)
+
+
+def _first_slide_image_url():
+    slide = CarouselSlide.objects.filter(is_active=True).order_by('order').first()
+    if slide is None or not slide.image:
+        return ''
+    return slide.image.url
@@ -109,6 +109,14 @@ class Product(SEOImageMixin, models.Model):
         verbose_name = "Ürün"
         verbose_name_plural = "Ürünler"
         ordering = ['-created_at']
+        indexes = [
+            # Öne çıkan ürünler (ana sayfa, önerilen ürünler)
+            models.Index(fields=['is_active', 'is_featured', '-created_at'], name='products_act_feat_idx'),
+            # Kategori sayfası, ilgili ürünler, kategori ürün sayıları
+            models.Index(fields=['category', 'is_active', '-created_at'], name='products_cat_act_idx'),
+            # Ürün listesi (en yeniler) ve sayfalama COUNT'u - sadece aktif ürünler
+            models.Index(fields=['-created_at'], name='products_active_new_idx', condition=models.Q(is_active=True)),
+        ]
 
     def generate_sku(self):
         """Otomatik SKU oluştur: KAT-PRD-1234 formatında"""
@@ -1,9 +1,11 @@
 # products/views.py
 from django.shortcuts import render, get_object_or_404
 from django.core.paginator import Paginator
+from core import conditional, identity
 from django.db.models import Q, Count
 from .models import Product, Category
 
+@conditional.listing(Product, Category)
 def product_list(request):
     """Ana ürün listesi sayfası"""
     products = Product.objects.filter(is_active=True).select_related('category')
@@ -67,9 +69,17 @@ def product_list(request):
     
     return render(request, 'products/product_list.html', context)
 
+@conditional.detail(
+    Product.objects.select_related('category'),
+    lambda slug: {'slug': slug, 'is_active': True},
+    dependencies=[Product, Category],  # İlgili/önerilen ürünler
+)
 def product_detail(request, slug):
     """Ürün detay sayfası"""
-    product = get_object_or_404(Product, slug=slug, is_active=True)
+    # Ana nesne istek haritasına kaydedilir - context processor'lar tekrar sorgulamaz
+    product = identity.get_object_or_404(
+        request, Product.objects.select_related('category'), slug=slug, is_active=True
+    )
     
     # İlgili ürünler (aynı kategoriden)
     related_products = Product.objects.filter(
@@ -103,6 +113,7 @@ def product_detail(request, slug):
     
     return render(request, 'products/product_detail.html', context)
 
+@conditional.listing(Category, Product)
 def category_list(request):
     """Kategori listesi sayfası"""
     categories = Category.objects.filter(is_active=True).annotate(
@@ -117,9 +128,12 @@ def category_list(request):
     
     return render(request, 'products/category_list.html', context)
 
+@conditional.detail(
+    Category, lambda slug: {'slug': slug, 'is_active': True}, dependencies=[Product, Category],
+)
 def category_detail(request, slug):
     """Kategori detay sayfası"""
-    category = get_object_or_404(Category, slug=slug, is_active=True)
+    category = identity.get_object_or_404(request, Category, slug=slug, is_active=True)
     
     products = Product.objects.filter(
         category=category,
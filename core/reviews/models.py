@@ -27,6 +27,10 @@ class Review(models.Model):
         verbose_name = "Müşteri Yorumu"
         verbose_name_plural = "Müşteri Yorumları"
         ordering = ['-created_at']
+        indexes = [
+            # Onaylı yorumlar (site) / onay bekleyenler (dashboard)
+            models.Index(fields=['is_approved', '-created_at'], name='reviews_appr_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.rating} Yıldız"
\ No newline at end of file
@@ -1,7 +1,6 @@
 # reviews/signals.py
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.core.cache import cache
 from .models import Review
 import logging
 
@@ -54,12 +53,9 @@ def update_statistics_on_review(sender, instance, created, **kwargs):
             # 5 üzerinden ortalamayı 100 üzerinden puana çeviriyoruz
             about.customer_satisfaction = int((avg_rating / 5) * 100)
 
+            # save() about cache etiketlerini de yeniler (core.cachetags)
             about.save()
 
-            # Cache'i temizle
-            cache.delete('about_info')
-            cache.delete('site_settings')
-
             logger.info(
                 f"İstatistikler güncellendi: "
                 f"Tamamlanan İş={about.completed_jobs}, "
@@ -106,10 +102,6 @@ def update_statistics_on_review_delete(sender, instance, **kwargs):
 
         about.save()
 
-        # Cache'i temizle
-        cache.delete('about_info')
-        cache.delete('site_settings')
-
         logger.info("Yorum silindi, istatistikler güncellendi")
 
     except Exception as e:
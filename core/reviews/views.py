@@ -3,20 +3,12 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.paginator import Paginator
 from django.db.models import Avg
-from django_ratelimit.decorators import ratelimit
+from core.client_ip import get_client_ip
+from core.ratelimit import ratelimit
 from django.utils.translation import gettext as _
 from .models import Review
 from .forms import ReviewForm
 
-def get_client_ip(request):
-    """Kullanıcının IP adresini al"""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
-
 @ratelimit(key='ip', rate='5/h', method='POST', block=True)  # ← IP bazlı limit
 def add_review(request):
     if request.method == 'POST':
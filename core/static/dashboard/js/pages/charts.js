@@ -303,15 +303,19 @@ class ChartManager {
         });
     }
     
-    updateChartForPeriod(chartId, period) {
+    async updateChartForPeriod(chartId, period) {
         console.log(`Grafik güncelleniyor: ${chartId}, Period: ${period}`);
         
-        // Şimdilik sadece console log, ileride API call olacak
-        const chart = this.charts.get(chartId);
-        if (chart) {
-            // Mock data - ileride gerçek API'den veri gelecek
-            chart.update('none');
+        if (!this.charts.get(chartId)) return;
+        
+        try {
+            // Günlük özet tablodan (chart_data_api ?period=)
+            const data = await this.fetchChartData(chartId, period);
+            this.updateChart(chartId, data);
             this.showNotification(`Grafik ${period} güne güncellendi.`, 'success');
+        } catch (error) {
+            console.error('Chart period error:', error);
+            this.showNotification('Grafik verisi alınamadı.', 'error');
         }
     }
 